@@ -12,6 +12,18 @@ def pytest_addoption(parser):
             "When --only-signal-tests is specified, all other tests are skipped."
         ),
     )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="run benchmarks and compare them with the stored baselines.",
+    )
+    parser.addoption(
+        "--benchmark-save",
+        action="store_true",
+        default=False,
+        help="run benchmarks and store the results as the new baselines.",
+    )
 
 
 def pytest_configure(config):
@@ -19,6 +31,10 @@ def pytest_configure(config):
         "markers",
         "isolate_signal_test: mark test as a signal test that requires isolation",
     )
+    config.addinivalue_line(
+        "markers",
+        "benchmark: mark test as a benchmark which only runs with --benchmark",
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -32,3 +48,9 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if "isolate_signal_test" in item.keywords:
                 item.add_marker(skip_signal_tests)
+
+    if not (config.getoption("--benchmark") or config.getoption("--benchmark-save")):
+        skip_benchmarks = pytest.mark.skip(reason="need --benchmark option to run")
+        for item in items:
+            if item.get_closest_marker("benchmark"):
+                item.add_marker(skip_benchmarks)
@@ -0,0 +1,260 @@
+"""Measure how quickly opsdroid parses and responds to messages.
+
+A synthetic set of skills is registered with an in-memory connector, and
+messages are replayed through `opsdroid.core.OpsDroid.parse` as if they had
+been received from a chat service. The time from a message being received to
+the connector being asked to send the response is recorded for every message.
+
+"""
+
+import asyncio
+import dataclasses
+import json
+import math
+import sys
+import time
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+from opsdroid.connector import Connector, register_event
+from opsdroid.events import Message
+from opsdroid.matchers import match_always, match_event, match_parse, match_regex
+
+DEFAULT_MESSAGES = 1000
+DEFAULT_SKILLS = 100
+DEFAULT_TOLERANCE = 0.2
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    """The results of a benchmark run.
+
+    Latencies are in milliseconds, throughput is in messages per second and
+    the peak resident set size of the process is in megabytes.
+
+    """
+
+    messages: int
+    skills: int
+    duration: float
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+    peak_rss: Optional[float] = None
+
+    def as_dict(self):
+        """Return the results as a dictionary."""
+        return dataclasses.asdict(self)
+
+
+class BenchmarkConnector(Connector):
+    """A connector which receives and sends messages in memory.
+
+    Args:
+        config (dict): The config for the connector.
+        opsdroid (OpsDroid): An instance of opsdroid.core.
+
+    """
+
+    def __init__(self, config, opsdroid=None):
+        """Create the connector."""
+        super().__init__(config, opsdroid=opsdroid)
+        self.name = "benchmark"
+        self.default_target = "benchmark"
+        self.received = {}
+        self.latencies = []
+        self.expected = 0
+        self.finished = None
+
+    def reset(self, expected):
+        """Forget previous results and wait for ``expected`` responses."""
+        self.received = {}
+        self.latencies = []
+        self.expected = expected
+        self.finished = asyncio.Event()
+
+    async def connect(self):
+        """Do nothing, there is nothing to connect to."""
+
+    async def listen(self):
+        """Do nothing, messages are received with `BenchmarkConnector.receive`."""
+
+    async def receive(self, text, user="user"):
+        """Parse a message as if it had been received from a chat service."""
+        message = Message(text, user=user, target=self.default_target, connector=self)
+        self.received[id(message)] = (message, time.perf_counter())
+        await self.opsdroid.parse(message)
+
+    @register_event(Message)
+    async def send_message(self, message):
+        """Record how long it took to respond to the message this replies to."""
+        received = self.received.pop(id(message.linked_event), None)
+        if received is None:
+            return
+        self.latencies.append(time.perf_counter() - received[1])
+        if len(self.latencies) >= self.expected:
+            self.finished.set()
+
+
+def _make_skill(name, matcher, respond):
+    async def skill(opsdroid, config, message):
+        if respond:
+            await message.respond(Message("ok"))
+
+    skill.config = {"name": name}
+    return matcher(skill)
+
+
+def make_skills(count):
+    """Generate skills to benchmark with.
+
+    Args:
+        count (int): The number of regex, parse format and event type skills
+            to generate. One always skill is generated for every ten of these.
+
+    Returns:
+        list: The skills. Every message from `make_messages` matches exactly
+            one of the regex or parse format skills, which responds to it.
+
+    """
+    skills = []
+    for i in range(count):
+        skills.append(
+            _make_skill(f"regex{i}", match_regex(rf"^regex {i} (?P<word>\w+)$"), True)
+        )
+        skills.append(
+            _make_skill(f"format{i}", match_parse(f"format {i} {{word}}"), True)
+        )
+        skills.append(
+            _make_skill(f"event{i}", match_event(Message, value=f"event{i}"), False)
+        )
+    for i in range(max(count // 10, 1)):
+        skills.append(_make_skill(f"always{i}", match_always, False))
+    return skills
+
+
+def make_messages(count, skills):
+    """Generate messages which alternate between regex and parse format skills."""
+    kinds = ("regex", "format")
+    return [f"{kinds[i % 2]} {(i // 2) % skills} hello" for i in range(count)]
+
+
+def percentile(values, percent):
+    """Return a percentile of some values using the nearest rank method."""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def peak_rss():
+    """Return the peak resident set size of this process in megabytes."""
+    if resource is None:  # pragma: no cover
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return rss / scale
+
+
+async def run_benchmark(
+    opsdroid, messages=DEFAULT_MESSAGES, rate=None, skills=DEFAULT_SKILLS, timeout=60
+):
+    """Replay messages through opsdroid and measure how quickly it responds.
+
+    Args:
+        opsdroid (OpsDroid): The opsdroid instance to benchmark. Skills and a
+            `BenchmarkConnector` are added to it.
+        messages (int): The number of messages to replay.
+        rate (float, optional): The number of messages to send per second.
+            Defaults to sending them all at once.
+        skills (int): The number of skills of each type, see `make_skills`.
+        timeout (float): How long to wait for all the responses in seconds.
+
+    Returns:
+        BenchmarkResult: The results of the run.
+
+    """
+    for skill in make_skills(skills):
+        opsdroid.register_skill(skill)
+    connector = BenchmarkConnector({}, opsdroid=opsdroid)
+    opsdroid.connectors.append(connector)
+    opsdroid.dispatcher.start()
+
+    texts = make_messages(messages, skills)
+    connector.reset(len(texts))
+    start = time.perf_counter()
+    try:
+        tasks = []
+        for i, text in enumerate(texts):
+            if rate:
+                delay = start + i / rate - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(connector.receive(text)))
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+        await asyncio.wait_for(connector.finished.wait(), timeout)
+    finally:
+        await opsdroid.dispatcher.stop()
+    duration = time.perf_counter() - start
+
+    latencies = [latency * 1000 for latency in connector.latencies]
+    return BenchmarkResult(
+        messages=len(texts),
+        skills=len(opsdroid.skills),
+        duration=duration,
+        throughput=len(latencies) / duration,
+        p50=percentile(latencies, 50),
+        p95=percentile(latencies, 95),
+        p99=percentile(latencies, 99),
+        peak_rss=peak_rss(),
+    )
+
+
+def compare_to_baseline(result, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Compare a result with a baseline.
+
+    Args:
+        result (BenchmarkResult): The result to check.
+        baseline (dict): A result saved with `save_baseline`.
+        tolerance (float): How much worse than the baseline a value can be
+            as a fraction, e.g. ``0.2`` allows 20% lower throughput.
+
+    Returns:
+        list: A description of every value which regressed, empty if none did.
+
+    """
+    regressions = []
+    if result.throughput < baseline["throughput"] * (1 - tolerance):
+        regressions.append(
+            "throughput {:.1f}/s is below the baseline of {:.1f}/s".format(
+                result.throughput, baseline["throughput"]
+            )
+        )
+    for key in ("p50", "p95", "p99"):
+        if getattr(result, key) > baseline[key] * (1 + tolerance):
+            regressions.append(
+                "{} latency {:.3f}ms is above the baseline of {:.3f}ms".format(
+                    key, getattr(result, key), baseline[key]
+                )
+            )
+    return regressions
+
+
+def load_baseline(path):
+    """Load a baseline saved with `save_baseline`."""
+    with open(path, encoding="utf-8") as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(result, path):
+    """Save a result to compare later runs with."""
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump(result.as_dict(), baseline_file, indent=2)
+        baseline_file.write("\n")
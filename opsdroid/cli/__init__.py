@@ -2,6 +2,7 @@
 
 import click
 
+from opsdroid.cli.bench import bench
 from opsdroid.cli.config import config
 from opsdroid.cli.logs import logs
 from opsdroid.cli.start import start
@@ -18,6 +19,7 @@ def cli(ctx):
     """
 
 
+cli.add_command(bench)
 cli.add_command(config)
 cli.add_command(logs)
 cli.add_command(start)
@@ -0,0 +1,104 @@
+"""The bench subcommand for opsdroid cli."""
+
+import json
+
+import click
+
+from opsdroid import benchmark
+from opsdroid.cli.utils import configure_lang
+from opsdroid.core import OpsDroid
+
+
+@click.command()
+@click.option(
+    "--messages",
+    "-n",
+    default=benchmark.DEFAULT_MESSAGES,
+    show_default=True,
+    help="Number of messages to replay.",
+)
+@click.option(
+    "--rate",
+    "-r",
+    type=float,
+    default=None,
+    help="Messages to send per second. Sends all messages at once if not set.",
+)
+@click.option(
+    "--skills",
+    "-s",
+    default=benchmark.DEFAULT_SKILLS,
+    show_default=True,
+    help="Number of regex, parse format and event type skills to generate.",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Parse messages with the dispatch queue and this many workers.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare the results with a baseline and exit with 1 if they regressed.",
+)
+@click.option(
+    "--save-baseline",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Save the results as a baseline for later runs.",
+)
+@click.option(
+    "--tolerance",
+    default=benchmark.DEFAULT_TOLERANCE,
+    show_default=True,
+    help="How much worse than the baseline results can be, as a fraction.",
+)
+@click.option("--json", "as_json", is_flag=True, help="Print the results as JSON.")
+@click.pass_context
+def bench(
+    ctx, messages, rate, skills, workers, baseline, save_baseline, tolerance, as_json
+):
+    """Benchmark how quickly opsdroid parses and responds to messages.
+
+    Opsdroid is started with an in-memory connector and generated regex,
+    parse format, event type and always skills. Messages are replayed
+    through it and the throughput, latency percentiles from receiving a
+    message to sending the response and peak memory use are reported.
+
+    """
+    configure_lang({})
+    config = {"dispatch": {"workers": workers}} if workers else {}
+
+    with OpsDroid(config=config) as opsdroid:
+        result = opsdroid.eventloop.run_until_complete(
+            benchmark.run_benchmark(opsdroid, messages, rate=rate, skills=skills)
+        )
+
+    if as_json:
+        click.echo(json.dumps(result.as_dict(), indent=2))
+    else:
+        click.echo(
+            "{} messages through {} skills in {:.2f}s".format(
+                result.messages, result.skills, result.duration
+            )
+        )
+        click.echo("throughput  {:10.1f} messages/s".format(result.throughput))
+        click.echo("p50         {:10.3f} ms".format(result.p50))
+        click.echo("p95         {:10.3f} ms".format(result.p95))
+        click.echo("p99         {:10.3f} ms".format(result.p99))
+        if result.peak_rss is not None:
+            click.echo("peak rss    {:10.1f} MB".format(result.peak_rss))
+
+    if save_baseline:
+        benchmark.save_baseline(result, save_baseline)
+
+    if baseline:
+        regressions = benchmark.compare_to_baseline(
+            result, benchmark.load_baseline(baseline), tolerance
+        )
+        for regression in regressions:
+            click.echo("Regression: {}".format(regression), err=True)
+        if regressions:
+            ctx.exit(1)
+    ctx.exit(0)
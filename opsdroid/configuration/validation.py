@@ -23,12 +23,64 @@ web = Any(
     },
 )
 
+dispatch = Any(
+    None,
+    {
+        Optional("workers"): int,
+        Optional("queue-size"): int,
+        Optional("overflow"): Any("block", "drop"),
+        Optional("ordered"): bool,
+        Optional("order-by-user"): bool,
+    },
+)
+
+tracing = Any(
+    None,
+    {
+        Optional("enabled"): bool,
+        Optional("buffer-size"): int,
+        Optional("path"): str,
+        Optional("opentelemetry"): bool,
+    },
+)
+
+memory = Any(
+    None,
+    {
+        Optional("write-policy"): Any("all", "primary", "fire-and-forget"),
+        Optional("cache"): Any(
+            None,
+            {
+                Optional("enabled"): bool,
+                Optional("size"): int,
+                Optional("ttl"): Any(None, int, float),
+                Optional("exclude"): [str],
+            },
+        ),
+    },
+)
+
+http = Any(
+    None,
+    {
+        Optional("limit"): int,
+        Optional("limit-per-host"): int,
+        Optional("dns-cache-ttl"): int,
+        Optional("keepalive-timeout"): int,
+    },
+)
+
 BASE_SCHEMA = {
     "logging": logging,
     "module-path": str,
     "welcome-message": bool,
     "autoreload": bool,
     "web": web,
+    "dispatch": dispatch,
+    "skill-timeout": Any(None, int, float),
+    "tracing": tracing,
+    "memory": memory,
+    "http": http,
 }
 
 
@@ -8,6 +8,7 @@ from voluptuous import Required
 
 from opsdroid.connector import Connector, register_event
 from opsdroid.events import Message
+from opsdroid.sessions import client_session
 
 _LOGGER = logging.getLogger(__name__)
 _FACEBOOK_SEND_URL = "https://graph.facebook.com/v16.0/me/messages" "?access_token={}"
@@ -117,11 +118,13 @@ class ConnectorFacebook(Connector):
             "recipient": {"id": message.target},
             "message": {"text": message.text},
         }
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            resp = await session.post(url, data=json.dumps(payload), headers=headers)
-            if resp.status < 300:
-                _LOGGER.info(_("Responded with: %s."), message.text)
-            else:
-                _LOGGER.debug(resp.status)
-                _LOGGER.debug(await resp.text())
-                _LOGGER.error(_("Unable to respond to Facebook."))
+        async with client_session(self.opsdroid) as session:
+            async with session.post(
+                url, data=json.dumps(payload), headers=headers
+            ) as resp:
+                if resp.status < 300:
+                    _LOGGER.info(_("Responded with: %s."), message.text)
+                else:
+                    _LOGGER.debug(resp.status)
+                    _LOGGER.debug(await resp.text())
+                    _LOGGER.error(_("Unable to respond to Facebook."))
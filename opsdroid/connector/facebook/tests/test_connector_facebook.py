@@ -1,7 +1,6 @@
 import pytest
 import asynctest.mock as amock
 
-import asyncio
 
 from opsdroid.connector.facebook import ConnectorFacebook
 from opsdroid.events import Message
@@ -127,17 +126,14 @@ async def test_respond(opsdroid):
     post_response = amock.Mock()
     post_response.status = 200
 
-    with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
-    ) as patched_request:
+    with amock.patch("aiohttp.ClientSession.post") as patched_request:
         assert opsdroid.__class__.instances
         connector = ConnectorFacebook({}, opsdroid=opsdroid)
         room = "a146f52c-548a-11e8-a7d1-28cfe949e12d"
         test_message = Message(
             text="Hello world", user="Alice", target=room, connector=connector
         )
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(post_response)
+        patched_request.return_value.__aenter__.return_value = post_response
         await test_message.respond("Response")
         assert patched_request.called
 
@@ -150,17 +146,14 @@ async def test_respond_bad_response(opsdroid):
     post_response.text = amock.CoroutineMock()
     post_response.text.return_value = "Error"
 
-    with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
-    ) as patched_request:
+    with amock.patch("aiohttp.ClientSession.post") as patched_request:
         assert opsdroid.__class__.instances
         connector = ConnectorFacebook({}, opsdroid=opsdroid)
         room = "a146f52c-548a-11e8-a7d1-28cfe949e12d"
         test_message = Message(
             text="Hello world", user="Alice", target=room, connector=connector
         )
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(post_response)
+        patched_request.return_value.__aenter__.return_value = post_response
         await test_message.respond("Response")
         assert patched_request.called
         assert post_response.text.called
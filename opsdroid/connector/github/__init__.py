@@ -9,6 +9,7 @@ import time
 import aiohttp
 from opsdroid.connector import Connector, register_event
 from opsdroid.events import Message
+from opsdroid.sessions import client_session
 
 from . import events as github_events
 
@@ -64,11 +65,9 @@ class ConnectorGitHub(Connector):
             )
             headers = {"Authorization": f"Bearer {installation_access_token}"}
 
-            async with aiohttp.ClientSession(
-                trust_env=True, headers=headers
-            ) as session:
+            async with client_session(self.opsdroid) as session:
                 url = f"{self.github_api_url}/app/installations"
-                response = await session.get(url)
+                response = await session.get(url, headers=headers)
                 if response.status >= 300:
                     response_text = await response.text()
                     _LOGGER.error(_("Error connecting to GitHub: %s."), response_text)
@@ -77,11 +76,9 @@ class ConnectorGitHub(Connector):
                 installations = await response.json()
                 installation_id = installations[0]["id"]
 
-            async with aiohttp.ClientSession(
-                trust_env=True, headers=headers
-            ) as session:
+            async with client_session(self.opsdroid) as session:
                 url = f"{self.github_api_url}/app/installations/{installation_id}/access_tokens"
-                response = await session.post(url)
+                response = await session.post(url, headers=headers)
                 if response.status >= 300:
                     response_text = await response.text()
                     _LOGGER.error(_("Error connecting to GitHub: %s."), response_text)
@@ -91,11 +88,9 @@ class ConnectorGitHub(Connector):
                 self.github_token = access_token["token"]
         else:
             headers = {"Authorization": f"token {self.github_token}"}
-            async with aiohttp.ClientSession(
-                trust_env=True, headers=headers
-            ) as session:
+            async with client_session(self.opsdroid) as session:
                 url = f"{self.github_api_url}/user"
-                response = await session.get(url)
+                response = await session.get(url, headers=headers)
                 if response.status >= 300:
                     response_text = await response.text()
                     _LOGGER.error(_("Error connecting to GitHub: %s."), response_text)
@@ -409,10 +404,12 @@ class ConnectorGitHub(Connector):
         repo, issue = message.target.split("#")
         url = f"{self.github_api_url}/repos/{repo}/issues/{issue}/comments"
         headers = {"Authorization": f" token {self.github_token}"}
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            resp = await session.post(url, json={"body": message.text}, headers=headers)
-            if resp.status == 201:
-                _LOGGER.info(_("Message sent."))
-                return True
-            _LOGGER.error(await resp.json())
-            return False
+        async with client_session(self.opsdroid) as session:
+            async with session.post(
+                url, json={"body": message.text}, headers=headers
+            ) as resp:
+                if resp.status == 201:
+                    _LOGGER.info(_("Message sent."))
+                    return True
+                _LOGGER.error(await resp.json())
+                return False
@@ -4,7 +4,6 @@ import json
 import logging
 from typing import Optional
 
-import aiohttp
 from aiohttp.web_request import Request
 from aiohttp.web_response import Response
 from opsdroid.connector import Connector, register_event
@@ -25,6 +24,7 @@ from opsdroid.connector.gitlab.events import (
 from opsdroid.const import GITLAB_API_ENDPOINT
 from opsdroid.core import OpsDroid
 from opsdroid.events import Event, Message
+from opsdroid.sessions import client_session
 
 
 @dataclasses.dataclass
@@ -366,23 +366,23 @@ class ConnectorGitlab(Connector):
         else:
             _LOGGER.debug(_("Responding via Gitlab"))
             headers = {"PRIVATE-TOKEN": self.token, "Content-Type": "application/json"}
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                resp = await session.post(
+            async with client_session(self.opsdroid) as session:
+                async with session.post(
                     f"{message.target}/notes",
                     params={"body": message.text},
                     headers=headers,
-                )
-                if resp.status == 201:
-                    _LOGGER.info(
-                        _(
-                            f"Message '{message.text}' sent to GitLab to '{message.target}'."
+                ) as resp:
+                    if resp.status == 201:
+                        _LOGGER.info(
+                            _(
+                                f"Message '{message.text}' sent to GitLab to '{message.target}'."
+                            )
                         )
-                    )
-                    return True
-                else:
-                    _LOGGER.error(
-                        _(
-                            f"Unable to send '{message.text}' to GitLab. Received status code: {resp.status}"
+                        return True
+                    else:
+                        _LOGGER.error(
+                            _(
+                                f"Unable to send '{message.text}' to GitLab. Received status code: {resp.status}"
+                            )
                         )
-                    )
         return False
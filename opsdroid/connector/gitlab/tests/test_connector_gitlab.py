@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from pathlib import Path
 
@@ -644,11 +643,8 @@ async def test_send_message(opsdroid, caplog):
     response = amock.Mock()
     response.status = 201
 
-    with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
-    ) as patched_request:
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
+    with amock.patch("aiohttp.ClientSession.post") as patched_request:
+        patched_request.return_value.__aenter__.return_value = response
 
         assert opsdroid.__class__.instances
 
@@ -659,9 +655,6 @@ async def test_send_message(opsdroid, caplog):
             connector=connector,
         )
 
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
-
         result = await connector.send(test_message)
 
         assert patched_request.called
@@ -682,11 +675,8 @@ async def test_send_message_bad_status(opsdroid, caplog):
     response = amock.Mock()
     response.status = 422
 
-    with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
-    ) as patched_request:
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
+    with amock.patch("aiohttp.ClientSession.post") as patched_request:
+        patched_request.return_value.__aenter__.return_value = response
 
         assert opsdroid.__class__.instances
 
@@ -697,9 +687,6 @@ async def test_send_message_bad_status(opsdroid, caplog):
             connector=connector,
         )
 
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
-
         result = await connector.send(test_message)
 
         assert patched_request.called
@@ -719,11 +706,8 @@ async def test_send_message_no_token(opsdroid, caplog):
 
     response = amock.Mock()
 
-    with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
-    ) as patched_request:
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
+    with amock.patch("aiohttp.ClientSession.post") as patched_request:
+        patched_request.return_value.__aenter__.return_value = response
 
         assert opsdroid.__class__.instances
 
@@ -734,9 +718,6 @@ async def test_send_message_no_token(opsdroid, caplog):
             connector=connector,
         )
 
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
-
         result = await connector.send(test_message)
 
         assert not patched_request.called
@@ -259,6 +259,7 @@ class ConnectorMatrix(Connector):
             return
 
         self.connection.sync_token = response.next_batch
+        self._update_database_state(response)
 
         await self.exchange_keys(initial_sync=True)
 
@@ -281,10 +282,34 @@ class ConnectorMatrix(Connector):
 
     async def disconnect(self):
         """Close the matrix session."""
+        database = self._get_database()
+        if database is not None:
+            await database.flush()
         await self.connection.close()
 
+    def _get_database(self):
+        """Get the matrix database, if it is configured."""
+        if self.opsdroid is None:
+            return None
+        return self.opsdroid.get_database("matrix")
+
+    def _update_database_state(self, response):
+        """Pass the state events in a sync response to the matrix database."""
+        database = self._get_database()
+        if database is None:
+            return
+        for roomid, roomInfo in response.rooms.join.items():
+            events = list(roomInfo.state)
+            if roomInfo.timeline:
+                events.extend(roomInfo.timeline.events)
+            for event in events:
+                source = getattr(event, "source", None)
+                if isinstance(source, dict) and "state_key" in source:
+                    database.update_state(roomid, source)
+
     async def _parse_sync_response(self, response):
         self.connection.sync_token = response.next_batch
+        self._update_database_state(response)
 
         # Emit Invite events for every room in the invite list.
         for roomid, roomInfo in response.rooms.invite.items():
@@ -2,7 +2,11 @@ import pytest
 
 from nio.responses import SyncResponse
 
-from opsdroid.connector.matrix.tests.conftest import message_factory, sync_response
+from opsdroid.connector.matrix.tests.conftest import (
+    event_factory,
+    message_factory,
+    sync_response,
+)
 
 
 async def events_from_sync(events, connector):
@@ -131,3 +135,29 @@ async def test_invite_with_message(opsdroid, connector_connected, mock_api, capl
         user="test",
         target="!12345:localhost",
     )
+
+
+@pytest.mark.matrix_connector_config(
+    {"access_token": "hello", "rooms": {"main": "#test:localhost"}}
+)
+@pytest.mark.anyio
+async def test_sync_updates_database(opsdroid, connector, mocker):
+    database = mocker.Mock()
+    database.name = "matrix"
+    opsdroid.memory.databases = [database]
+    state_event = {
+        **event_factory("dev.opsdroid.database", {"hello": "world"}, "@test:localhost"),
+        "state_key": "",
+    }
+
+    response = SyncResponse.from_dict(
+        sync_response(
+            [state_event, message_factory("Hello", "m.text", "@opsdroid:localhost")]
+        )
+    )
+    connector._update_database_state(response)
+
+    database.update_state.assert_called_once()
+    room_id, source = database.update_state.call_args.args
+    assert room_id == "!12345:localhost"
+    assert source["content"] == {"hello": "world"}
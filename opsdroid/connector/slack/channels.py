@@ -0,0 +1,148 @@
+"""A directory of Slack channels for the Slack connector."""
+
+import collections.abc
+
+
+class SlackChannelDirectory:
+    """Keep the info of Slack channels, indexed by id and by name.
+
+    The directory is filled by the connector paging through
+    ``conversations.list`` and is kept up to date between refreshes by
+    channel events, so channels can be found by id or name without calling
+    the Slack API.
+
+    Attributes:
+        channels (dict): The info of each channel, by id.
+        ids (dict): The id of each channel, by name.
+
+    """
+
+    def __init__(self):
+        """Create an empty directory."""
+        self.channels = {}
+        self.ids = {}
+
+    def __len__(self):
+        """Return the number of known channels."""
+        return len(self.channels)
+
+    def by_name(self):
+        """Return the info of every channel, by name."""
+        return {name: self.channels[key] for name, key in self.ids.items()}
+
+    def mapping(self):
+        """Return a mapping of the channels by name, which writes through."""
+        return SlackChannelMapping(self)
+
+    def get(self, channel):
+        """Return the info of a channel from its id or name.
+
+        Args:
+            channel (string): The id of the channel, or its name with or
+                without a leading ``#``.
+
+        Returns:
+            dict or None: The channel info, or None if it isn't known.
+
+        """
+        if not channel:
+            return None
+        info = self.channels.get(channel)
+        if info is None:
+            key = self.ids.get(channel[1:] if channel.startswith("#") else channel)
+            info = self.channels.get(key)
+        return info
+
+    def resolve(self, target):
+        """Return the id of a channel from its id or name.
+
+        Targets which aren't known channels, such as user ids for direct
+        messages, are returned unchanged.
+
+        """
+        info = self.get(target) if isinstance(target, str) else None
+        return info["id"] if info is not None and "id" in info else target
+
+    def replace(self, channels):
+        """Replace every channel with the given channel infos.
+
+        Args:
+            channels (iterable): The info of each channel.
+
+        """
+        directory = SlackChannelDirectory()
+        for info in channels:
+            directory.update(info)
+        self.channels, self.ids = directory.channels, directory.ids
+
+    def update(self, info):
+        """Add a channel, or update the info of a known one.
+
+        Args:
+            info (dict): The channel info, with at least its ``id``. A channel
+                which changed name is indexed by its new name.
+
+        """
+        key = info.get("id", info.get("name"))
+        old = self.channels.get(key)
+        if old is not None:
+            if info.get("name", old.get("name")) != old.get("name"):
+                self.ids.pop(old.get("name"), None)
+            info = {**old, **info}
+        self.channels[key] = info
+        if info.get("name") is not None:
+            self.ids[info["name"]] = key
+
+    def remove(self, key):
+        """Forget a known channel."""
+        info = self.channels.pop(key, None)
+        if info is not None:
+            self.ids.pop(info.get("name"), None)
+
+    def archive(self, key, archived=True):
+        """Mark a known channel as archived, or no longer archived."""
+        info = self.channels.get(key)
+        if info is not None:
+            info["is_archived"] = archived
+
+
+class SlackChannelMapping(collections.abc.MutableMapping):
+    """A dict like view of the channels in a directory, by name.
+
+    Setting a name adds or updates the channel in the directory and deleting
+    a name forgets the channel.
+
+    Args:
+        directory (SlackChannelDirectory): The directory to view.
+
+    """
+
+    def __init__(self, directory):
+        """Create a view of a directory."""
+        self.directory = directory
+
+    def __getitem__(self, name):
+        """Return the info of a channel by name."""
+        key = self.directory.ids.get(name)
+        if key is None:
+            raise KeyError(name)
+        return self.directory.channels[key]
+
+    def __setitem__(self, name, info):
+        """Add a channel, or update the info of a known one."""
+        self.directory.update({**info, "name": name})
+
+    def __delitem__(self, name):
+        """Forget a channel by name."""
+        key = self.directory.ids.get(name)
+        if key is None:
+            raise KeyError(name)
+        self.directory.remove(key)
+
+    def __iter__(self):
+        """Iterate over the names of the channels."""
+        return iter(list(self.directory.ids))
+
+    def __len__(self):
+        """Return the number of channels with a name."""
+        return len(self.directory.ids)
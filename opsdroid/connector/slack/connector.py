@@ -1,6 +1,7 @@
 """A connector for Slack."""
 
 import asyncio
+import collections
 import json
 import logging
 import os
@@ -10,11 +11,11 @@ import time
 import urllib.parse
 
 import aiohttp
-import arrow
 import certifi
 import opsdroid.events
 from emoji import demojize
 from opsdroid.connector import Connector, register_event
+from opsdroid.connector.slack.channels import SlackChannelDirectory
 from opsdroid.connector.slack.create_events import SlackEventCreator
 from opsdroid.connector.slack.events import (
     Blocks,
@@ -23,6 +24,17 @@ from opsdroid.connector.slack.events import (
     ModalPush,
     ModalUpdate,
 )
+from opsdroid.connector.slack.ratelimit import (
+    DEFAULT_RATE_LIMIT_RETRIES,
+    DEFAULT_SEND_QUEUE_SIZE,
+    SlackRateLimiter,
+)
+from opsdroid.connector.slack.users import (
+    DEFAULT_USER_CACHE_SIZE,
+    DEFAULT_USER_CACHE_TTL,
+    SlackUserDirectory,
+)
+from opsdroid.dispatcher import KeyedSerializer
 from slack_sdk.errors import SlackApiError
 from slack_sdk.socket_mode.aiohttp import SocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
@@ -48,11 +60,31 @@ CONFIG_SCHEMA = {
     "start-thread": bool,
     "refresh-interval": int,
     "channel-limit": int,
+    "event-workers": int,
+    "event-dedup-size": int,
+    "user-cache-size": int,
+    "user-cache-ttl": int,
+    "prefetch-users": bool,
+    "rate-limit": bool,
+    "send-queue-size": int,
+    "rate-limit-retries": int,
 }
+DEFAULT_EVENT_WORKERS = 10
+DEFAULT_EVENT_DEDUP_SIZE = 1000
 
 
 class ConnectorSlack(Connector):
-    """A connector for Slack."""
+    """A connector for Slack.
+
+    Events received from the events API are acknowledged straight away and
+    put on a queue, which is drained by ``event-workers`` worker tasks.
+    Events in the same channel are handled in the order they were received,
+    events in different channels are handled concurrently. Slack resends
+    events which weren't acknowledged quickly enough, so the ids of the last
+    ``event-dedup-size`` events are remembered and events which have already
+    been received are dropped.
+
+    """
 
     def __init__(self, config, opsdroid=None):
         """Create the connector."""
@@ -68,6 +100,8 @@ class ConnectorSlack(Connector):
         self.app_token = config.get("app-token")
         self.channel_limit = config.get("channel-limit", 100)
         self.refresh_interval = config.get("refresh-interval", 600)
+        self.event_workers = config.get("event-workers", DEFAULT_EVENT_WORKERS)
+        self.event_dedup_size = config.get("event-dedup-size", DEFAULT_EVENT_DEDUP_SIZE)
         self.ssl_context = ssl.create_default_context(cafile=certifi.where())
         self.slack_web_client = AsyncWebClient(
             token=self.bot_token,
@@ -82,21 +116,126 @@ class ConnectorSlack(Connector):
         self.auth_info = None
         self.user_info = None
         self.bot_id = None
-        self.known_users = {}
-        self.known_bots = {}
-        self.known_channels = {}
+        self.prefetch_users = config.get("prefetch-users", False)
+        self.rate_limit = config.get("rate-limit", True)
+        self.rate_limiter = SlackRateLimiter(
+            self,
+            queue_size=config.get("send-queue-size", DEFAULT_SEND_QUEUE_SIZE),
+            retries=config.get("rate-limit-retries", DEFAULT_RATE_LIMIT_RETRIES),
+        )
+        self.user_directory = SlackUserDirectory(
+            self,
+            size=config.get("user-cache-size", DEFAULT_USER_CACHE_SIZE),
+            ttl=config.get("user-cache-ttl", DEFAULT_USER_CACHE_TTL),
+        )
+        self.channel_directory = SlackChannelDirectory()
+        self._channel_refresh_task = None
 
         self._event_creator = SlackEventCreator(self)
         self._event_queue = asyncio.Queue()
-        self._event_queue_task = None
+        self._event_queue_tasks = []
+        self._event_serializer = KeyedSerializer()
+        self._seen_events = collections.OrderedDict()
+
+    @property
+    def known_users(self):
+        """SlackUserMapping: The cached info of users, by user id."""
+        return self.user_directory.mapping()
+
+    @known_users.setter
+    def known_users(self, users):
+        self.user_directory.replace(users)
+
+    @property
+    def known_channels(self):
+        """SlackChannelMapping: The info of channels, by channel name."""
+        return self.channel_directory.mapping()
+
+    @known_channels.setter
+    def known_channels(self, channels):
+        self.channel_directory.replace(channels.values())
+
+    @property
+    def known_bots(self):
+        """SlackUserMapping: The cached info of bots, by bot id."""
+        return self.user_directory.mapping(is_bot=True)
+
+    @known_bots.setter
+    def known_bots(self, bots):
+        self.user_directory.replace(bots, is_bot=True)
 
     async def _queue_worker(self):
+        """Take events off the queue and handle them in order for each channel."""
         while True:
-            payload = await self._event_queue.get()
-            try:
-                await self.event_handler(payload)
-            finally:
-                self._event_queue.task_done()
+            payload, queued_at = await self._event_queue.get()
+            await self._event_serializer.run(
+                self._get_channel_key(payload),
+                self._handle_queued_event,
+                payload,
+                queued_at,
+            )
+
+    async def _handle_queued_event(self, payload, queued_at):
+        """Handle an event taken off the queue."""
+        self.opsdroid.metrics.connector_queue_lag.observe(
+            time.monotonic() - queued_at, self.name
+        )
+        # pylint: disable=broad-except
+        # A failing event must not take the worker down with it.
+        try:
+            await self.event_handler(payload)
+        except Exception:
+            _LOGGER.exception(_("Exception when handling Slack event %s."), payload)
+        finally:
+            self._event_queue.task_done()
+            self._update_queue_depth()
+
+    def _update_queue_depth(self):
+        """Record the number of events waiting to be handled."""
+        self.opsdroid.metrics.connector_queue_depth.set(
+            self._event_queue.qsize() + self._event_serializer.waiting, self.name
+        )
+
+    @staticmethod
+    def _get_channel_key(payload):
+        """Return the id of the channel a payload belongs to, if it has one."""
+        event = payload.get("event", payload)
+        if not isinstance(event, dict):
+            return None
+        channel = (
+            event.get("channel")
+            or event.get("channel_id")
+            or (event.get("item") or {}).get("channel")
+        )
+        if isinstance(channel, dict):
+            channel = channel.get("id")
+        return channel
+
+    def _is_duplicate(self, payload):
+        """Return whether a payload has already been received.
+
+        Payloads are identified by their ``event_id``, or for messages without
+        one by their ``client_msg_id``. The ids of the last
+        ``event-dedup-size`` payloads are remembered.
+
+        """
+        event_id = payload.get("event_id")
+        if event_id is None:
+            event = payload.get("event")
+            if not isinstance(event, dict) or "client_msg_id" not in event:
+                return False
+            event_id = (event.get("type"), event["client_msg_id"])
+
+        if event_id in self._seen_events:
+            _LOGGER.debug(
+                _("Dropping Slack event %s, it was already received."), event_id
+            )
+            self.opsdroid.metrics.connector_duplicate_events.inc(self.name)
+            return True
+        self._seen_events[event_id] = None
+        while len(self._seen_events) > self.event_dedup_size:
+            self._seen_events.popitem(last=False)
+        return False
 
     async def connect(self):
         """Connect to the chat service."""
@@ -112,7 +251,9 @@ class ConnectorSlack(Connector):
                 )
             ).data
             self.bot_id = self.user_info["user"]["profile"]["bot_id"]
-            self.opsdroid.create_task(self._get_channels())
+            self._channel_refresh_task = asyncio.create_task(self._refresh_channels())
+            if self.prefetch_users:
+                self.opsdroid.create_task(self.user_directory.prefetch())
         except SlackApiError as error:
             _LOGGER.error(
                 _(
@@ -135,9 +276,12 @@ class ConnectorSlack(Connector):
                 await self.socket_mode_client.connect()
                 _LOGGER.info(_("Connected successfully with socket mode"))
             else:
-                # Create a task for background processing events received by
+                # Create tasks for background processing events received by
                 # the web event handler.
-                self._event_queue_task = asyncio.create_task(self._queue_worker())
+                self._event_queue_tasks = [
+                    asyncio.create_task(self._queue_worker())
+                    for _worker in range(self.event_workers)
+                ]
 
                 self.opsdroid.web_server.web_app.router.add_post(
                     f"/connector/{self.name}",
@@ -152,12 +296,18 @@ class ConnectorSlack(Connector):
     async def disconnect(self):
         """Disconnect from Slack.
 
-        Cancels the event queue worker task and disconnects the
+        Cancels the event queue worker and channel refresh tasks, cancels the
+        Slack API calls still waiting to be made and disconnects the
         socket_mode_client if socket mode was enabled."""
 
-        if self._event_queue_task:
-            self._event_queue_task.cancel()
-            await asyncio.gather(self._event_queue_task, return_exceptions=True)
+        tasks, self._event_queue_tasks = self._event_queue_tasks, []
+        if self._channel_refresh_task is not None:
+            tasks.append(self._channel_refresh_task)
+            self._channel_refresh_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.rate_limiter.close()
 
         if self.socket_mode_client:
             await self.socket_mode_client.disconnect()
@@ -179,7 +329,7 @@ class ConnectorSlack(Connector):
 
         """
         data = {
-            "channel": event.target,
+            "channel": self.channel_directory.resolve(event.target),
             "username": self.bot_name,
             "icon_emoji": self.icon_emoji,
         }
@@ -196,52 +346,67 @@ class ConnectorSlack(Connector):
 
         return data
 
+    async def _refresh_channels(self):
+        """Refresh the channels from the Slack API every refresh_interval."""
+        while True:
+            # pylint: disable=broad-except
+            # A failed refresh is tried again at the next interval.
+            try:
+                await self._get_channels()
+            except Exception:
+                _LOGGER.exception(_("Unable to update channels from Slack."))
+            await asyncio.sleep(self.refresh_interval)
+
     async def _get_channels(self):
-        """Grab all the channels from the Slack API. This method runs while opsdroid
-        is running at every refresh_interval.
+        """Grab all the channels from the Slack API.
+
+        The pages of channels are fetched one after the other as fast as the
+        rate limit of ``conversations.list`` allows, and replace the known
+        channels once every page has been fetched.
+
         """
         # By default, slack api asks us to wait 30 seconds if we hit the rate limit.
         # We will retry 5 (2.5 mins) times before giving up.
         max_retries = 5
-        while self.opsdroid.eventloop.is_running():
-            _LOGGER.info(_("Updating Channels from Slack API at %s."), time.asctime())
+        _LOGGER.info(_("Updating Channels from Slack API at %s."), time.asctime())
 
-            cursor = None
-
-            while max_retries:
-                try:
-                    channels = await self.slack_web_client.conversations_list(
-                        cursor=cursor, limit=self.channel_limit
-                    )
-                    self.known_channels.update(
-                        {c["name"]: c for c in channels["channels"]}
-                    )
-                    cursor = channels.get("response_metadata", {}).get("next_cursor")
-                    if not cursor:
-                        break
-                    channel_count = len(self.known_channels.keys())
-                    _LOGGER.info(
-                        "Grabbed a total of %s channels from Slack", channel_count
-                    )
-                    await asyncio.sleep(
-                        self.refresh_interval - arrow.now().time().second
+        channels = []
+        cursor = None
+        retrying = False
+        while True:
+            # Retries wait for the time Slack asked for instead.
+            if self.rate_limit and not retrying:
+                await self.rate_limiter.wait("conversations.list")
+            retrying = False
+            try:
+                response = await self.slack_web_client.conversations_list(
+                    cursor=cursor, limit=self.channel_limit
+                )
+            except SlackApiError as error:
+                if "ratelimited" not in str(error):
+                    raise
+                if not max_retries:
+                    _LOGGER.warning(
+                        _("Giving up updating channels after being rate limited.")
                     )
-                except SlackApiError as error:
-                    if "ratelimited" in str(error):
-                        wait_time = float(error.response.headers.get("Retry-After", 30))
-                        _LOGGER.warning(
-                            _(
-                                f"Rate limit threshold reached. Retrying after {wait_time} seconds."
-                            )
-                        )
-                        await asyncio.sleep(wait_time)
-                        max_retries -= 1
-                        continue
-                    else:
-                        raise
-            # If we reach here, let's break from the loop
-            # (works for both cases: cursor is None or max_retries is 0)
-            break
+                    return
+                wait_time = float(error.response.headers.get("Retry-After", 30))
+                _LOGGER.warning(
+                    _("Rate limit threshold reached. Retrying after %s seconds."),
+                    wait_time,
+                )
+                await asyncio.sleep(wait_time)
+                max_retries -= 1
+                retrying = True
+                continue
+
+            channels.extend(response["channels"])
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+
+        self.channel_directory.replace(channels)
+        _LOGGER.info(_("Grabbed a total of %s channels from Slack."), len(channels))
 
     async def event_handler(self, payload):
         """Handle different payload types and parse the resulting events"""
@@ -278,7 +443,8 @@ class ConnectorSlack(Connector):
         await client.send_socket_mode_response(response)
         payload = req.payload
 
-        await self.event_handler(payload)
+        if not self._is_duplicate(payload):
+            await self.event_handler(payload)
 
     async def web_event_handler(self, request):
         """Handle events from the Events API and Interactive actions in Slack.
@@ -318,22 +484,26 @@ class ConnectorSlack(Connector):
         if payload.get("type") == "url_verification":
             return aiohttp.web.json_response({"challenge": payload["challenge"]})
 
+        if self._is_duplicate(payload):
+            return aiohttp.web.Response(text=json.dumps("Received"), status=200)
+
         # Put the event in the queue to process it in the background and
         # immediately acknowledge the reception by returning status code 200.
         # Slack will resend events that have not been acknowledged within 3
         # seconds and we want to avoid that.
         #
         # https://api.slack.com/apis/connections/events-api#the-events-api__responding-to-events
-        self._event_queue.put_nowait(payload)
+        self._event_queue.put_nowait((payload, time.monotonic()))
+        self._update_queue_depth()
 
         return aiohttp.web.Response(text=json.dumps("Received"), status=200)
 
     async def find_channel(self, channel_name):
         """
-        Given a channel name return the channel properties.
+        Given a channel name or id return the channel properties.
 
         args:
-            channel_name: the name of the channel. ie: general
+            channel_name: the name of the channel, ie: general, or its id
 
         returns:
             dict with channel details
@@ -354,8 +524,9 @@ class ConnectorSlack(Connector):
                     await message.respond(str(channel))
         """
 
-        if channel_name in self.known_channels:
-            return self.known_channels[channel_name]
+        channel = self.channel_directory.get(channel_name)
+        if channel is not None:
+            return channel
         _LOGGER.info(_("Channel with name %s not found"), channel_name)
 
     async def search_history_messages(self, channel, start_time, end_time, limit=100):
@@ -416,33 +587,18 @@ class ConnectorSlack(Connector):
 
     async def lookup_username(self, userid, is_bot=False):
         """Lookup a username and cache it."""
-        if userid in self.known_users:
-            return self.known_users[userid]
-        elif userid in self.known_bots:
-            return self.known_bots[userid]
-        else:
-            response = (
-                await self.slack_web_client.users_info(user=userid)
-                if not is_bot
-                else await self.slack_web_client.bots_info(bot=userid)
-            )
-            if "user" in response.data:
-                user_info = response.data["user"]
-                if isinstance(user_info, dict):
-                    self.known_users[userid] = user_info
-                return user_info
-            elif "bot" in response.data:
-                bot_info = response.data["bot"]
-                if isinstance(bot_info, dict):
-                    self.known_bots[userid] = bot_info
-                return bot_info
+        return await self.user_directory.lookup(userid, is_bot=is_bot)
 
     async def replace_usernames(self, message):
         """Replace User ID with username in message text."""
-        userids = re.findall(r"\<\@([A-Z0-9]+)(?:\|.+)?\>", message)
+        userids = list(
+            dict.fromkeys(re.findall(r"\<\@([A-Z0-9]+)(?:\|.+)?\>", message))
+        )
+        user_infos = await asyncio.gather(
+            *(self.lookup_username(userid) for userid in userids)
+        )
 
-        for userid in userids:
-            user_info = await self.lookup_username(userid)
+        for userid, user_info in zip(userids, user_infos):
             message = message.replace(
                 "<@{userid}>".format(userid=userid),
                 "@{username}".format(username=user_info["name"]),
@@ -450,6 +606,26 @@ class ConnectorSlack(Connector):
 
         return message
 
+    async def _api_call(self, method, channel=None, **kwargs):
+        """Call a Slack API method within its rate limit.
+
+        Args:
+            method (string): The Slack API method to call.
+            channel (string, optional): The channel the call is for, calls for
+                the same channel are made in order.
+            **kwargs: Keyword arguments for `AsyncWebClient.api_call`.
+
+        """
+        return await self._rate_limited(
+            method, channel, self.slack_web_client.api_call, method, **kwargs
+        )
+
+    async def _rate_limited(self, method, channel, func, *args, **kwargs):
+        """Call ``func`` through the rate limiter, unless it is turned off."""
+        if not self.rate_limit:
+            return await func(*args, **kwargs)
+        return await self.rate_limiter.call(method, channel, func, *args, **kwargs)
+
     @register_event(opsdroid.events.Message)
     async def _send_message(self, message):
         """Respond with a message."""
@@ -460,8 +636,9 @@ class ConnectorSlack(Connector):
         data = self._generate_base_data(message)
         data["text"] = message.text
 
-        return await self.slack_web_client.api_call(
+        return await self._api_call(
             "chat.postMessage",
+            channel=message.target,
             data=data,
         )
 
@@ -480,8 +657,9 @@ class ConnectorSlack(Connector):
             "text": message.text,
         }
 
-        return await self.slack_web_client.api_call(
+        return await self._api_call(
             "chat.update",
+            channel=message.target,
             data=data,
         )
 
@@ -494,7 +672,9 @@ class ConnectorSlack(Connector):
         data = self._generate_base_data(blocks)
         data["blocks"] = blocks.blocks
 
-        return await self.slack_web_client.api_call("chat.postMessage", data=data)
+        return await self._api_call(
+            "chat.postMessage", channel=blocks.target, data=data
+        )
 
     @register_event(EditedBlocks)
     async def _edit_blocks(self, blocks):
@@ -510,8 +690,9 @@ class ConnectorSlack(Connector):
             "blocks": blocks.blocks,
         }
 
-        return await self.slack_web_client.api_call(
+        return await self._api_call(
             "chat.update",
+            channel=blocks.target,
             data=data,
         )
 
@@ -523,7 +704,7 @@ class ConnectorSlack(Connector):
         """
         _LOGGER.debug(_("Opening modal with trigger id: %s."), modal.trigger_id)
 
-        return await self.slack_web_client.api_call(
+        return await self._api_call(
             "views.open",
             data={"trigger_id": modal.trigger_id, "view": modal.view},
         )
@@ -540,7 +721,7 @@ class ConnectorSlack(Connector):
         if modal.hash:
             data["hash"] = modal.hash
 
-        return await self.slack_web_client.api_call("views.update", data=data)
+        return await self._api_call("views.update", data=data)
 
     @register_event(ModalPush)
     async def _push_modal(self, modal):
@@ -550,7 +731,7 @@ class ConnectorSlack(Connector):
         """
         _LOGGER.debug(_("Pushing modal with trigger id: %s."), modal.trigger_id)
 
-        return await self.slack_web_client.api_call(
+        return await self._api_call(
             "views.push",
             data={"trigger_id": modal.trigger_id, "view": modal.view},
         )
@@ -561,8 +742,9 @@ class ConnectorSlack(Connector):
         emoji = demojize(reaction.emoji).replace(":", "")
         _LOGGER.debug(_("Reacting with: %s."), emoji)
         try:
-            return await self.slack_web_client.api_call(
+            return await self._api_call(
                 "reactions.add",
+                channel=reaction.target,
                 data={
                     "name": emoji,
                     "channel": reaction.target,
@@ -579,7 +761,7 @@ class ConnectorSlack(Connector):
     async def _send_room_creation(self, creation_event):
         _LOGGER.debug(_("Creating room %s."), creation_event.name)
 
-        return await self.slack_web_client.api_call(
+        return await self._api_call(
             "conversations.create", data={"name": creation_event.name}
         )
 
@@ -589,15 +771,18 @@ class ConnectorSlack(Connector):
             _("Renaming room %s to '%s'."), name_event.target, name_event.name
         )
 
-        return await self.slack_web_client.api_call(
+        return await self._api_call(
             "conversations.rename",
+            channel=name_event.target,
             data={"channel": name_event.target, "name": name_event.name},
         )
 
     @register_event(opsdroid.events.JoinRoom)
     async def _send_join_room(self, join_event):
-        return await self.slack_web_client.api_call(
-            "conversations.join", data={"channel": join_event.target}
+        return await self._api_call(
+            "conversations.join",
+            channel=join_event.target,
+            data={"channel": join_event.target},
         )
 
     @register_event(opsdroid.events.UserInvite)
@@ -606,22 +791,25 @@ class ConnectorSlack(Connector):
             _("Inviting user %s to room '%s'."), invite_event.user, invite_event.target
         )
 
-        return await self.slack_web_client.api_call(
+        return await self._api_call(
             "conversations.invite",
+            channel=invite_event.target,
             data={"channel": invite_event.target, "users": invite_event.user_id},
         )
 
     @register_event(opsdroid.events.RoomDescription)
     async def _send_room_description(self, desc_event):
-        return await self.slack_web_client.api_call(
+        return await self._api_call(
             "conversations.setTopic",
+            channel=desc_event.target,
             data={"channel": desc_event.target, "topic": desc_event.description},
         )
 
     @register_event(opsdroid.events.PinMessage)
     async def _send_pin_message(self, pin_event):
-        return await self.slack_web_client.api_call(
+        return await self._api_call(
             "pins.add",
+            channel=pin_event.target,
             data={
                 "channel": pin_event.target,
                 "timestamp": pin_event.linked_event.event_id,
@@ -630,8 +818,9 @@ class ConnectorSlack(Connector):
 
     @register_event(opsdroid.events.UnpinMessage)
     async def _send_unpin_message(self, unpin_event):
-        return await self.slack_web_client.api_call(
+        return await self._api_call(
             "pins.remove",
+            channel=unpin_event.target,
             data={
                 "channel": unpin_event.target,
                 "timestamp": unpin_event.linked_event.event_id,
@@ -646,7 +835,10 @@ class ConnectorSlack(Connector):
             if self.config.get("start-thread", False) and isinstance(raw_event, dict)
             else None
         )
-        return await self.slack_web_client.files_upload_v2(
+        return await self._rate_limited(
+            "files.upload",
+            file_event.target,
+            self.slack_web_client.files_upload_v2,
             channel=file_event.target,
             content=await file_event.get_file_bytes(),
             filename=file_event.name,
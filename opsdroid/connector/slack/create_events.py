@@ -21,6 +21,7 @@ class SlackEventCreator(events.EventCreator):
         self.event_types["channel_archive"] = self.archive_room
         self.event_types["channel_unarchive"] = self.unarchive_room
         self.event_types["team_join"] = self.create_join_group
+        self.event_types["user_change"] = self.update_user
         self.event_types["channel_rename"] = self.channel_name_changed
         self.event_types["pin_added"] = self.message_pinned
         self.event_types["pin_removed"] = self.message_unpinned
@@ -129,6 +130,7 @@ class SlackEventCreator(events.EventCreator):
         user_info = await self.connector.lookup_username(user_id)
 
         name = event["channel"].get("name_normalized", event["channel"].get("name"))
+        self.connector.channel_directory.update(event["channel"])
 
         return events.NewRoom(
             name=name,
@@ -143,6 +145,7 @@ class SlackEventCreator(events.EventCreator):
 
     async def archive_room(self, event, channel):
         """Send a ChannelArchived event."""
+        self.connector.channel_directory.archive(event["channel"])
 
         return slack_events.ChannelArchived(
             target=event["channel"],
@@ -153,6 +156,7 @@ class SlackEventCreator(events.EventCreator):
 
     async def unarchive_room(self, event, channel):
         """Send a ChannelUnarchived event."""
+        self.connector.channel_directory.archive(event["channel"], archived=False)
 
         return slack_events.ChannelUnarchived(
             target=event["channel"],
@@ -174,8 +178,13 @@ class SlackEventCreator(events.EventCreator):
             user=user_info["name"],
         )
 
+    async def update_user(self, event, channel):
+        """Replace the cached info of a user which has changed."""
+        self.connector.user_directory.update(event["user"])
+
     async def channel_name_changed(self, event, channel):
         """Send a RoomName event."""
+        self.connector.channel_directory.update(event["channel"])
 
         return events.RoomName(
             name=event["channel"]["name"],
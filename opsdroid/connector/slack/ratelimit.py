@@ -0,0 +1,279 @@
+"""Rate limit the calls the Slack connector makes to the Slack API.
+
+Slack limits how often each API method can be called, grouping methods into
+tiers: https://api.slack.com/docs/rate-limits. Calls which go over the limit
+fail with a 429 response and a ``Retry-After`` header.
+
+"""
+
+import asyncio
+import collections
+import logging
+import time
+
+from slack_sdk.errors import SlackApiError
+
+_LOGGER = logging.getLogger(__name__)
+
+# The calls per minute allowed for each tier.
+TIER_LIMITS = {1: 1, 2: 20, 3: 50, 4: 100}
+METHOD_TIERS = {
+    "chat.update": 3,
+    "conversations.create": 2,
+    "conversations.invite": 3,
+    "conversations.join": 3,
+    "conversations.rename": 2,
+    "conversations.setTopic": 2,
+    "files.upload": 2,
+    "pins.add": 2,
+    "pins.remove": 2,
+    "reactions.add": 3,
+    "views.open": 4,
+    "views.push": 4,
+    "views.update": 4,
+}
+DEFAULT_TIER = 3
+# chat.postMessage has its own limit of about one message a second for each
+# channel, with short bursts allowed.
+POST_MESSAGE_RATE = 1
+POST_MESSAGE_BURST = 3
+# How many seconds worth of calls a tier allows in a burst.
+BURST_SECONDS = 10
+DEFAULT_SEND_QUEUE_SIZE = 1000
+DEFAULT_RATE_LIMIT_RETRIES = 3
+MAX_BUCKETS = 1000
+
+
+class TokenBucket:
+    """A token bucket which hands out slots for calls in the order asked.
+
+    Args:
+        rate (float): How many tokens are added each second.
+        capacity (float): The most tokens the bucket holds, the largest burst
+            of calls which can be made at once.
+
+    """
+
+    def __init__(self, rate, capacity):
+        """Create a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0
+
+    def reserve(self):
+        """Take a token and return how many seconds to wait before using it.
+
+        The bucket goes into debt when it is empty, so each caller gets the
+        next free slot without having to wait on a lock.
+
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        return max(wait, self.paused_until - now)
+
+    def pause(self, seconds):
+        """Stop handing out slots until some seconds from now."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class SlackRateLimiter:
+    """Make calls to the Slack API within the rate limit of each method.
+
+    Each method has a `TokenBucket` sized for its tier, so calls which would
+    go over the limit wait rather than fail. When Slack still answers with a
+    429 the method is paused for the ``Retry-After`` time and the call is
+    retried. Calls for the same channel are made in the order they were
+    asked for by a worker task for that channel, and at most ``queue_size``
+    calls can be waiting for their channel before callers have to wait for
+    room.
+
+    Args:
+        connector (ConnectorSlack): The connector to record metrics for.
+        queue_size (int): The most calls which can wait for their channel.
+        retries (int): How many times to retry a call which was rate limited.
+
+    Attributes:
+        buckets (OrderedDict): The bucket for each method, and for each
+            channel for ``chat.postMessage``.
+        queues (dict): The calls waiting to be made, by channel.
+        workers (dict): The task making the calls for each busy channel.
+        pending (int): The number of calls which haven't finished yet.
+
+    """
+
+    def __init__(
+        self,
+        connector,
+        queue_size=DEFAULT_SEND_QUEUE_SIZE,
+        retries=DEFAULT_RATE_LIMIT_RETRIES,
+    ):
+        """Create the rate limiter."""
+        self.connector = connector
+        self.retries = retries
+        self.buckets = collections.OrderedDict()
+        self.queue_size = queue_size
+        self.queues = {}
+        self.workers = {}
+        self.pending = 0
+        self._room = None
+
+    def bucket(self, method, channel=None):
+        """Return the bucket for a method, creating it if needed."""
+        key = (method, channel) if method == "chat.postMessage" else method
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            if method == "chat.postMessage":
+                bucket = TokenBucket(POST_MESSAGE_RATE, POST_MESSAGE_BURST)
+            else:
+                limit = TIER_LIMITS[METHOD_TIERS.get(method, DEFAULT_TIER)]
+                bucket = TokenBucket(limit / 60, max(1, limit * BURST_SECONDS / 60))
+            self.buckets[key] = bucket
+            while len(self.buckets) > MAX_BUCKETS:
+                self.buckets.popitem(last=False)
+        self.buckets.move_to_end(key)
+        return bucket
+
+    async def wait(self, method, channel=None):
+        """Wait until a call to a method is within its rate limit.
+
+        For calls which handle being rate limited themselves, such as
+        paging through lists.
+
+        Args:
+            method (string): The Slack API method about to be called.
+            channel (string, optional): The channel the call is for.
+
+        """
+        delay = self.bucket(method, channel).reserve()
+        self.connector.opsdroid.metrics.connector_throttle_duration.observe(
+            delay, self.connector.name, method
+        )
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def call(self, method, channel, func, *args, **kwargs):
+        """Call ``func(*args, **kwargs)`` within the rate limit of a method.
+
+        Args:
+            method (string): The Slack API method ``func`` calls.
+            channel (string): The channel the call is for, calls for the same
+                channel are made in order. None if it isn't for a channel.
+            func: The coroutine function which calls the API.
+            *args: Arguments to call ``func`` with.
+            **kwargs: Keyword arguments to call ``func`` with.
+
+        Returns:
+            The result of ``func``.
+
+        Raises:
+            SlackApiError: If the call failed, or was still rate limited after
+                being retried.
+
+        """
+        self._set_pending(1)
+        try:
+            if channel is None:
+                return await self._call(method, channel, func, args, kwargs)
+
+            room = self._get_room()
+            if room is not None:
+                await room.acquire()
+            future = asyncio.get_event_loop().create_future()
+            queue = self.queues.setdefault(channel, collections.deque())
+            queue.append((future, method, func, args, kwargs))
+            if channel not in self.workers:
+                self.workers[channel] = asyncio.ensure_future(self._worker(channel))
+            return await future
+        finally:
+            self._set_pending(-1)
+
+    async def close(self):
+        """Stop the channel workers, cancelling the calls not made yet."""
+        workers = list(self.workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        # Workers cancelled before they started never got to clean up.
+        for channel in list(self.queues):
+            self._drop(channel)
+
+    def _get_room(self):
+        """Return the semaphore bounding the calls waiting for a channel."""
+        if self._room is None and self.queue_size:
+            self._room = asyncio.Semaphore(self.queue_size)
+        return self._room
+
+    async def _worker(self, channel):
+        """Make the queued calls for a channel in order, then exit."""
+        # pylint: disable=broad-except
+        # Errors are passed on to whoever made the call.
+        queue = self.queues[channel]
+        future = None
+        try:
+            while queue:
+                future, method, func, args, kwargs = queue.popleft()
+                if self._room is not None:
+                    self._room.release()
+                if future.done():
+                    # The caller was cancelled while the call was waiting.
+                    continue
+                try:
+                    result = await self._call(method, channel, func, args, kwargs)
+                except Exception as error:
+                    if not future.done():
+                        future.set_exception(error)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            if future is not None and not future.done():
+                future.cancel()
+            self._drop(channel)
+
+    def _drop(self, channel):
+        """Forget the worker of a channel, cancelling the calls left queued."""
+        self.workers.pop(channel, None)
+        queue = self.queues.pop(channel, None) or ()
+        if queue:
+            _LOGGER.warning(
+                _("Cancelled %s Slack API calls queued for %s."), len(queue), channel
+            )
+        while queue:
+            future = queue.popleft()[0]
+            if self._room is not None:
+                self._room.release()
+            future.cancel()
+
+    async def _call(self, method, channel, func, args, kwargs):
+        """Wait for a slot in the bucket of a method then make the call."""
+        metrics = self.connector.opsdroid.metrics
+        bucket = self.bucket(method, channel)
+        attempt = 0
+        while True:
+            await self.wait(method, channel)
+            try:
+                return await func(*args, **kwargs)
+            except SlackApiError as error:
+                if error.response.status_code != 429 or attempt >= self.retries:
+                    raise
+                retry_after = float(error.response.headers.get("Retry-After", 1))
+                metrics.connector_rate_limited.inc(self.connector.name, method)
+                _LOGGER.warning(
+                    _("Slack rate limited %s, retrying after %s seconds."),
+                    method,
+                    retry_after,
+                )
+                bucket.pause(retry_after)
+                attempt += 1
+
+    def _set_pending(self, change):
+        """Update the number of calls waiting to be made."""
+        self.pending += change
+        self.connector.opsdroid.metrics.connector_send_queue_depth.set(
+            self.pending, self.connector.name
+        )
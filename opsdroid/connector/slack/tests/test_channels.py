@@ -0,0 +1,67 @@
+"""Tests for the SlackChannelDirectory class."""
+
+import pytest
+
+from opsdroid.connector.slack.channels import SlackChannelDirectory
+
+
+def test_get_by_id_and_name():
+    directory = SlackChannelDirectory()
+    directory.replace([{"id": "C1", "name": "general"}, {"id": "C2", "name": "random"}])
+
+    assert len(directory) == 2
+    assert directory.get("C1")["name"] == "general"
+    assert directory.get("random")["id"] == "C2"
+    assert directory.get("#random")["id"] == "C2"
+    assert directory.get("missing") is None
+    assert directory.get(None) is None
+    assert directory.get("") is None
+    assert directory.resolve("#general") == "C1"
+    assert directory.resolve("U123") == "U123"
+    assert directory.resolve(None) is None
+
+
+def test_rename_and_archive():
+    directory = SlackChannelDirectory()
+    directory.update({"id": "C1", "name": "old", "is_private": False})
+    directory.update({"id": "C1", "name": "new"})
+    directory.archive("C1")
+
+    assert directory.get("old") is None
+    assert directory.get("new") == {
+        "id": "C1",
+        "name": "new",
+        "is_private": False,
+        "is_archived": True,
+    }
+    directory.archive("C1", archived=False)
+    assert not directory.get("C1")["is_archived"]
+    directory.archive("C2")
+    assert directory.by_name() == {"new": directory.get("C1")}
+
+
+def test_replace_drops_old_channels():
+    directory = SlackChannelDirectory()
+    directory.update({"id": "C1", "name": "general"})
+    directory.replace([{"id": "C2", "name": "random"}])
+    assert directory.get("general") is None
+    assert directory.by_name() == {"random": {"id": "C2", "name": "random"}}
+
+
+def test_mapping_writes_through():
+    directory = SlackChannelDirectory()
+    channels = directory.mapping()
+    channels["general"] = {"id": "C1"}
+    channels["general"] = {"id": "C1", "is_private": False}
+
+    assert directory.get("C1") == {"id": "C1", "name": "general", "is_private": False}
+    assert channels == {"general": directory.get("C1")}
+    assert len(channels) == 1
+
+    del channels["general"]
+    assert directory.get("C1") is None
+    assert len(directory) == 0
+    with pytest.raises(KeyError):
+        del channels["general"]
+    with pytest.raises(KeyError):
+        channels["general"]
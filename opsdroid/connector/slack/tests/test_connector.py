@@ -1,5 +1,6 @@
 """Tests for the ConnectorSlack class."""
 
+import asyncio
 import logging
 
 import asynctest.mock as amock
@@ -39,6 +40,12 @@ CONVERSATIONS_LIST_LAST_PAGE = (
     get_path("method_conversations.list_last_page.json"),
     200,
 )
+CONVERSATIONS_LIST_FIRST_PAGE = (
+    "/conversations.list",
+    "GET",
+    get_path("method_conversations.list_first_page.json"),
+    200,
+)
 CONVERSATIONS_CREATE = ("/conversations.create", "POST", {"ok": True}, 200)
 CONVERSATIONS_RENAME = ("/conversations.rename", "POST", {"ok": True}, 200)
 CONVERSATIONS_JOIN = ("/conversations.join", "POST", {"ok": True}, 200)
@@ -144,6 +151,70 @@ async def test_socket_event_handler(opsdroid, mock_api_obj, mock_api):
     await connector.disconnect()
 
 
+@pytest.mark.anyio
+async def test_duplicate_events_dropped(connector):
+    connector.event_dedup_size = 2
+    assert not connector._is_duplicate({"event_id": "Ev1"})
+    assert connector._is_duplicate({"event_id": "Ev1"})
+    message = {"event": {"type": "message", "client_msg_id": "abc"}}
+    assert not connector._is_duplicate(message)
+    assert connector._is_duplicate(message)
+    assert not connector._is_duplicate({"type": "block_actions"})
+    assert not connector._is_duplicate({"type": "block_actions"})
+
+    assert not connector._is_duplicate({"event_id": "Ev2"})
+    # Ev1 has fallen out of the window
+    assert not connector._is_duplicate({"event_id": "Ev1"})
+    assert connector.opsdroid.metrics.connector_duplicate_events.get("slack") == 2
+
+
+@pytest.mark.anyio
+async def test_queued_events_ordered_by_channel(connector):
+    connector.event_workers = 4
+    handled = []
+
+    async def event_handler(payload):
+        channel = payload["event"]["channel"]
+        if channel == "C1" and payload["event"]["n"] == 0:
+            await asyncio.sleep(0.05)
+        if payload["event"]["n"] == 1:
+            raise ValueError
+        handled.append((channel, payload["event"]["n"]))
+
+    connector.event_handler = event_handler
+    connector._event_queue_tasks = [
+        asyncio.create_task(connector._queue_worker())
+        for _worker in range(connector.event_workers)
+    ]
+    for n in range(3):
+        for channel in ("C1", "C2"):
+            payload = {"event": {"channel": channel, "n": n}}
+            connector._event_queue.put_nowait((payload, 0))
+    try:
+        await asyncio.wait_for(connector._event_queue.join(), 1)
+    finally:
+        await connector.disconnect()
+
+    assert [n for channel, n in handled if channel == "C1"] == [0, 2]
+    assert [n for channel, n in handled if channel == "C2"] == [0, 2]
+    # C2 wasn't held up by the slow event in C1
+    assert handled.index(("C2", 2)) < handled.index(("C1", 0))
+    metrics = connector.opsdroid.metrics
+    assert metrics.connector_queue_depth.get("slack") == 0
+    assert metrics.connector_queue_lag.get("slack").count == 6
+
+
+def test_get_channel_key():
+    from opsdroid.connector.slack.connector import ConnectorSlack
+
+    assert ConnectorSlack._get_channel_key({"event": {"channel": "C1"}}) == "C1"
+    assert ConnectorSlack._get_channel_key({"channel": {"id": "C2"}}) == "C2"
+    assert ConnectorSlack._get_channel_key({"channel_id": "C3"}) == "C3"
+    item = {"event": {"item": {"channel": "C4"}}}
+    assert ConnectorSlack._get_channel_key(item) == "C4"
+    assert ConnectorSlack._get_channel_key({"type": "view_submission"}) is None
+
+
 @pytest.mark.anyio
 @pytest.mark.add_response(
     "/users.info",
@@ -223,6 +294,31 @@ async def test__get_channels_rate_limit(
     assert "Rate limit threshold reached." in caplog.text
 
 
+@pytest.mark.anyio
+@pytest.mark.add_response(*CONVERSATIONS_LIST_LAST_PAGE)
+@pytest.mark.add_response(*CONVERSATIONS_LIST_FIRST_PAGE)
+async def test__get_channels_all_pages(connector, mock_api, caplog):
+    caplog.set_level(logging.INFO)
+    connector.known_channels = {"old": {"id": "C0", "name": "old"}}
+    await connector._get_channels()
+
+    assert mock_api.call_count("/conversations.list") == 2
+    assert set(connector.known_channels) == {"general", "random"}
+    assert "Grabbed a total of 4 channels" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_refresh_channels_survives_errors(connector, monkeypatch, caplog):
+    get_channels = amock.CoroutineMock(side_effect=[SlackApiError("Error", "?"), None])
+    monkeypatch.setattr(connector, "_get_channels", get_channels)
+    connector.refresh_interval = 0
+    task = asyncio.create_task(connector._refresh_channels())
+    while get_channels.call_count < 2:
+        await asyncio.sleep(0)
+    task.cancel()
+    assert "Unable to update channels from Slack" in caplog.text
+
+
 @pytest.mark.anyio
 async def test__get_channels_exception_raises(
     connector,
@@ -280,6 +376,39 @@ async def test_find_channel(connector, mock_api):
     assert channel["name"] == "general"
 
 
+@pytest.mark.anyio
+async def test_find_channel_by_id(connector):
+    connector.known_channels = {"general": {"name": "general", "id": "C012AB3CD"}}
+    channel = await connector.find_channel("C012AB3CD")
+    assert channel["name"] == "general"
+
+
+@pytest.mark.anyio
+async def test_channel_events_update_directory(connector):
+    connector.known_channels = {"general": {"name": "general", "id": "C1"}}
+    connector.known_users = {"U1": {"name": "Test User"}}
+    created = {"id": "C2", "name": "new", "creator": "U1"}
+    for event in (
+        {"type": "channel_created", "channel": created},
+        {"type": "channel_rename", "channel": {"id": "C1", "name": "main"}},
+        {"type": "channel_archive", "channel": "C2"},
+    ):
+        event["event_ts"] = "0"
+        await connector._event_creator.create_event(event, None)
+
+    assert set(connector.known_channels) == {"main", "new"}
+    assert (await connector.find_channel("C2"))["is_archived"]
+
+
+@pytest.mark.anyio
+@pytest.mark.add_response(*CHAT_POST_MESSAGE)
+async def test_send_message_to_channel_name(send_event, connector):
+    connector.known_channels = {"general": {"name": "general", "id": "C1"}}
+    event = events.Message(text="hello", target="#general")
+    payload, response = await send_event(CHAT_POST_MESSAGE, event)
+    assert payload["channel"] == "C1"
+
+
 @pytest.mark.anyio
 @pytest.mark.add_response(*CONVERSATIONS_LIST_LAST_PAGE)
 async def test_find_channel_not_found(connector, mock_api, caplog):
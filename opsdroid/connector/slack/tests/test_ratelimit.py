@@ -0,0 +1,183 @@
+"""Tests for the Slack rate limiter."""
+
+import asyncio
+
+import pytest
+from opsdroid import events
+from opsdroid.connector.slack.ratelimit import SlackRateLimiter, TokenBucket
+from slack_sdk.errors import SlackApiError
+
+CHAT_POST_MESSAGE = ("/chat.postMessage", "POST", {"ok": True}, 200)
+RATE_LIMITED = (
+    "/chat.postMessage",
+    "POST",
+    {"ok": False, "error": "ratelimited"},
+    429,
+)
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    bucket.pause(5)
+    assert bucket.reserve() == pytest.approx(5, abs=0.01)
+
+
+@pytest.mark.anyio
+async def test_buckets_by_tier(connector):
+    limiter = SlackRateLimiter(connector)
+    assert limiter.bucket("pins.add").rate == pytest.approx(20 / 60)
+    assert limiter.bucket("views.open").rate == pytest.approx(100 / 60)
+    assert limiter.bucket("chat.postMessage", "C1") is not limiter.bucket(
+        "chat.postMessage", "C2"
+    )
+    assert limiter.bucket("reactions.add") is limiter.bucket("reactions.add")
+
+
+@pytest.mark.anyio
+@pytest.mark.add_response(*CHAT_POST_MESSAGE)
+@pytest.mark.add_response(*RATE_LIMITED)
+async def test_retry_after_rate_limited(connector, mock_api, monkeypatch):
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay):
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    response = await connector.send(events.Message("hello", target="C1"))
+
+    assert response["ok"]
+    assert mock_api.call_count("/chat.postMessage") == 2
+    # Retry-After defaults to one second when Slack doesn't send it.
+    assert sleeps == [pytest.approx(1, abs=0.01)]
+    metrics = connector.opsdroid.metrics
+    assert metrics.connector_rate_limited.get("slack", "chat.postMessage") == 1
+    assert metrics.connector_send_queue_depth.get("slack") == 0
+
+
+@pytest.mark.anyio
+@pytest.mark.add_response(*RATE_LIMITED)
+@pytest.mark.add_response(*RATE_LIMITED)
+async def test_gives_up_after_retries(connector, mock_api, monkeypatch):
+    async def sleep(delay):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    connector.rate_limiter.retries = 1
+    with pytest.raises(SlackApiError):
+        await connector.send(events.Message("hello", target="C1"))
+    assert mock_api.call_count("/chat.postMessage") == 2
+
+
+@pytest.mark.anyio
+async def test_calls_ordered_by_channel(connector):
+    limiter = SlackRateLimiter(connector)
+    calls = []
+
+    async def api_call(channel, number):
+        if number == 0:
+            await asyncio.sleep(0.05)
+        calls.append((channel, number))
+        return number
+
+    results = await asyncio.gather(
+        *(
+            limiter.call("chat.update", channel, api_call, channel, number)
+            for number in range(3)
+            for channel in ("C1", "C2")
+        )
+    )
+
+    assert results == [0, 0, 1, 1, 2, 2]
+    assert [number for channel, number in calls if channel == "C1"] == [0, 1, 2]
+    assert [number for channel, number in calls if channel == "C2"] == [0, 1, 2]
+    assert limiter.pending == 0
+
+
+@pytest.mark.anyio
+async def test_errors_passed_to_caller(connector):
+    limiter = SlackRateLimiter(connector)
+
+    async def api_call():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await limiter.call("chat.update", "C1", api_call)
+    with pytest.raises(ValueError):
+        await limiter.call("views.open", None, api_call)
+
+
+@pytest.mark.anyio
+async def test_first_caller_not_blocked_by_backlog(connector):
+    limiter = SlackRateLimiter(connector)
+    release = asyncio.Event()
+
+    async def api_call(number):
+        if number:
+            await release.wait()
+        return number
+
+    first = asyncio.ensure_future(limiter.call("chat.update", "C1", api_call, 0))
+    backlog = [
+        asyncio.ensure_future(limiter.call("chat.update", "C1", api_call, number))
+        for number in range(1, 3)
+    ]
+
+    assert await asyncio.wait_for(first, 1) == 0
+    assert not any(call.done() for call in backlog)
+    release.set()
+    assert await asyncio.wait_for(asyncio.gather(*backlog), 1) == [1, 2]
+    assert not limiter.workers
+    assert not limiter.queues
+
+
+@pytest.mark.anyio
+async def test_cancelled_caller_does_not_block_others(connector):
+    limiter = SlackRateLimiter(connector, queue_size=1)
+    release = asyncio.Event()
+    calls = []
+
+    async def api_call(number):
+        calls.append(number)
+        await release.wait()
+        return number
+
+    first = asyncio.ensure_future(limiter.call("chat.update", "C1", api_call, 0))
+    second = asyncio.ensure_future(limiter.call("chat.update", "C1", api_call, 1))
+    await asyncio.sleep(0)
+    third = asyncio.ensure_future(limiter.call("chat.update", "C1", api_call, 2))
+    await asyncio.sleep(0)
+
+    second.cancel()
+    release.set()
+    assert await asyncio.wait_for(asyncio.gather(first, third), 1) == [0, 2]
+    assert calls == [0, 2]
+    assert limiter.pending == 0
+
+
+@pytest.mark.anyio
+async def test_close_cancels_queued_calls(connector, caplog):
+    limiter = SlackRateLimiter(connector)
+
+    async def api_call():
+        await asyncio.sleep(10)
+
+    calls = [
+        asyncio.ensure_future(limiter.call("chat.update", "C1", api_call))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(limiter.close(), 1)
+    results = await asyncio.wait_for(asyncio.gather(*calls, return_exceptions=True), 1)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert "Cancelled 2 Slack API calls queued for C1." in caplog.text
+    assert not limiter.workers
+    assert not limiter.queues
+    assert limiter.pending == 0
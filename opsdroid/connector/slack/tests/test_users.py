@@ -0,0 +1,128 @@
+"""Tests for the SlackUserDirectory class."""
+
+import asyncio
+
+import pytest
+
+USER = {"id": "U01NK1K9L68", "name": "Test User"}
+USERS_INFO = ("/users.info", "GET", {"ok": True, "user": USER}, 200)
+USERS_LIST_FIRST_PAGE = (
+    "/users.list",
+    "GET",
+    {
+        "ok": True,
+        "members": [{"id": "U1", "name": "one"}, {"id": "U2", "name": "two"}],
+        "response_metadata": {"next_cursor": "abc"},
+    },
+    200,
+)
+USERS_LIST_LAST_PAGE = (
+    "/users.list",
+    "GET",
+    {
+        "ok": True,
+        "members": [{"id": "U3", "name": "three"}],
+        "response_metadata": {"next_cursor": ""},
+    },
+    200,
+)
+
+
+@pytest.mark.anyio
+@pytest.mark.add_response(*USERS_INFO)
+async def test_concurrent_lookups_share_one_call(connector, mock_api):
+    users = await asyncio.gather(
+        *(connector.lookup_username(USER["id"]) for _lookup in range(5))
+    )
+    assert users == [USER] * 5
+    assert await connector.lookup_username(USER["id"]) == USER
+    assert mock_api.call_count("/users.info") == 1
+    assert connector.user_directory.pending == {}
+
+
+@pytest.mark.anyio
+@pytest.mark.add_response(*USERS_INFO)
+async def test_replace_usernames_looks_up_each_user_once(connector, mock_api):
+    connector.known_users = {"U2": {"name": "Other User"}}
+    message = await connector.replace_usernames(
+        "hi <@U01NK1K9L68>, <@U2> and <@U01NK1K9L68>"
+    )
+    assert message == "hi @Test User, @Other User and @Test User"
+    assert mock_api.call_count("/users.info") == 1
+
+
+@pytest.mark.anyio
+async def test_user_change_replaces_cached_user(connector):
+    connector.known_users = {USER["id"]: USER}
+    changed = {"id": USER["id"], "name": "New Name"}
+    await connector.event_handler(
+        {"type": "event_callback", "event": {"type": "user_change", "user": changed}}
+    )
+    assert await connector.lookup_username(USER["id"]) == changed
+
+
+@pytest.mark.anyio
+async def test_cache_bounded_and_expires(connector):
+    directory = connector.user_directory
+    directory.users.size = 2
+    for userid in ("U1", "U2", "U3"):
+        directory.update({"id": userid})
+    assert set(connector.known_users) == {"U2", "U3"}
+
+    directory.users.ttl = -1
+    directory.update({"id": "U4"})
+    assert directory.users.get("U4") == (False, None)
+
+
+@pytest.mark.anyio
+@pytest.mark.add_response(*USERS_LIST_LAST_PAGE)
+@pytest.mark.add_response(*USERS_LIST_FIRST_PAGE)
+async def test_prefetch(connector, mock_api):
+    await connector.user_directory.prefetch()
+    assert set(connector.known_users) == {"U1", "U2", "U3"}
+    assert mock_api.call_count("/users.list") == 2
+    assert await connector.lookup_username("U3") == {"id": "U3", "name": "three"}
+
+
+@pytest.mark.anyio
+@pytest.mark.add_response(*USERS_LIST_FIRST_PAGE)
+async def test_prefetch_stops_when_full(connector, mock_api):
+    connector.user_directory.size = 2
+    await connector.user_directory.prefetch()
+    assert set(connector.known_users) == {"U1", "U2"}
+    assert mock_api.call_count("/users.list") == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.add_response("/users.list", "GET", {"ok": False, "error": "invalid"})
+async def test_prefetch_error(connector, mock_api, caplog):
+    await connector.user_directory.prefetch()
+    assert "Unable to prefetch Slack users" in caplog.text
+    assert connector.known_users == {}
+
+
+@pytest.mark.anyio
+async def test_known_users_writes_through(connector, mock_api):
+    connector.known_users[USER["id"]] = {"name": "Test User"}
+    connector.known_bots["B1"] = {"name": "Bot"}
+    assert await connector.lookup_username(USER["id"]) == USER
+    assert await connector.lookup_username("B1", is_bot=True) == {
+        "id": "B1",
+        "name": "Bot",
+    }
+    assert mock_api.call_count("/users.info") == 0
+
+    del connector.known_users[USER["id"]]
+    assert USER["id"] not in connector.known_users
+    with pytest.raises(KeyError):
+        del connector.known_users[USER["id"]]
+
+
+@pytest.mark.anyio
+async def test_known_users_skips_expired(connector):
+    connector.user_directory.users.ttl = -1
+    connector.known_users = {USER["id"]: USER}
+    assert connector.known_users == {}
+    assert len(connector.known_users) == 0
+    with pytest.raises(KeyError):
+        connector.known_users[USER["id"]]
@@ -0,0 +1,217 @@
+"""A directory of Slack users and bots for the Slack connector."""
+
+import asyncio
+import collections.abc
+import logging
+
+from opsdroid.memory import MemoryCache
+from slack_sdk.errors import SlackApiError
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_USER_CACHE_SIZE = 1000
+DEFAULT_USER_CACHE_TTL = 3600
+DEFAULT_USER_PAGE_SIZE = 200
+MAX_PREFETCH_RETRIES = 5
+
+
+class SlackUserDirectory:
+    """Look up and cache the info of Slack users and bots.
+
+    Users and bots are cached in bounded least recently used caches for
+    ``ttl`` seconds. Lookups of a user which is already being looked up wait
+    for the same ``users.info`` call rather than making their own. The cache
+    can be filled up front with `prefetch`, which pages through
+    ``users.list``.
+
+    Args:
+        connector (ConnectorSlack): The connector to make API calls with.
+        size (int): The maximum number of users, and of bots, to cache.
+        ttl (float, optional): How long to cache a user for in seconds, or
+            None to cache users until they are evicted or invalidated.
+
+    Attributes:
+        users (MemoryCache): The cached user info, by user id.
+        bots (MemoryCache): The cached bot info, by bot id.
+        pending (dict): The lookups in progress, by kind and id.
+
+    """
+
+    def __init__(
+        self, connector, size=DEFAULT_USER_CACHE_SIZE, ttl=DEFAULT_USER_CACHE_TTL
+    ):
+        """Create an empty directory."""
+        self.connector = connector
+        self.size = size
+        self.users = MemoryCache(size=size, ttl=ttl)
+        self.bots = MemoryCache(size=size, ttl=ttl)
+        self.pending = {}
+
+    def _cache(self, is_bot):
+        return self.bots if is_bot else self.users
+
+    def cached(self, is_bot=False):
+        """Return the cached info of every user, or bot, which hasn't expired."""
+        cache = self._cache(is_bot)
+        infos = {}
+        # Listed up front as looking up an expired entry removes it.
+        for key in list(cache.entries):
+            found, info = cache.get(key)
+            if found:
+                infos[key] = info
+        return infos
+
+    def mapping(self, is_bot=False):
+        """Return a mapping of the cached users, or bots, which writes through."""
+        return SlackUserMapping(self, is_bot)
+
+    def replace(self, infos, is_bot=False):
+        """Replace the cached users, or bots, with the given info by id."""
+        cache = self._cache(is_bot)
+        cache.clear()
+        for key, info in infos.items():
+            cache.set(key, info)
+
+    def update(self, info, is_bot=False):
+        """Cache new info for a user or bot, replacing what was cached."""
+        cache = self._cache(is_bot)
+        # Invalidating first stops lookups already in flight from caching
+        # the info they get from before the change.
+        cache.invalidate(info["id"])
+        cache.set(info["id"], info)
+
+    def invalidate(self, key, is_bot=False):
+        """Forget the cached info of a user or bot."""
+        self._cache(is_bot).invalidate(key)
+
+    async def lookup(self, key, is_bot=False):
+        """Return the info of a user or bot, looking it up if not cached.
+
+        Args:
+            key (string): The id of the user or bot.
+            is_bot (bool): Whether to look up a bot rather than a user.
+
+        Returns:
+            dict or None: The info returned by ``users.info`` or
+                ``bots.info``, or None if there was none.
+
+        """
+        found, info = self._cache(is_bot).get(key)
+        if found:
+            return info
+
+        pending_key = (is_bot, key)
+        task = self.pending.get(pending_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, is_bot))
+            self.pending[pending_key] = task
+            task.add_done_callback(lambda done: self._finish(pending_key, done))
+        # Shielded so one caller being cancelled doesn't cancel the lookup
+        # for everyone else waiting on it.
+        return await asyncio.shield(task)
+
+    def _finish(self, pending_key, task):
+        """Forget a finished lookup."""
+        self.pending.pop(pending_key, None)
+        # Errors are raised to every caller waiting on the lookup, this stops
+        # them being reported as unhandled when every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(self, key, is_bot):
+        """Look up a user or bot with the Slack API and cache it."""
+        cache = self._cache(is_bot)
+        invalidations = cache.invalidations
+        client = self.connector.slack_web_client
+        response = (
+            await client.bots_info(bot=key)
+            if is_bot
+            else await client.users_info(user=key)
+        )
+        for field in ("user", "bot"):
+            if field in response.data:
+                info = response.data[field]
+                if isinstance(info, dict) and cache.invalidations == invalidations:
+                    cache.set(key, info)
+                return info
+        return None
+
+    async def prefetch(self, page_size=DEFAULT_USER_PAGE_SIZE):
+        """Fill the user cache by paging through ``users.list``.
+
+        Stops once the cache is full. When Slack rate limits the calls they
+        are retried after the time Slack asks for.
+
+        Args:
+            page_size (int): How many users to ask for in each call.
+
+        """
+        cursor = None
+        retries = MAX_PREFETCH_RETRIES
+        while len(self.users) < self.size:
+            try:
+                response = await self.connector.slack_web_client.users_list(
+                    cursor=cursor, limit=page_size
+                )
+            except SlackApiError as error:
+                if "ratelimited" not in str(error) or not retries:
+                    _LOGGER.error(_("Unable to prefetch Slack users: %s."), error)
+                    return
+                wait_time = float(error.response.headers.get("Retry-After", 30))
+                _LOGGER.warning(
+                    _("Rate limited prefetching Slack users, retrying in %s seconds."),
+                    wait_time,
+                )
+                await asyncio.sleep(wait_time)
+                retries -= 1
+                continue
+
+            for member in response.data.get("members", []):
+                self.users.set(member["id"], member)
+            cursor = response.data.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+        _LOGGER.info(_("Prefetched %s Slack users."), len(self.users))
+
+
+class SlackUserMapping(collections.abc.MutableMapping):
+    """A dict like view of the users, or bots, cached by a directory.
+
+    Lookups go through the cache so expired info is never returned, and
+    setting or deleting a key updates or invalidates the cached info.
+
+    Args:
+        directory (SlackUserDirectory): The directory to view.
+        is_bot (bool): Whether to view the bots rather than the users.
+
+    """
+
+    def __init__(self, directory, is_bot=False):
+        """Create a view of a directory."""
+        self.directory = directory
+        self.is_bot = is_bot
+
+    def __getitem__(self, key):
+        """Return the cached info of a user or bot."""
+        found, info = self.directory._cache(self.is_bot).get(key)
+        if not found:
+            raise KeyError(key)
+        return info
+
+    def __setitem__(self, key, info):
+        """Cache new info for a user or bot."""
+        self.directory.update({**info, "id": key}, is_bot=self.is_bot)
+
+    def __delitem__(self, key):
+        """Forget the cached info of a user or bot."""
+        if key not in self:
+            raise KeyError(key)
+        self.directory.invalidate(key, is_bot=self.is_bot)
+
+    def __iter__(self):
+        """Iterate over the ids of the cached users or bots."""
+        return iter(self.directory.cached(self.is_bot))
+
+    def __len__(self):
+        """Return the number of cached users or bots."""
+        return len(self.directory.cached(self.is_bot))
@@ -18,6 +18,7 @@ from opsdroid.events import (
     PinMessage,
     Reply,
 )
+from opsdroid.sessions import client_session
 
 from . import events as telegram_events
 
@@ -165,7 +166,7 @@ class ConnectorTelegram(Connector):
             self.webhook_endpoint, self.telegram_webhook_handler
         )
 
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.opsdroid, trust_env=False) as session:
             if self.base_url:
                 payload = {
                     "url": f"{self.base_url}{self.webhook_endpoint}",
@@ -178,16 +179,15 @@ class ConnectorTelegram(Connector):
                     ],
                 }
 
-                response = await session.post(
+                async with session.post(
                     self.build_url("setWebhook"), params=payload
-                )
-
-                if response.status >= 400:
-                    _LOGGER.error(
-                        _("Error when connecting to Telegram Webhook: - %s - %s"),
-                        response.status,
-                        response.text,
-                    )
+                ) as response:
+                    if response.status >= 400:
+                        _LOGGER.error(
+                            _("Error when connecting to Telegram Webhook: - %s - %s"),
+                            response.status,
+                            await response.text(),
+                        )
 
     async def telegram_webhook_handler(self, request):
         """Handle event from Telegram webhooks.
@@ -395,12 +395,12 @@ class ConnectorTelegram(Connector):
         data["chat_id"] = message.target
         data["text"] = message.text
 
-        async with aiohttp.ClientSession() as session:
-            resp = await session.post(self.build_url("sendMessage"), data=data)
-            if resp.status == 200:
-                _LOGGER.debug(_("Successfully responded."))
-            else:
-                _LOGGER.error(_("Unable to respond."))
+        async with client_session(self.opsdroid, trust_env=False) as session:
+            async with session.post(self.build_url("sendMessage"), data=data) as resp:
+                if resp.status == 200:
+                    _LOGGER.debug(_("Successfully responded."))
+                else:
+                    _LOGGER.error(_("Unable to respond."))
 
     @register_event(Image)
     async def send_image(self, file_event):
@@ -420,12 +420,14 @@ class ConnectorTelegram(Connector):
             content_type="multipart/form-data",
         )
 
-        async with aiohttp.ClientSession() as session:
-            resp = await session.post(self.build_url("sendPhoto"), data=data)
-            if resp.status == 200:
-                _LOGGER.debug(_("Sent %s image successfully."), file_event.name)
-            else:
-                _LOGGER.debug(_("Unable to send image - Status Code %s."), resp.status)
+        async with client_session(self.opsdroid, trust_env=False) as session:
+            async with session.post(self.build_url("sendPhoto"), data=data) as resp:
+                if resp.status == 200:
+                    _LOGGER.debug(_("Sent %s image successfully."), file_event.name)
+                else:
+                    _LOGGER.debug(
+                        _("Unable to send image - Status Code %s."), resp.status
+                    )
 
     @register_event(File)
     async def send_file(self, file_event):
@@ -445,12 +447,14 @@ class ConnectorTelegram(Connector):
             content_type="multipart/form-data",
         )
 
-        async with aiohttp.ClientSession() as session:
-            resp = await session.post(self.build_url("sendDocument"), data=data)
-            if resp.status == 200:
-                _LOGGER.debug(_("Sent %s file successfully."), file_event.name)
-            else:
-                _LOGGER.debug(_("Unable to send file - Status Code %s."), resp.status)
+        async with client_session(self.opsdroid, trust_env=False) as session:
+            async with session.post(self.build_url("sendDocument"), data=data) as resp:
+                if resp.status == 200:
+                    _LOGGER.debug(_("Sent %s file successfully."), file_event.name)
+                else:
+                    _LOGGER.debug(
+                        _("Unable to send file - Status Code %s."), resp.status
+                    )
 
     async def disconnect(self):
         """Delete active webhook.
@@ -460,10 +464,9 @@ class ConnectorTelegram(Connector):
 
         """
         _LOGGER.debug(_("Sending deleteWebhook request to Telegram..."))
-        async with aiohttp.ClientSession() as session:
-            resp = await session.get(self.build_url("deleteWebhook"))
-
-            if resp.status == 200:
-                _LOGGER.debug(_("Telegram webhook deleted successfully."))
-            else:
-                _LOGGER.debug(_("Unable to delete webhook..."))
+        async with client_session(self.opsdroid, trust_env=False) as session:
+            async with session.get(self.build_url("deleteWebhook")) as resp:
+                if resp.status == 200:
+                    _LOGGER.debug(_("Telegram webhook deleted successfully."))
+                else:
+                    _LOGGER.debug(_("Unable to delete webhook..."))
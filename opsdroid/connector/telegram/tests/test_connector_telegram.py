@@ -1,5 +1,4 @@
 import logging
-import asyncio
 import pytest
 import asynctest.mock as amock
 
@@ -260,12 +259,11 @@ async def test_connect(opsdroid):
     response.status = 200
 
     with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
+        "aiohttp.ClientSession.post"
     ) as patched_request, amock.patch.object(
         connector, "build_url"
     ) as mocked_build_url:
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
+        patched_request.return_value.__aenter__.return_value = response
 
         await connector.connect()
 
@@ -287,14 +285,14 @@ async def test_connect_failure(opsdroid, caplog):
     response = amock.Mock()
 
     response.status = 404
+    response.text = amock.CoroutineMock(return_value="Not Found")
 
     with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
+        "aiohttp.ClientSession.post"
     ) as patched_request, amock.patch.object(
         connector, "build_url"
     ) as mocked_build_url:
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
+        patched_request.return_value.__aenter__.return_value = response
 
         await connector.connect()
 
@@ -314,12 +312,11 @@ async def test_respond(opsdroid, caplog):
     response.status = 200
 
     with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
+        "aiohttp.ClientSession.post"
     ) as patched_request, amock.patch.object(
         connector, "build_url"
     ) as mocked_build_url:
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
+        patched_request.return_value.__aenter__.return_value = response
 
         assert opsdroid.__class__.instances
 
@@ -330,9 +327,6 @@ async def test_respond(opsdroid, caplog):
             connector=connector,
         )
 
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
-
         await test_message.respond("Response")
 
         assert patched_request.called
@@ -351,12 +345,11 @@ async def test_respond_failure(opsdroid, caplog):
     response.status = 500
 
     with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
+        "aiohttp.ClientSession.post"
     ) as patched_request, amock.patch.object(
         connector, "build_url"
     ) as mocked_build_url:
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
+        patched_request.return_value.__aenter__.return_value = response
 
         assert opsdroid.__class__.instances
 
@@ -367,9 +360,6 @@ async def test_respond_failure(opsdroid, caplog):
             connector=connector,
         )
 
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
-
         await test_message.respond("Response")
 
         assert patched_request.called
@@ -395,13 +385,12 @@ async def test_respond_image(opsdroid, caplog):
     image = opsdroid_events.Image(file_bytes=gif_bytes, target={"id": "123"})
 
     with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
+        "aiohttp.ClientSession.post"
     ) as patched_request, amock.patch.object(
         connector, "build_url"
     ) as mocked_build_url:
 
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(post_response)
+        patched_request.return_value.__aenter__.return_value = post_response
 
         await connector.send_image(image)
 
@@ -427,13 +416,12 @@ async def test_respond_image_failure(opsdroid, caplog):
     image = opsdroid_events.Image(file_bytes=gif_bytes, target={"id": "123"})
 
     with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
+        "aiohttp.ClientSession.post"
     ) as patched_request, amock.patch.object(
         connector, "build_url"
     ) as mocked_build_url:
 
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(post_response)
+        patched_request.return_value.__aenter__.return_value = post_response
 
         await connector.send_image(image)
 
@@ -456,13 +444,12 @@ async def test_respond_file(opsdroid, caplog):
     file = opsdroid_events.File(file_bytes=file_bytes, target={"id": "123"})
 
     with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
+        "aiohttp.ClientSession.post"
     ) as patched_request, amock.patch.object(
         connector, "build_url"
     ) as mocked_build_url:
 
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(post_response)
+        patched_request.return_value.__aenter__.return_value = post_response
 
         await connector.send_file(file)
 
@@ -485,13 +472,12 @@ async def test_respond_file_failure(opsdroid, caplog):
     file = opsdroid_events.File(file_bytes=file_bytes, target={"id": "123"})
 
     with amock.patch(
-        "aiohttp.ClientSession.post", new=amock.CoroutineMock()
+        "aiohttp.ClientSession.post"
     ) as patched_request, amock.patch.object(
         connector, "build_url"
     ) as mocked_build_url:
 
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(post_response)
+        patched_request.return_value.__aenter__.return_value = post_response
 
         await connector.send_file(file)
 
@@ -510,13 +496,12 @@ async def test_disconnect_successful(opsdroid, caplog):
     response.status = 200
 
     with amock.patch(
-        "aiohttp.ClientSession.get", new=amock.CoroutineMock()
+        "aiohttp.ClientSession.get"
     ) as patched_request, amock.patch.object(
         connector, "build_url"
     ) as mocked_build_url:
 
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
+        patched_request.return_value.__aenter__.return_value = response
 
         await connector.disconnect()
 
@@ -536,13 +521,12 @@ async def test_disconnect_failure(opsdroid, caplog):
     response.status = 400
 
     with amock.patch(
-        "aiohttp.ClientSession.get", new=amock.CoroutineMock()
+        "aiohttp.ClientSession.get"
     ) as patched_request, amock.patch.object(
         connector, "build_url"
     ) as mocked_build_url:
 
-        patched_request.return_value = asyncio.Future()
-        patched_request.return_value.set_result(response)
+        patched_request.return_value.__aenter__.return_value = response
 
         await connector.disconnect()
 
@@ -20,6 +20,7 @@ from opsdroid.const import (
     TWITCH_WEBHOOK_ENDPOINT,
 )
 from opsdroid.events import BanUser, DeleteMessage, JoinRoom, LeaveRoom, Message
+from opsdroid.sessions import client_session
 
 from . import events as twitch_event
 
@@ -120,7 +121,7 @@ class ConnectorTwitch(Connector):
             oauth token probably expired.
 
         """
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.opsdroid, trust_env=False) as session:
             response = await session.get(
                 f"{TWITCH_API_ENDPOINT}/users",
                 headers={"Authorization": f"Bearer {token}", "Client-ID": client_id},
@@ -180,7 +181,7 @@ class ConnectorTwitch(Connector):
         change with each refresh.
 
         """
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.opsdroid, trust_env=False) as session:
 
             params = {
                 "client_id": self.client_id,
@@ -211,7 +212,7 @@ class ConnectorTwitch(Connector):
         _LOGGER.warning(_("Oauth token expired, attempting to refresh token."))
         refresh_token = self.get_authorization_data()
 
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.opsdroid, trust_env=False) as session:
 
             params = {
                 "client_id": self.client_id,
@@ -279,6 +280,7 @@ class ConnectorTwitch(Connector):
         """
         _LOGGER.info(_("Connecting to Twitch IRC Server."))
 
+        # The websocket stays open, so it gets its own connection.
         async with aiohttp.ClientSession() as session:
             async with session.ws_connect(
                 f"{self.server}:{self.port}", heartbeat=600
@@ -324,7 +326,7 @@ class ConnectorTwitch(Connector):
 
         headers = {"Client-ID": self.client_id, "Authorization": f"Bearer {self.token}"}
 
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.opsdroid, trust_env=False) as session:
 
             payload = {
                 "hub.callback": f"{self.base_url}/connector/{self.name}",
@@ -681,7 +683,7 @@ class ConnectorTwitch(Connector):
         request.
 
         """
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.opsdroid, trust_env=False) as session:
             headers = {
                 "Client-ID": self.client_id,
                 "Authorization": f"Bearer {self.token}",
@@ -720,7 +722,7 @@ class ConnectorTwitch(Connector):
             event (twitch.events.UpdateTitle): opsdroid event containing ``status`` (your title).
 
         """
-        async with aiohttp.ClientSession() as session:
+        async with client_session(self.opsdroid, trust_env=False) as session:
             headers = {
                 "client-id": self.client_id,
                 "Authorization": f"Bearer {self.token}",
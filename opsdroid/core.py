@@ -9,6 +9,7 @@ import logging
 import os
 import signal
 import sys
+import time
 import warnings
 import weakref
 
@@ -19,14 +20,17 @@ from opsdroid.configuration import load_config_file
 from opsdroid.connector import Connector
 from opsdroid.const import DEFAULT_CONFIG_LOCATIONS
 from opsdroid.database import Database, InMemoryDatabase
+from opsdroid.dispatcher import Dispatcher
 from opsdroid.helper import get_parser_config
 from opsdroid.loader import Loader
 from opsdroid.memory import Memory
+from opsdroid.metrics import Metrics
 from opsdroid.parsers.always import parse_always
 from opsdroid.parsers.catchall import parse_catchall
 from opsdroid.parsers.crontab import parse_crontab
 from opsdroid.parsers.dialogflow import parse_dialogflow
 from opsdroid.parsers.event_type import parse_event_type
+from opsdroid.parsers.index import MatcherIndex, SkillList
 from opsdroid.parsers.luisai import parse_luisai
 from opsdroid.parsers.parseformat import parse_format
 from opsdroid.parsers.rasanlu import (
@@ -38,7 +42,9 @@ from opsdroid.parsers.regex import parse_regex
 from opsdroid.parsers.sapcai import parse_sapcai
 from opsdroid.parsers.watson import parse_watson
 from opsdroid.parsers.witai import parse_witai
+from opsdroid.sessions import ClientSessions
 from opsdroid.skill import Skill
+from opsdroid.tracing import Tracer
 from opsdroid.web import Web
 
 _LOGGER = logging.getLogger(__name__)
@@ -69,7 +75,8 @@ class OpsDroid:
             )
             self.eventloop.set_exception_handler(self.handle_async_exception)
         self.skills = []
-        self.memory = Memory()
+        self.matcher_index = MatcherIndex(self)
+        self.skill_signatures = {}
         self.modules = {}
         self.loader = Loader(self)
         self.config_path = config_path if config_path else DEFAULT_CONFIG_LOCATIONS
@@ -77,16 +84,23 @@ class OpsDroid:
             self.config = {}
         else:
             self.config = config
+        self.memory = Memory(self.config.get("memory"))
+        self.http = ClientSessions(self.config.get("http"))
         self.stats = {
             "messages_parsed": 0,
             "webhooks_called": 0,
             "total_response_time": 0,
             "total_responses": 0,
+            "skills_timed_out": 0,
+            "skills_cancelled": 0,
         }
+        self.metrics = Metrics()
+        self.tracer = Tracer(self.config.get("tracing"))
         self.web_server = None
         self.stored_path = []
         self.reload_paths = []
         self.tasks = []
+        self.dispatcher = Dispatcher(self)
 
     def __enter__(self):
         """Add self to existing instances."""
@@ -159,6 +173,15 @@ class OpsDroid:
                 warnings.warn("Caught exception", stacklevel=2, source=e)
         warnings.warn(context, stacklevel=2)
 
+    @property
+    def skills(self):
+        """SkillList: The registered skills."""
+        return self._skills
+
+    @skills.setter
+    def skills(self, skills):
+        self._skills = SkillList(skills)
+
     def is_running(self):
         """Check whether opsdroid is running."""
         return self._running
@@ -193,6 +216,7 @@ class OpsDroid:
             self.critical(_("No skills in configuration, at least 1 required"), 1)
 
         await self.start_databases()
+        self.dispatcher.start()
         await self.start_connectors()
         self.create_task(self.watch_paths())
         self.create_task(parse_crontab(self))
@@ -227,6 +251,10 @@ class OpsDroid:
         """Load modules."""
         if config is not None:
             self.config = config
+        self.tracer.close()
+        self.tracer = Tracer(self.config.get("tracing"))
+        self.memory.configure(self.config.get("memory"))
+        self.http.configure(self.config.get("http"))
         self.modules = self.loader.load_modules_from_config(self.config)
         _LOGGER.debug(_("Loaded %i skills."), len(self.modules["skills"] or []))
         self.web_server = Web(self)
@@ -245,6 +273,9 @@ class OpsDroid:
             await connector.disconnect()
             _LOGGER.info(_("Stopped connector %s."), connector.name)
 
+        await self.dispatcher.stop()
+
+        await self.memory.flush()
         for database in self.memory.databases[:]:
             _LOGGER.info(_("Stopping database %s..."), database.name)
             await database.disconnect()
@@ -254,6 +285,9 @@ class OpsDroid:
         await self.web_server.stop()
         _LOGGER.info(_("Stopped web server."))
 
+        await self.http.close()
+        self.tracer.close()
+
         _LOGGER.info(_("Stopping pending tasks..."))
         for task in self.tasks:
             if not task.done() and task is not asyncio.current_task():
@@ -263,6 +297,8 @@ class OpsDroid:
     async def unload(self, future=None, unload_server=True):
         """Stop the event loop."""
         self.skills = []
+        self.matcher_index.build()
+        self.skill_signatures = {}
         self.connectors = []
         self.memory.databases = []
         if unload_server:
@@ -290,6 +326,7 @@ class OpsDroid:
         if not skills:
             return
 
+        self.matcher_index.build()
         for skill in skills:
             for func in skill["module"].__dict__.values():
                 if isinstance(func, type) and issubclass(func, Skill) and func != Skill:
@@ -324,6 +361,30 @@ class OpsDroid:
         if config is not None:
             skill.config = config
         self.skills.append(skill)
+        self.matcher_index.add(skill)
+        if inspect.isroutine(skill):
+            self._get_skill_signature(skill)
+
+    def _get_skill_signature(self, skill):
+        """Return whether a skill takes opsdroid and its config as well as the event.
+
+        Inspecting a skill is slow compared to calling it, so the result is
+        stored in ``skill_signatures`` the first time a skill is seen.
+
+        Args:
+            skill: The skill to inspect.
+
+        Returns:
+            bool: True if the skill should be called with opsdroid, config and
+                event, False if it should only be called with the event.
+
+        """
+        try:
+            return self.skill_signatures[skill]
+        except KeyError:
+            takes_all = len(inspect.signature(skill).parameters) > 1
+            self.skill_signatures[skill] = takes_all
+            return takes_all
 
     async def watch_paths(self):
         """Watch locally installed skill paths for file changes and reload on change.
@@ -461,7 +522,13 @@ class OpsDroid:
         """Execute a skill.
 
         Attempts to run the skill parsed and provides other arguments to the skill if necessary.
-        Also handles the exception encountered if th e
+        Also handles the exception encountered if the skill fails or runs for
+        longer than its timeout.
+
+        The timeout in seconds is taken from the ``timeout`` option in the
+        config of the skill, falling back to the top level ``skill-timeout``
+        option. A skill which runs for longer is cancelled and handled like a
+        skill which raised an exception.
 
         Args:
             skill: name of the skill to be run.
@@ -469,24 +536,93 @@ class OpsDroid:
             event: Message/event to be parsed to the chat service.
 
         """
-        # pylint: disable=broad-except
-        # We want to catch all exceptions coming from a skill module and not
-        # halt the application. If a skill throws an exception it just doesn't
-        # give a response to the user, so an error response should be given.
-        try:
-            if len(inspect.signature(skill).parameters.keys()) > 1:
-                return await skill(self, config, event)
-            else:
-                return await skill(event)
-        except Exception:
-            _LOGGER.exception(
-                _("Exception when running skill '%s'."), str(config["name"])
-            )
-            if event:
-                await event.respond(
-                    events.Message(_("Whoops there has been an error."))
+        name = (config or {}).get("name")
+        timeout = (config or {}).get("timeout", self.config.get("skill-timeout"))
+        start = time.monotonic()
+        with self.tracer.span("skill", skill=str(name)) as span:
+            # pylint: disable=broad-except
+            # We want to catch all exceptions coming from a skill module and not
+            # halt the application. If a skill throws an exception it just doesn't
+            # give a response to the user, so an error response should be given.
+            try:
+                if self._get_skill_signature(skill):
+                    coro = skill(self, config, event)
+                else:
+                    coro = skill(event)
+                return await asyncio.wait_for(coro, timeout=timeout)
+            except asyncio.CancelledError:
+                self.stats["skills_cancelled"] += 1
+                _LOGGER.warning(_("Skill '%s' was cancelled."), name)
+                raise
+            except Exception as error:
+                self.metrics.skill_errors.inc(str(name))
+                if span is not None:
+                    span.record_error(error)
+                if (
+                    isinstance(error, asyncio.TimeoutError)
+                    and timeout is not None
+                    and time.monotonic() - start >= timeout
+                ):
+                    self.stats["skills_timed_out"] += 1
+                    _LOGGER.error(
+                        _("Skill '%s' timed out after %s seconds and was cancelled."),
+                        name,
+                        timeout,
+                    )
+                else:
+                    _LOGGER.exception(_("Exception when running skill '%s'."), name)
+                if event:
+                    await event.respond(
+                        events.Message(_("Whoops there has been an error."))
+                    )
+                    await event.respond(events.Message(_("Check the log for details.")))
+            finally:
+                self.metrics.skill_duration.observe(time.monotonic() - start, str(name))
+
+    async def _run_parser(self, name, parser, skills, message, config):
+        """Run an NLU parser, dropping it from ranking if it is slow or fails.
+
+        Args:
+            name (string): Name of the parser, used for logging.
+            parser: The parse coroutine function for this parser.
+            skills (list): List of skills to match against.
+            message (opsdroid.events.Message): The message being parsed.
+            config (dict): The config of the parser. If it contains a
+                ``timeout`` in seconds the parser will be cancelled when it
+                runs for longer than that.
+
+        Returns:
+            list: The skills matched by the parser, or an empty list if the
+                parser timed out or raised an exception.
+
+        """
+        timeout = config.get("timeout")
+        start = time.monotonic()
+        with self.tracer.span("parser." + name) as span:
+            # pylint: disable=broad-except
+            # A parser failing should not stop the other parsers from ranking.
+            try:
+                matched_skills = await asyncio.wait_for(
+                    parser(self, skills, message, config), timeout=timeout
                 )
-                await event.respond(events.Message(_("Check the log for details.")))
+            except asyncio.TimeoutError as error:
+                _LOGGER.warning(
+                    _("Parser %s timed out after %s seconds and was skipped."),
+                    name,
+                    timeout,
+                )
+                if span is not None:
+                    span.record_error(error)
+                return []
+            except Exception as error:
+                _LOGGER.exception(_("Exception when running parser %s."), name)
+                if span is not None:
+                    span.record_error(error)
+                return []
+            finally:
+                self.metrics.parse_duration.observe(time.monotonic() - start, name)
+        _LOGGER.debug(_("Parser %s took %.3f seconds."), name, time.monotonic() - start)
+        return matched_skills or []
 
     async def get_ranked_skills(self, skills, message):
         """Take a message and return a ranked list of matching skills.
@@ -501,44 +637,39 @@ class OpsDroid:
         """
         ranked_skills = []
         if isinstance(message, events.Message):
-            ranked_skills += await parse_regex(self, skills, message)
-            ranked_skills += await parse_format(self, skills, message)
+            start = time.monotonic()
+            with self.tracer.span("regex"):
+                ranked_skills += await parse_regex(self, skills, message)
+            regex_done = time.monotonic()
+            with self.tracer.span("parse_format"):
+                ranked_skills += await parse_format(self, skills, message)
+            self.metrics.parse_duration.observe(regex_done - start, "regex")
+            self.metrics.parse_duration.observe(
+                time.monotonic() - regex_done, "parse_format"
+            )
 
         if "parsers" in self.modules:
             _LOGGER.debug(_("Processing parsers..."))
             parsers = self.modules.get("parsers", {})
 
-            dialogflow = get_parser_config("dialogflow", parsers)
-            if dialogflow and dialogflow["enabled"]:
-                _LOGGER.debug(_("Checking dialogflow..."))
-                ranked_skills += await parse_dialogflow(
-                    self, skills, message, dialogflow
-                )
-
-            luisai = get_parser_config("luisai", parsers)
-            if luisai and luisai["enabled"]:
-                _LOGGER.debug(_("Checking luisai..."))
-                ranked_skills += await parse_luisai(self, skills, message, luisai)
-
-            sapcai = get_parser_config("sapcai", parsers)
-            if sapcai and sapcai["enabled"]:
-                _LOGGER.debug(_("Checking SAPCAI..."))
-                ranked_skills += await parse_sapcai(self, skills, message, sapcai)
-
-            witai = get_parser_config("witai", parsers)
-            if witai and witai["enabled"]:
-                _LOGGER.debug(_("Checking wit.ai..."))
-                ranked_skills += await parse_witai(self, skills, message, witai)
+            nlu_parsers = []
+            for name, parser in (
+                ("dialogflow", parse_dialogflow),
+                ("luisai", parse_luisai),
+                ("sapcai", parse_sapcai),
+                ("witai", parse_witai),
+                ("watson", parse_watson),
+                ("rasanlu", parse_rasanlu),
+            ):
+                config = get_parser_config(name, parsers)
+                if config and config["enabled"]:
+                    _LOGGER.debug(_("Checking %s..."), name)
+                    nlu_parsers.append(
+                        self._run_parser(name, parser, skills, message, config)
+                    )
 
-            watson = get_parser_config("watson", parsers)
-            if watson and watson["enabled"]:
-                _LOGGER.debug(_("Checking IBM Watson..."))
-                ranked_skills += await parse_watson(self, skills, message, watson)
-
-            rasanlu = get_parser_config("rasanlu", parsers)
-            if rasanlu and rasanlu["enabled"]:
-                _LOGGER.debug(_("Checking Rasa NLU..."))
-                ranked_skills += await parse_rasanlu(self, skills, message, rasanlu)
+            for result in await asyncio.gather(*nlu_parsers):
+                ranked_skills += result
 
         return sorted(ranked_skills, key=lambda k: k["score"], reverse=True)
 
@@ -615,17 +746,54 @@ class OpsDroid:
             list: A list of the skills which were not constrained.
 
         """
-        return [
-            skill
-            for skill in skills
-            if all(constraint(message) for constraint in skill.constraints)
-        ]
+        start = time.monotonic()
+        with self.tracer.span("constraints"):
+            unconstrained = [
+                skill
+                for skill in skills
+                if all(constraint(message) for constraint in skill.constraints)
+            ]
+        self.metrics.parse_duration.observe(time.monotonic() - start, "constraints")
+        return unconstrained
 
     async def parse(self, event):
-        """Parse a string against all skills.
+        """Parse an event against all skills.
+
+        If the ``dispatch`` section is configured and opsdroid is running the
+        event is put on the dispatch queue and parsed by a worker, otherwise
+        it is parsed straight away.
 
         Args:
-            event (String): The string to parsed against all available skills.
+            event (opsdroid.events.Event): The event to parse against all
+                available skills.
+
+        Returns:
+            tasks (list): Task that tells the skill which best matches the parsed event.
+                Empty if the event was queued.
+
+        """
+        connector = getattr(event.connector, "name", "") or ""
+        self.metrics.events_received.inc(connector, type(event).__name__)
+        event.span = self.tracer.start_span(
+            "event", connector=connector, event_type=type(event).__name__
+        )
+        if self.dispatcher.running:
+            if not await self.dispatcher.submit(event) and event.span is not None:
+                event.span.set_attribute("dropped", True)
+                event.span.end()
+            return []
+        try:
+            return await self.parse_event(event)
+        finally:
+            if event.span is not None:
+                event.span.end()
+
+    async def parse_event(self, event):
+        """Parse an event against all skills straight away.
+
+        Args:
+            event (opsdroid.events.Event): The event to parse against all
+                available skills.
 
         Returns:
             tasks (list): Task that tells the skill which best matches the parsed event.
@@ -633,26 +801,29 @@ class OpsDroid:
         """
         self.stats["messages_parsed"] = self.stats["messages_parsed"] + 1
         tasks = []
-        tasks.append(self.eventloop.create_task(parse_always(self, event)))
-        tasks.append(self.eventloop.create_task(parse_event_type(self, event)))
-        if isinstance(event, events.Message):
-            _LOGGER.debug(_("Parsing input: %s."), event)
-
-            unconstrained_skills = await self._constrain_skills(self.skills, event)
-            ranked_skills = await self.get_ranked_skills(unconstrained_skills, event)
-            if ranked_skills:
-                tasks.append(
-                    self.eventloop.create_task(
-                        self.run_skill(
-                            ranked_skills[0]["skill"],
-                            ranked_skills[0]["config"],
-                            ranked_skills[0]["message"],
+        with self.tracer.span("parse", parent=getattr(event, "span", None)):
+            tasks.append(self.eventloop.create_task(parse_always(self, event)))
+            tasks.append(self.eventloop.create_task(parse_event_type(self, event)))
+            if isinstance(event, events.Message):
+                _LOGGER.debug(_("Parsing input: %s."), event)
+
+                unconstrained_skills = await self._constrain_skills(self.skills, event)
+                ranked_skills = await self.get_ranked_skills(
+                    unconstrained_skills, event
+                )
+                if ranked_skills:
+                    tasks.append(
+                        self.eventloop.create_task(
+                            self.run_skill(
+                                ranked_skills[0]["skill"],
+                                ranked_skills[0]["config"],
+                                ranked_skills[0]["message"],
+                            )
                         )
                     )
-                )
-        if len(tasks) == 2:  # no other skills ran other than 2 default ones
-            tasks.append(self.eventloop.create_task(parse_catchall(self, event)))
-        await asyncio.gather(*tasks)
+            if len(tasks) == 2:  # no other skills ran other than 2 default ones
+                tasks.append(self.eventloop.create_task(parse_catchall(self, event)))
+            await asyncio.gather(*tasks)
 
         return tasks
 
@@ -674,4 +845,13 @@ class OpsDroid:
         if not event.connector:
             event.connector = self.default_connector
 
-        return await event.connector.send(event)
+        start = time.monotonic()
+        try:
+            with self.tracer.span(
+                "send", connector=getattr(event.connector, "name", "")
+            ):
+                return await event.connector.send(event)
+        finally:
+            self.metrics.send_duration.observe(
+                time.monotonic() - start, getattr(event.connector, "name", "")
+            )
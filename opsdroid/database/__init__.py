@@ -1,4 +1,16 @@
 """A base class for databases to inherit from."""
+import asyncio
+import heapq
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# The number of keys fetched at once when iterating over keys.
+DEFAULT_PAGE_SIZE = 100
+# How often expired keys are removed, in seconds, and how many at a time.
+DEFAULT_REAP_INTERVAL = 60
+DEFAULT_REAP_BATCH_SIZE = 500
 
 
 class Database:
@@ -6,8 +18,17 @@ class Database:
 
     Database classes are used to persist key/value pairs in a database.
 
+    Attributes:
+        supports_ttl (bool): Whether `Database.put` and `Database.put_many`
+            accept a ``ttl`` after which the keys expire. Databases which set
+            this must never return an expired key.
+
     """
 
+    supports_ttl = False
+    reap_interval = DEFAULT_REAP_INTERVAL
+    reap_batch_size = DEFAULT_REAP_BATCH_SIZE
+
     def __init__(self, config, opsdroid=None):
         """Create the database.
 
@@ -27,6 +48,7 @@ class Database:
         self.opsdroid = opsdroid
         self.client = None
         self.database = None
+        self.reaper = None
 
     async def connect(self):
         """Connect to database service and store the connection object.
@@ -54,6 +76,10 @@ class Database:
         suits the database being used and allows for reconstruction of the
         object.
 
+        Databases which set ``supports_ttl`` also take a ``ttl`` argument,
+        the number of seconds after which the key expires, which is None to
+        keep the key forever.
+
         Args:
             key (string): The key to store the data object under.
             data (object): The data object to store.
@@ -90,24 +116,215 @@ class Database:
         """
         raise NotImplementedError
 
+    async def get_many(self, keys):
+        """Return the data objects for several keys.
+
+        This calls `Database.get` for each key in turn. Databases which can
+        look up several keys with one query should override it.
+
+        Args:
+            keys (list): The keys to lookup in the database.
+
+        Returns:
+            dict: The data object stored for each key which was found.
+
+        """
+        results = {}
+        for key in keys:
+            data = await self.get(key)
+            if data is not None:
+                results[key] = data
+        return results
+
+    async def put_many(self, items, ttl=None):
+        """Store several data objects in the database.
+
+        This calls `Database.put` for each key in turn. Databases which can
+        store several keys with one query should override it.
+
+        Args:
+            items (dict): The data objects to store, by key.
+            ttl (float, optional): How long to keep the keys for in seconds,
+                only given to databases which set ``supports_ttl``.
+
+        """
+        for key, data in items.items():
+            if ttl is None:
+                await self.put(key, data)
+            else:
+                await self.put(key, data, ttl)
+
+    async def delete_many(self, keys):
+        """Delete the data objects for several keys.
+
+        This calls `Database.delete` for each key in turn. Databases which
+        can delete several keys with one query should override it.
+
+        Args:
+            keys (list): The keys to delete in the database.
+
+        """
+        for key in keys:
+            await self.delete(key)
+
+    async def iter_keys(self, prefix="", page_size=DEFAULT_PAGE_SIZE):
+        """Iterate over the keys in the database which start with a prefix.
+
+        Keys should be fetched from the database in pages of ``page_size``
+        rather than all at once, so that iterating over a large database
+        doesn't load all of its keys into memory. Keys which are put or
+        deleted during the iteration may or may not be included.
+
+        Args:
+            prefix (string): Only yield keys which start with this.
+            page_size (int): How many keys to fetch from the database at once.
+
+        Yields:
+            string: Each matching key.
+
+        """
+        raise NotImplementedError
+        yield  # pragma: nocover, makes this an async generator
+
+    async def reap_expired(self, limit):
+        """Remove keys which have expired from the database.
+
+        Databases which store an expiry time with keys, rather than having
+        the database expire them, should override this to delete at most
+        ``limit`` expired keys.
+
+        Args:
+            limit (int): The most keys to delete.
+
+        Returns:
+            int: The number of keys deleted.
+
+        """
+        return 0
+
+    def start_reaper(self):
+        """Start removing expired keys every ``reap_interval`` seconds."""
+        if self.reaper is None or self.reaper.done():
+            self.reaper = asyncio.ensure_future(self._reap_periodically())
+
+    async def stop_reaper(self):
+        """Stop removing expired keys."""
+        if self.reaper is not None:
+            self.reaper.cancel()
+            await asyncio.gather(self.reaper, return_exceptions=True)
+            self.reaper = None
+
+    async def _reap_periodically(self):
+        """Remove expired keys in batches of ``reap_batch_size``.
+
+        Other tasks get to run between each batch, so removing a lot of
+        expired keys doesn't hold up the event loop.
+
+        """
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            # pylint: disable=broad-except
+            # The reaper must keep running if the database has a problem.
+            try:
+                while (
+                    await self.reap_expired(self.reap_batch_size)
+                    >= self.reap_batch_size
+                ):
+                    await asyncio.sleep(0)
+            except Exception:
+                _LOGGER.exception(
+                    _("Unable to remove expired keys from %s."), self.name
+                )
+
 
 class InMemoryDatabase(Database):
-    """A simple in memory implementation of the database API."""
+    """A simple in memory implementation of the database API.
+
+    Keys put with a ``ttl`` are removed when they are next read after they
+    expire, or by the reaper which is started by the first of them.
+
+    """
+
+    supports_ttl = True
 
     def __init__(self, config={}, opsdroid=None):  # noqa: D107
         super().__init__(config, opsdroid)
         self.memory = {}
+        self.expiries = {}
+        self.deadlines = []
         self.name = "inmem"
 
     async def connect(self):  # noqa: D102
         pass  # pragma: nocover
 
+    async def disconnect(self):  # noqa: D102
+        await self.stop_reaper()
+
     async def get(self, key):  # noqa: D102
+        if self._expired(key):
+            self._remove(key)
         return self.memory.get(key)
 
-    async def put(self, key, value):  # noqa: D102
+    async def put(self, key, value, ttl=None):  # noqa: D102
         self.memory[key] = value
+        self._set_expiry(key, ttl)
 
     async def delete(self, key):  # noqa: D102
-        if key in self.memory:
-            del self.memory[key]
+        self._remove(key)
+
+    async def get_many(self, keys):  # noqa: D102
+        return {
+            key: self.memory[key]
+            for key in keys
+            if key in self.memory and not self._expired(key)
+        }
+
+    async def put_many(self, items, ttl=None):  # noqa: D102
+        self.memory.update(items)
+        for key in items:
+            self._set_expiry(key, ttl)
+
+    async def delete_many(self, keys):  # noqa: D102
+        for key in keys:
+            self._remove(key)
+
+    async def iter_keys(self, prefix="", page_size=DEFAULT_PAGE_SIZE):  # noqa: D102
+        for key in list(self.memory):
+            if key.startswith(prefix) and not self._expired(key):
+                yield key
+
+    async def reap_expired(self, limit):  # noqa: D102
+        now = time.monotonic()
+        reaped = 0
+        while self.deadlines and self.deadlines[0][0] <= now and reaped < limit:
+            expires, key = heapq.heappop(self.deadlines)
+            # Keys which were put again since have a newer deadline.
+            if self.expiries.get(key) == expires:
+                self._remove(key)
+            reaped += 1
+        return reaped
+
+    def _expired(self, key):
+        """Return whether a key has a ttl which has passed."""
+        expires = self.expiries.get(key)
+        return expires is not None and expires <= time.monotonic()
+
+    def _set_expiry(self, key, ttl):
+        """Set or clear the time a key expires at."""
+        if ttl is None:
+            self.expiries.pop(key, None)
+            return
+        expires = time.monotonic() + ttl
+        self.expiries[key] = expires
+        heapq.heappush(self.deadlines, (expires, key))
+        if len(self.deadlines) > 2 * len(self.expiries):
+            # Most deadlines are out of date from keys being put again, so
+            # rebuild the heap from the current ones to keep it bounded.
+            self.deadlines = [(expires, key) for key, expires in self.expiries.items()]
+            heapq.heapify(self.deadlines)
+        self.start_reaper()
+
+    def _remove(self, key):
+        """Remove a key and its expiry."""
+        self.memory.pop(key, None)
+        self.expiries.pop(key, None)
@@ -1,5 +1,7 @@
 """Database that uses the matrix connector."""
 
+import asyncio
+import copy
 import logging
 from contextlib import contextmanager
 from wrapt import decorator
@@ -15,8 +17,12 @@ CONFIG_SCHEMA = {
     "default_room": str,
     "single_state_key": Any(bool, str),
     "should_encrypt": bool,
+    "write_delay": Any(int, float),
 }
 
+# Marks a key which has been deleted but not yet written to the room state.
+_DELETED = object()
+
 
 @decorator
 async def memory_in_event_room(func, instance, args, kwargs):
@@ -32,7 +38,18 @@ async def memory_in_event_room(func, instance, args, kwargs):
 
 
 class DatabaseMatrix(Database):
-    """A module for opsdroid to allow memory to persist in matrix room state."""
+    """A module for opsdroid to allow memory to persist in matrix room state.
+
+    The database state of the rooms opsdroid has joined is cached, and kept up
+    to date by the matrix connector from the state events it receives when it
+    syncs, so reads from those rooms don't need a request to the homeserver.
+
+    When ``write_delay`` is set, puts and deletes update the cache straight
+    away and are sent to the homeserver after that many seconds, so that all
+    the changes made to a state event within the delay are sent as a single
+    new state event.
+
+    """
 
     def __init__(self, config, opsdroid=None):
         """Start the database connection."""
@@ -43,6 +60,10 @@ class DatabaseMatrix(Database):
         self.should_encrypt = config.get("should_encrypt", True)
         self._event_type = "dev.opsdroid.database"
         self.should_migrate = True
+        self.write_delay = config.get("write_delay", 0)
+        self._state_cache = {}
+        self._pending = {}
+        self._flush_task = None
 
         _LOGGER.debug("Loaded matrix database connector.")
 
@@ -99,6 +120,160 @@ class DatabaseMatrix(Database):
 
         _LOGGER.info("Matrix Database connector initialised.")
 
+    async def disconnect(self):
+        """Send any changes which are still waiting for the write delay."""
+        await self.flush()
+
+    def _is_cached(self, room_id):
+        """Return whether the state of a room is kept up to date by sync."""
+        return room_id in self.connector.connection.rooms
+
+    @staticmethod
+    def _apply_changes(content, changes):
+        """Return the content of a state event with pending changes applied."""
+        content = dict(content)
+        for key, value in changes.items():
+            if value is _DELETED:
+                content.pop(key, None)
+            else:
+                content[key] = value
+        return content
+
+    async def _get_state(self, state_key):
+        """Get the database state event with the given state key.
+
+        The state is read from the cache, with any changes which haven't
+        been sent yet, if possible and requested from the homeserver
+        otherwise.
+
+        Returns:
+            The nio response with the content of the state event, or an
+            error response.
+
+        """
+        cache_key = (self.room_id, state_key)
+        if cache_key in self._pending:
+            base, changes = self._pending[cache_key]
+            return _CachedState(self._apply_changes(base, changes))
+        if cache_key in self._state_cache:
+            return _CachedState(self._state_cache[cache_key])
+
+        response = await self.connector.connection.room_get_state_event(
+            room_id=self.room_id, event_type=self._event_type, state_key=state_key
+        )
+        if (
+            not isinstance(response, RoomGetStateEventError)
+            and (
+                response.transport_response is None
+                or response.transport_response.status != 404
+            )
+            and self._is_cached(self.room_id)
+        ):
+            self._state_cache[cache_key] = copy.deepcopy(response.content)
+        return response
+
+    async def _set_state(self, state_key, content, changes):
+        """Write the content of a state event, or queue the changes to it.
+
+        Args:
+            state_key (str): The state key of the event.
+            content (dict): The new content of the event.
+            changes (dict): The values which have changed, by key, with
+                `_DELETED` for deleted keys.
+
+        """
+        cache_key = (self.room_id, state_key)
+        if not self.write_delay:
+            await self.opsdroid.send(
+                MatrixStateEvent(
+                    self._event_type,
+                    content=content,
+                    target=self.room_id,
+                    connector=self.connector,
+                    state_key=state_key,
+                )
+            )
+            if self._is_cached(self.room_id):
+                self._state_cache[cache_key] = copy.deepcopy(content)
+            return
+
+        base, pending_changes = self._pending.get(
+            cache_key, (self._state_cache.get(cache_key, content), {})
+        )
+        pending_changes.update(
+            (key, value if value is _DELETED else copy.deepcopy(value))
+            for key, value in changes.items()
+        )
+        self._pending[cache_key] = (base, pending_changes)
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_later(self):
+        """Send the queued changes once the write delay has passed."""
+        await asyncio.sleep(self.write_delay)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self):
+        """Send the changes which are waiting for the write delay.
+
+        Each state event with changes is sent once, however many times it
+        was changed.
+
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        pending, self._pending = self._pending, {}
+        for (room_id, state_key), (base, changes) in pending.items():
+            content = self._apply_changes(base, changes)
+            _LOGGER.debug(
+                f"Sending {len(changes)} changes to state key '{state_key}' in {room_id}."
+            )
+            # pylint: disable=broad-except
+            # The put has already returned, so the error can only be logged.
+            try:
+                await self.opsdroid.send(
+                    MatrixStateEvent(
+                        self._event_type,
+                        content=content,
+                        target=room_id,
+                        connector=self.connector,
+                        state_key=state_key,
+                    )
+                )
+            except Exception:
+                _LOGGER.exception(
+                    f"Error writing state key '{state_key}' in matrix room {room_id}."
+                )
+                self._state_cache.pop((room_id, state_key), None)
+                continue
+            if self._is_cached(room_id):
+                self._state_cache[(room_id, state_key)] = content
+
+    def update_state(self, room_id, event):
+        """Update the cache from a state event received by the connector.
+
+        Args:
+            room_id (str): The room the event was received in.
+            event (dict): The source of the state event.
+
+        """
+        if event.get("type") != self._event_type or "state_key" not in event:
+            return
+        cache_key = (room_id, event["state_key"])
+        if (
+            event.get("sender") == self.connector.mxid
+            and cache_key in self._state_cache
+        ):
+            # The cache already has the changes opsdroid made itself, and may
+            # have newer ones than this event.
+            return
+        content = copy.deepcopy(event.get("content") or {})
+        self._state_cache[cache_key] = content
+        if cache_key in self._pending:
+            self._pending[cache_key] = (content, self._pending[cache_key][1])
+
     async def put(self, key, value):
         """Insert or replace a value into the database for a given key."""
 
@@ -130,15 +305,7 @@ class DatabaseMatrix(Database):
 
         _LOGGER.debug(f"Putting {key} into matrix room {self.room_id} with {data}")
 
-        await self.opsdroid.send(
-            MatrixStateEvent(
-                self._event_type,
-                content=data,
-                target=self.room_id,
-                connector=self.connector,
-                state_key=state_key,
-            )
-        )
+        await self._set_state(state_key, data, {key: data[key]})
 
         return True
 
@@ -163,9 +330,7 @@ class DatabaseMatrix(Database):
             f"Getting {key} from matrix room {self.room_id} with state_key={state_key}."
         )
 
-        ori_data = await self.connector.connection.room_get_state_event(
-            room_id=self.room_id, event_type=self._event_type, state_key=state_key
-        )
+        ori_data = await self._get_state(state_key)
 
         if isinstance(ori_data, RoomGetStateEventError):
             if (
@@ -180,7 +345,7 @@ class DatabaseMatrix(Database):
                 f"Error getting {key} from matrix room {self.room_id}: {ori_data.message}({ori_data.status_code})"
             )
 
-        data = ori_data.content
+        data = copy.deepcopy(ori_data.content)
 
         if not data:
             return
@@ -212,7 +377,7 @@ class DatabaseMatrix(Database):
                 data[k] = resp.event.source["content"][k]
 
         if get_full:
-            return {**ori_data.content, **data}
+            return {**copy.deepcopy(ori_data.content), **data}
 
         return data[key]
 
@@ -232,9 +397,7 @@ class DatabaseMatrix(Database):
             "" if self._single_state_key is True else self._single_state_key or key
         )
 
-        data = await self.connector.connection.room_get_state_event(
-            room_id=self.room_id, event_type=self._event_type, state_key=state_key
-        )
+        data = await self._get_state(state_key)
         if isinstance(data, RoomGetStateEventError):
             _LOGGER.error(
                 f"Error deleting {key} from matrix room {self.room_id}: {data.message}({data.status_code})"
@@ -250,7 +413,7 @@ class DatabaseMatrix(Database):
             )
             return
 
-        data = data.content
+        data = copy.deepcopy(data.content)
 
         _LOGGER.debug(f"Got {data} from state event in room {self.room_id}.")
 
@@ -258,25 +421,19 @@ class DatabaseMatrix(Database):
             key = [key]
 
         return_value = []
+        changes = {}
         for k in key:  # key can be a list of keys to delete
             try:
                 return_value.append(data[k])
                 _LOGGER.debug(f"Deleting key '{k}' from database in {self.room_id}.")
                 del data[k]
+                changes[k] = _DELETED
             except KeyError:
                 _LOGGER.warning(
                     f"Unable to delete '{k}' from database in room {self.room_id} as it doesn't exist."
                 )
 
-        await self.opsdroid.send(
-            MatrixStateEvent(
-                self._event_type,
-                content=data,
-                target=self.room_id,
-                connector=self.connector,
-                state_key=state_key,
-            )
-        )
+        await self._set_state(state_key, data, changes)
 
         if not return_value:
             return None
@@ -292,3 +449,12 @@ class DatabaseMatrix(Database):
         self.room = room
         yield
         self.room = ori_room
+
+
+class _CachedState:
+    """The cached content of a state event, in place of a nio response."""
+
+    transport_response = None
+
+    def __init__(self, content):
+        self.content = content
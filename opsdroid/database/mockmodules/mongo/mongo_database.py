@@ -1,5 +1,25 @@
 """A mocked database module."""
 
+import re
+
+
+class AsyncCursorMock:
+    """The mocked cursor returned by find."""
+
+    def __init__(self, documents):
+        """Start the class."""
+        self.documents = list(documents)
+
+    def __aiter__(self):
+        """Iterate over the documents."""
+        return self
+
+    async def __anext__(self):
+        """Return the next document."""
+        if not self.documents:
+            raise StopAsyncIteration
+        return self.documents.pop(0)
+
 
 class DatabaseMongoCollectionMock:
     """The mocked database mongo class."""
@@ -9,24 +29,64 @@ class DatabaseMongoCollectionMock:
         self.config = config
         self.dummy_doc = {}
         self.valid_response = {"_id": 123, "key": "456", "value": "789"}
+        self.requests = []
+        self.writes = []
+        self.indexes = []
+
+    async def create_index(self, key, **kwargs):
+        """Mock method create_index.
+
+        Args: key(str) recorded for test
+        """
+        self.indexes.append((key, kwargs))
 
-    async def find_one(self, key):
+    async def find_one(self, key, **kwargs):
         """Mock method find_one.
 
         Args: key(object) not considered for test
         """
-        return self.valid_response
+        return dict(self.valid_response)
 
     async def update_one(self, key, update, **kwargs):
         """Mock method update_one.
 
-        Args: key(object) not considered for test
+        Args: key(object) recorded for test
         """
+        self.writes.append(key)
         return self.dummy_doc
 
     async def delete_one(self, key):
         """Mock method delete_one.
 
-        Args: key(object) not considered for test
+        Args: key(object) recorded for test
+        """
+        self.writes.append(key)
+        return self.dummy_doc
+
+    def find(self, query, **kwargs):
+        """Mock method find.
+
+        Args: query(object) only ``$in`` and ``$regex`` queries on the key are
+            considered
+        """
+        self.find_kwargs = kwargs
+        if "$regex" in query["key"]:
+            found = re.match(query["key"]["$regex"], self.valid_response["key"])
+        else:
+            found = self.valid_response["key"] in query["key"]["$in"]
+        return AsyncCursorMock([dict(self.valid_response)] if found else [])
+
+    async def bulk_write(self, requests, **kwargs):
+        """Mock method bulk_write.
+
+        Args: requests(list) recorded for test
+        """
+        self.requests.extend(requests)
+        return self.dummy_doc
+
+    async def delete_many(self, query):
+        """Mock method delete_many.
+
+        Args: query(object) not considered for test
         """
         return self.dummy_doc
@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 """A module for opsdroid to allow persist in mongo database."""
+import asyncio
+import copy
 import logging
+import re
 from contextlib import asynccontextmanager
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import DeleteOne, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
 from voluptuous import Any
 
-from opsdroid.database import Database
+from opsdroid.database import DEFAULT_PAGE_SIZE, Database
 
 _LOGGER = logging.getLogger(__name__)
 CONFIG_SCHEMA = {
@@ -15,11 +20,20 @@ CONFIG_SCHEMA = {
     "user": str,
     "password": str,
     "collection": str,
+    "protocol": str,
+    "pool-size": int,
+    "auto-batch": bool,
 }
 
 
 class DatabaseMongo(Database):
-    """A module for opsdroid to allow memory to persist in a mongo database."""
+    """A module for opsdroid to allow memory to persist in a mongo database.
+
+    Documents are looked up by their ``key`` field, which has a unique index.
+    Puts and deletes which are made at the same time are sent to MongoDB
+    together in one bulk write, unless ``auto-batch`` is turned off.
+
+    """
 
     def __init__(self, config, opsdroid=None):
         """Create the connection.
@@ -40,6 +54,11 @@ class DatabaseMongo(Database):
         self.client = None
         self.database = None
         self.collection = config.get("collection", "opsdroid")
+        self.pool_size = config.get("pool-size", 100)
+        self.auto_batch = config.get("auto-batch", True)
+        # Shared with the views returned by memory_in_collection.
+        self.indexed = set()
+        self.queued = {}
 
     async def connect(self):
         """Connect to the database."""
@@ -55,10 +74,37 @@ class DatabaseMongo(Database):
             self.db_url = f"{protocol}://{user}:{pwd}@{host}"
         else:
             self.db_url = f"{protocol}://{host}"
-        self.client = AsyncIOMotorClient(self.db_url)
+        self.client = AsyncIOMotorClient(self.db_url, maxPoolSize=self.pool_size)
         self.database = self.client[database]
+        await self.ensure_index()
         _LOGGER.info("Connected to MongoDB.")
 
+    async def disconnect(self):
+        """Disconnect from the database."""
+        if self.client:
+            self.client.close()
+
+    async def ensure_index(self):
+        """Create a unique index on the key of the documents in the collection.
+
+        If the collection already has more than one document with the same
+        key a non-unique index is created instead.
+
+        """
+        if self.collection in self.indexed:
+            return
+        self.indexed.add(self.collection)
+        collection = self.database[self.collection]
+        try:
+            await collection.create_index("key", unique=True)
+        except OperationFailure:
+            _LOGGER.warning(
+                "MongoDB collection %s has documents with the same key, remove "
+                "them so that a unique index can be created on key.",
+                self.collection,
+            )
+            await collection.create_index("key")
+
     async def put(self, key, data):
         """Insert or replace an object into the database for a given key.
 
@@ -69,14 +115,8 @@ class DatabaseMongo(Database):
         """
         _LOGGER.debug("Putting %s into MongoDB collection %s", key, self.collection)
 
-        if isinstance(data, str):
-            data = {"value": data}
-        if "key" not in data:
-            data["key"] = key
-
-        return await self.database[self.collection].update_one(
-            {"key": data["key"]}, {"$set": data}, upsert=True
-        )
+        data = self._to_document(key, data)
+        return await self._write({"key": data["key"]}, {"$set": data})
 
     async def get(self, key):
         """Get a document from the database (key).
@@ -88,15 +128,13 @@ class DatabaseMongo(Database):
         _LOGGER.debug("Getting %s from MongoDB collection %s", key, self.collection)
 
         response = await self.database[self.collection].find_one(
-            {"$query": {"key": key}, "$orderby": {"$natural": -1}}
+            {"key": key}, projection={"_id": False}
         )
 
         if not response:
             return None
 
-        if response.keys() == {"_id", "key", "value"}:
-            response = response["value"]
-        return response
+        return self._from_document(response)
 
     async def delete(self, key):
         """Delete a document from the database (key).
@@ -107,16 +145,187 @@ class DatabaseMongo(Database):
         """
         _LOGGER.debug("Deleting %s from MongoDB collection %s.", key, self.collection)
 
-        return await self.database[self.collection].delete_one({"key": key})
+        return await self._write({"key": key})
+
+    async def get_many(self, keys):
+        """Get the documents for several keys with one query.
+
+        Args:
+            keys (list): the document lookup keys.
+
+        Returns:
+            dict: The document stored for each key which was found.
+
+        """
+        _LOGGER.debug(
+            "Getting %s keys from MongoDB collection %s", len(keys), self.collection
+        )
+
+        results = {}
+        async for response in self.database[self.collection].find(
+            {"key": {"$in": list(keys)}}, projection={"_id": False}
+        ):
+            results[response["key"]] = self._from_document(response)
+        return results
+
+    async def put_many(self, items):
+        """Insert or replace the documents for several keys with one bulk write.
+
+        Args:
+            items (dict): the data to be inserted or replaced, by key.
+
+        """
+        _LOGGER.debug(
+            "Putting %s keys into MongoDB collection %s", len(items), self.collection
+        )
+
+        requests = []
+        for key, data in items.items():
+            data = self._to_document(key, data)
+            requests.append(
+                UpdateOne({"key": data["key"]}, {"$set": data}, upsert=True)
+            )
+        if requests:
+            return await self.database[self.collection].bulk_write(
+                requests, ordered=False
+            )
+
+    async def delete_many(self, keys):
+        """Delete the documents for several keys with one query.
+
+        Args:
+            keys (list): the document lookup keys.
+
+        """
+        _LOGGER.debug(
+            "Deleting %s keys from MongoDB collection %s.", len(keys), self.collection
+        )
+
+        return await self.database[self.collection].delete_many(
+            {"key": {"$in": list(keys)}}
+        )
+
+    async def iter_keys(self, prefix="", page_size=DEFAULT_PAGE_SIZE):
+        """Iterate over the keys which start with a prefix in order.
+
+        The keys are found with an anchored regular expression, which uses
+        the index on key, and fetched from MongoDB in batches.
+
+        Args:
+            prefix (string): Only yield keys which start with this.
+            page_size (int): How many keys to fetch from MongoDB at once.
+
+        Yields:
+            string: Each matching key.
+
+        """
+        _LOGGER.debug(
+            "Iterating over keys starting with %r in MongoDB collection %s",
+            prefix,
+            self.collection,
+        )
+        async for response in self.database[self.collection].find(
+            {"key": {"$regex": "^" + re.escape(prefix)}},
+            projection={"key": True, "_id": False},
+            sort=[("key", 1)],
+            batch_size=page_size,
+        ):
+            yield response["key"]
+
+    async def _write(self, query, update=None):
+        """Run a write, batching it with writes made at the same time.
+
+        The first write queues a task which sends every write queued for the
+        collection before it runs in one ordered bulk write.
+
+        Args:
+            query (dict): The document to write.
+            update (dict, optional): The update to upsert into the document,
+                or None to delete it.
+
+        """
+        collection = self.collection
+        if not self.auto_batch:
+            return await self._write_one(collection, query, update)
+
+        future = asyncio.get_event_loop().create_future()
+        queued = self.queued.setdefault(collection, [])
+        queued.append((query, update, future))
+        if len(queued) == 1:
+            asyncio.ensure_future(self._send_queued(collection))
+        return await future
+
+    async def _write_one(self, collection, query, update):
+        """Run a single write with update_one or delete_one."""
+        if update is None:
+            return await self.database[collection].delete_one(query)
+        return await self.database[collection].update_one(query, update, upsert=True)
+
+    async def _send_queued(self, collection):
+        """Send the writes queued for a collection."""
+        writes = self.queued.pop(collection)
+        # Writes before the first failed one in an ordered bulk write succeed.
+        failed = 0
+        # pylint: disable=broad-except
+        # Errors are passed on to whoever made the write.
+        try:
+            if len(writes) == 1:
+                query, update, _future = writes[0]
+                result = await self._write_one(collection, query, update)
+            else:
+                result = await self.database[collection].bulk_write(
+                    [
+                        DeleteOne(query)
+                        if update is None
+                        else UpdateOne(query, update, upsert=True)
+                        for query, update, _future in writes
+                    ],
+                    ordered=True,
+                )
+        except BulkWriteError as error:
+            result = error
+            errors = error.details.get("writeErrors") or [{"index": 0}]
+            failed = min(write_error["index"] for write_error in errors)
+        except Exception as error:
+            result = error
+
+        for index, (_query, _update, future) in enumerate(writes):
+            if future.done():
+                continue
+            if isinstance(result, Exception) and index >= failed:
+                future.set_exception(result)
+            else:
+                future.set_result(None if len(writes) > 1 else result)
+
+    @staticmethod
+    def _to_document(key, data):
+        """Wrap a value to store it as a document."""
+        if isinstance(data, str):
+            data = {"value": data}
+        if "key" not in data:
+            data = {**data, "key": key}
+        return data
+
+    @staticmethod
+    def _from_document(response):
+        """Unwrap a value which was stored by `DatabaseMongo._to_document`."""
+        response.pop("_id", None)
+        if response.keys() == {"key", "value"}:
+            return response["value"]
+        return response
 
     @asynccontextmanager
     async def memory_in_collection(self, collection):
-        """Use the specified collection rather than the default."""
-        db_copy = DatabaseMongo(self.config, self.opsdroid)
-        try:
-            await db_copy.connect()
-            db_copy.collection = collection
-            yield db_copy
-        finally:
-            if db_copy.client:
-                db_copy.client.close()
+        """Use the specified collection rather than the default.
+
+        The database which is yielded shares its connection to MongoDB with
+        this one.
+
+        """
+        if self.client is None:
+            await self.connect()
+        view = copy.copy(self)
+        view.collection = collection
+        if view.database is not None:
+            await view.ensure_index()
+        yield view
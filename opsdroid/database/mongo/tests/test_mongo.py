@@ -1,4 +1,9 @@
+import asyncio
+
 import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import DeleteOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from opsdroid.database.mockmodules.mongo.mongo_database import (
     DatabaseMongoCollectionMock,
@@ -51,8 +56,15 @@ def test_init(database):
         },
     ],
 )
-async def test_connect(database):
+async def test_connect(database, mocker):
     """Test that the mongo database has implemented connect function properly"""
+    create_index = mocker.patch(
+        "motor.motor_asyncio.AsyncIOMotorCollection.create_index",
+        new_callable=mocker.AsyncMock,
+    )
+    client_class = mocker.patch(
+        "opsdroid.database.mongo.AsyncIOMotorClient", wraps=AsyncIOMotorClient
+    )
     try:
         await database.connect()
         assert "mongodb://" in database.db_url
@@ -60,6 +72,8 @@ async def test_connect(database):
         raise Exception
     else:
         pass
+    create_index.assert_called_once_with("key", unique=True)
+    client_class.assert_called_once_with(database.db_url, maxPoolSize=100)
 
 
 @pytest.mark.anyio
@@ -104,3 +118,154 @@ async def test_put3(mocked_database):
 @pytest.mark.parametrize("config", [{"collection": "test_collection"}])
 async def test_delete(mocked_database):
     await mocked_database.delete("test_key")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("config", [{"collection": "test_collection"}])
+async def test_get_many(mocked_database):
+    assert await mocked_database.get_many(["456", "missing"]) == {"456": "789"}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("config", [{"collection": "test_collection"}])
+async def test_put_many(mocked_database):
+    await mocked_database.put_many({"first": "value", "second": {"data": 1}})
+
+    requests = mocked_database.database["test_collection"].requests
+    assert [request._filter for request in requests] == [
+        {"key": "first"},
+        {"key": "second"},
+    ]
+    assert requests[0]._doc == {"$set": {"key": "first", "value": "value"}}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("config", [{"collection": "test_collection"}])
+async def test_delete_many(mocked_database):
+    await mocked_database.delete_many(["first", "second"])
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("config", [{"collection": "test_collection"}])
+async def test_get_unwraps_value(mocked_database):
+    assert await mocked_database.get("456") == "789"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("config", [{"collection": "test_collection"}])
+async def test_ensure_index_duplicates(mocked_database, mocker, caplog):
+    collection = mocked_database.database["test_collection"]
+    create_index = mocker.patch.object(
+        collection,
+        "create_index",
+        side_effect=[DuplicateKeyError("duplicate key"), None],
+    )
+
+    await mocked_database.ensure_index()
+    await mocked_database.ensure_index()
+
+    assert create_index.call_args_list == [
+        mocker.call("key", unique=True),
+        mocker.call("key"),
+    ]
+    assert "has documents with the same key" in caplog.text
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("config", [{"collection": "test_collection"}])
+async def test_put_does_not_change_data(mocked_database):
+    data = {"hello": "world"}
+    await mocked_database.put("test_key", data)
+    assert data == {"hello": "world"}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("config", [{"collection": "test_collection"}])
+async def test_concurrent_writes_batched(mocked_database):
+    collection = mocked_database.database["test_collection"]
+
+    await asyncio.gather(
+        mocked_database.put("first", "value"),
+        mocked_database.put("second", {"data": 1}),
+        mocked_database.delete("third"),
+    )
+
+    assert collection.writes == []
+    assert collection.requests == [
+        UpdateOne(
+            {"key": "first"},
+            {"$set": {"value": "value", "key": "first"}},
+            upsert=True,
+        ),
+        UpdateOne(
+            {"key": "second"}, {"$set": {"data": 1, "key": "second"}}, upsert=True
+        ),
+        DeleteOne({"key": "third"}),
+    ]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("config", [{"collection": "test_collection"}])
+async def test_batched_write_error(mocked_database, mocker):
+    collection = mocked_database.database["test_collection"]
+    error = BulkWriteError({"writeErrors": [{"index": 1}]})
+    mocker.patch.object(collection, "bulk_write", side_effect=error)
+
+    results = await asyncio.gather(
+        mocked_database.put("first", "value"),
+        mocked_database.put("second", "value"),
+        mocked_database.put("third", "value"),
+        return_exceptions=True,
+    )
+
+    assert results == [None, error, error]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "config", [{"collection": "test_collection", "auto-batch": False}]
+)
+async def test_auto_batch_off(mocked_database):
+    collection = mocked_database.database["test_collection"]
+
+    await asyncio.gather(
+        mocked_database.put("first", "value"), mocked_database.delete("second")
+    )
+
+    assert collection.writes == [{"key": "first"}, {"key": "second"}]
+    assert collection.requests == []
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("config", [{"collection": "test_collection"}])
+async def test_memory_in_collection_shares_client(mocked_database, mocker):
+    mocked_database.client = mocker.Mock()
+    collections = {
+        "test_collection": DatabaseMongoCollectionMock({}),
+        "new_collection": DatabaseMongoCollectionMock({}),
+    }
+    mocked_database.database = collections
+
+    async with mocked_database.memory_in_collection("new_collection") as new_db:
+        assert new_db.client is mocked_database.client
+        await new_db.put("test_key", "value")
+
+    assert mocked_database.collection == "test_collection"
+    assert collections["new_collection"].indexes == [("key", {"unique": True})]
+    assert collections["new_collection"].writes == [{"key": "test_key"}]
+    assert not mocked_database.client.close.called
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("config", [{"collection": "test_collection"}])
+async def test_iter_keys(mocked_database):
+    collection = mocked_database.database["test_collection"]
+
+    assert [key async for key in mocked_database.iter_keys("45")] == ["456"]
+    assert [key async for key in mocked_database.iter_keys("5")] == []
+    assert [key async for key in mocked_database.iter_keys()] == ["456"]
+    assert collection.find_kwargs == {
+        "projection": {"key": True, "_id": False},
+        "sort": [("key", 1)],
+        "batch_size": 100,
+    }
@@ -1,19 +1,42 @@
 """Module for storing data within Redis."""
-import json
+import asyncio
 import logging
+import re
 
 from aioredis import Redis
+from aioredis.exceptions import RedisError
 from voluptuous import Any
 
-from opsdroid.database import Database
-from opsdroid.helper import JSONEncoder, JSONDecoder
+from opsdroid.database import DEFAULT_PAGE_SIZE, Database
+from opsdroid.helper import CODECS, get_codec
 
 _LOGGER = logging.getLogger(__name__)
-CONFIG_SCHEMA = {"host": str, "port": Any(int, str), "database": int, "password": str}
+CONFIG_SCHEMA = {
+    "host": str,
+    "port": Any(int, str),
+    "database": int,
+    "password": str,
+    "pool-size": int,
+    "timeout": Any(int, float),
+    "connect-timeout": Any(int, float),
+    "auto-pipeline": bool,
+    "ttl": Any(int, float),
+    "codec": Any(*CODECS),
+    "reconnect": bool,
+}
+MAX_RECONNECT_DELAY = 60
 
 
 class RedisDatabase(Database):
-    """Database class for storing data within a Redis instance."""
+    """Database class for storing data within a Redis instance.
+
+    Commands which are made at the same time, for example by skills handling
+    different messages, are sent to Redis together in one pipeline unless
+    ``auto-pipeline`` is turned off.
+
+    """
+
+    supports_ttl = True
 
     def __init__(self, config, opsdroid=None):
         """Initialise the redis database.
@@ -35,50 +58,81 @@ class RedisDatabase(Database):
         self.port = self.config.get("port", 6379)
         self.database = self.config.get("database", 0)
         self.password = self.config.get("password", None)
+        self.pool_size = self.config.get("pool-size", 10)
+        self.timeout = self.config.get("timeout", None)
+        self.connect_timeout = self.config.get("connect-timeout", self.timeout)
+        self.auto_pipeline = self.config.get("auto-pipeline", True)
+        self.ttl = self.config.get("ttl", None)
+        self.reconnect = self.config.get("reconnect", False)
+        self.codec = get_codec(self.config.get("codec", "json"))
+        self.queued = []
+        self.reconnect_task = None
         _LOGGER.debug(_("Loaded Redis database connector."))
 
     async def connect(self):
         """Connect to the database.
 
         This method will connect to a Redis database. By default it will
-        connect to Redis on localhost on port 6379
+        connect to Redis on localhost on port 6379. If the connection fails
+        and ``reconnect`` is set, connecting is retried in the background
+        with an increasing delay.
 
         """
+        if not await self._connect() and self.reconnect:
+            self.reconnect_task = asyncio.ensure_future(self._reconnect())
+
+    async def _connect(self):
+        """Try to connect to Redis, returning whether it worked."""
         try:
-            self.client = Redis(
+            client = Redis(
                 host=self.host,
                 port=int(self.port),
                 db=self.database,
                 password=self.password,
+                max_connections=self.pool_size,
+                socket_timeout=self.timeout,
+                socket_connect_timeout=self.connect_timeout,
             )
-            await self.client.ping()  # to actually initiate a connection
-
-            _LOGGER.info(
-                _("Connected to Redis database %s from %s on port %s."),
-                self.database,
-                self.host,
-                self.port,
-            )
-        except OSError:
+            await client.ping()  # to actually initiate a connection
+        except (OSError, RedisError):
             _LOGGER.warning(
                 _("Unable to connect to Redis database on address: %s port: %s."),
                 self.host,
                 self.port,
             )
+            return False
+
+        self.client = client
+        _LOGGER.info(
+            _("Connected to Redis database %s from %s on port %s."),
+            self.database,
+            self.host,
+            self.port,
+        )
+        return True
+
+    async def _reconnect(self):
+        """Keep trying to connect to Redis until it works."""
+        delay = 1
+        while True:
+            await asyncio.sleep(delay)
+            if await self._connect():
+                return
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
 
-    async def put(self, key, data):
+    async def put(self, key, data, ttl=None):
         """Store the data object in Redis against the key.
 
         Args:
             key (string): The key to store the data object under.
             data (object): The data object to store.
+            ttl (float, optional): How long to keep the key for in seconds,
+                defaults to the ``ttl`` option or keeping it forever.
 
         """
         if self.client:
             _LOGGER.debug(_("Putting %s into Redis."), key)
-            await self.client.execute_command(
-                "SET", key, json.dumps(data, cls=JSONEncoder)
-            )
+            await self._execute(*self._set_command(key, data, ttl))
 
     async def get(self, key):
         """Get data from Redis for a given key.
@@ -93,10 +147,10 @@ class RedisDatabase(Database):
         """
         if self.client:
             _LOGGER.debug(_("Getting %s from Redis."), key)
-            data = await self.client.execute_command("GET", key)
+            data = await self._execute("GET", key)
 
             if data:
-                return json.loads(data, object_hook=JSONDecoder())
+                return self.codec.decode(data)
 
             return None
 
@@ -109,9 +163,141 @@ class RedisDatabase(Database):
         """
         if self.client:
             _LOGGER.debug(_("Deleting %s from Redis."), key)
-            await self.client.execute_command("DEL", key)
+            await self._execute("DEL", key)
+
+    async def get_many(self, keys):
+        """Get data from Redis for several keys with a single MGET.
+
+        Args:
+            keys (list): The keys to lookup in the database.
+
+        Returns:
+            dict: The data object stored for each key which was found.
+
+        """
+        if self.client and keys:
+            _LOGGER.debug(_("Getting %s keys from Redis."), len(keys))
+            keys = list(keys)
+            values = await self._execute("MGET", *keys)
+            return {
+                key: self.codec.decode(data) for key, data in zip(keys, values) if data
+            }
+        return {}
+
+    async def put_many(self, items, ttl=None):
+        """Store several data objects in Redis with one pipeline of SETs.
+
+        Args:
+            items (dict): The data objects to store, by key.
+            ttl (float, optional): How long to keep the keys for in seconds,
+                defaults to the ``ttl`` option or keeping them forever.
+
+        """
+        if self.client and items:
+            _LOGGER.debug(_("Putting %s keys into Redis."), len(items))
+            pipeline = self.client.pipeline(transaction=False)
+            for key, data in items.items():
+                pipeline.execute_command(*self._set_command(key, data, ttl))
+            await pipeline.execute()
+
+    async def delete_many(self, keys):
+        """Delete data from Redis for several keys with a single DEL.
+
+        Args:
+            keys (list): The keys to delete in the database.
+
+        """
+        if self.client and keys:
+            _LOGGER.debug(_("Deleting %s keys from Redis."), len(keys))
+            await self._execute("DEL", *keys)
+
+    async def iter_keys(self, prefix="", page_size=DEFAULT_PAGE_SIZE):
+        """Iterate over the keys which start with a prefix with SCAN.
+
+        As with SCAN a key may be yielded more than once.
+
+        Args:
+            prefix (string): Only yield keys which start with this.
+            page_size (int): The COUNT hint given to SCAN.
+
+        Yields:
+            string: Each matching key.
+
+        """
+        if not self.client:
+            return
+        _LOGGER.debug(_("Scanning Redis for keys starting with %r."), prefix)
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", prefix) + "*"
+        cursor = 0
+        while True:
+            cursor, keys = await self._execute(
+                "SCAN", cursor, "MATCH", pattern, "COUNT", page_size
+            )
+            for key in keys:
+                yield key.decode() if isinstance(key, bytes) else key
+            if int(cursor) == 0:
+                return
 
     async def disconnect(self):
         """Disconnect from the database."""
+        if self.reconnect_task is not None:
+            self.reconnect_task.cancel()
         if self.client:
             await self.client.close()
+
+    def _set_command(self, key, data, ttl=None):
+        """Return the SET command for a key, with an expiry if it has a ttl."""
+        command = ("SET", key, self.codec.encode(data))
+        ttl = ttl if ttl is not None else self.ttl
+        if ttl is None:
+            return command
+        if float(ttl).is_integer():
+            return command + ("EX", int(ttl))
+        return command + ("PX", int(ttl * 1000))
+
+    async def _execute(self, *args):
+        """Run a Redis command, pipelining it with commands made at the same time.
+
+        The first command queues a task which sends every command queued
+        before it runs, so commands made in the same iteration of the event
+        loop are sent together.
+
+        Args:
+            *args: The command and its arguments.
+
+        Returns:
+            The result of the command.
+
+        """
+        if not self.auto_pipeline:
+            return await self.client.execute_command(*args)
+
+        future = asyncio.get_event_loop().create_future()
+        self.queued.append((args, future))
+        if len(self.queued) == 1:
+            asyncio.ensure_future(self._send_queued())
+        return await future
+
+    async def _send_queued(self):
+        """Send the queued commands, in a pipeline if there is more than one."""
+        commands, self.queued = self.queued, []
+        # pylint: disable=broad-except
+        # Errors are passed on to whoever made the command.
+        try:
+            if len(commands) == 1:
+                results = [await self.client.execute_command(*commands[0][0])]
+            else:
+                pipeline = self.client.pipeline(transaction=False)
+                for args, _future in commands:
+                    pipeline.execute_command(*args)
+                results = await pipeline.execute(raise_on_error=False)
+        except Exception as error:
+            results = [error] * len(commands)
+
+        for (_args, future), result in zip(commands, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
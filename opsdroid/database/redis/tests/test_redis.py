@@ -1,9 +1,11 @@
 import asyncio
 import json
 import logging
+import sys
 from contextlib import suppress
 
 import pytest
+from aioredis.exceptions import ConnectionError, ResponseError
 
 from opsdroid.database.redis import RedisDatabase
 from opsdroid.helper import JSONEncoder
@@ -125,3 +127,175 @@ async def test_disconnect(mocker):
     await database.disconnect()
 
     assert database.client.close.called
+
+
+@pytest.mark.anyio
+async def test_get_many(mocker):
+    database = RedisDatabase({})
+    database.client = mocker.Mock()
+    database.client.execute_command.return_value = return_async_value(
+        ['{"data_key":"data_value"}', None]
+    )
+
+    result = await database.get_many(["key", "missing"])
+
+    assert result == {"key": dict(data_key="data_value")}
+    database.client.execute_command.assert_called_with("MGET", "key", "missing")
+
+
+@pytest.mark.anyio
+async def test_put_many(mocker):
+    database = RedisDatabase({})
+    database.client = mocker.Mock()
+    pipeline = database.client.pipeline.return_value
+    pipeline.execute.return_value = return_async_value([True, True])
+
+    await database.put_many({"first": 1, "second": {"data_key": "data_value"}})
+
+    database.client.pipeline.assert_called_once_with(transaction=False)
+    assert pipeline.execute_command.call_args_list == [
+        mocker.call("SET", "first", "1"),
+        mocker.call(
+            "SET", "second", json.dumps({"data_key": "data_value"}, cls=JSONEncoder)
+        ),
+    ]
+    assert pipeline.execute.called
+
+
+@pytest.mark.anyio
+async def test_delete_many(mocker):
+    database = RedisDatabase({})
+    database.client = mocker.Mock()
+    database.client.execute_command.return_value = return_async_value(2)
+
+    await database.delete_many(["first", "second"])
+
+    database.client.execute_command.assert_called_with("DEL", "first", "second")
+
+
+def test_init_options():
+    database = RedisDatabase(
+        {"pool-size": 20, "timeout": 2, "ttl": 60, "reconnect": True}
+    )
+    assert database.pool_size == 20
+    assert database.timeout == 2
+    assert database.connect_timeout == 2
+    assert database.ttl == 60
+    assert database.reconnect
+
+
+def test_codec_not_installed(monkeypatch, caplog):
+    monkeypatch.setitem(sys.modules, "msgpack", None)
+    database = RedisDatabase({"codec": "msgpack"})
+    assert database.codec.name == "json"
+    assert "Unable to use the msgpack codec" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_pipelines_concurrent_commands(mocker):
+    database = RedisDatabase({})
+    database.client = mocker.Mock()
+    pipeline = database.client.pipeline.return_value
+    pipeline.execute.return_value = return_async_value(
+        ['{"data_key":"data_value"}', None, 1]
+    )
+
+    results = await asyncio.gather(
+        database.get("first"), database.get("second"), database.delete("third")
+    )
+
+    assert results == [dict(data_key="data_value"), None, None]
+    assert not database.client.execute_command.called
+    assert pipeline.execute_command.call_args_list == [
+        mocker.call("GET", "first"),
+        mocker.call("GET", "second"),
+        mocker.call("DEL", "third"),
+    ]
+    pipeline.execute.assert_called_once_with(raise_on_error=False)
+
+
+@pytest.mark.anyio
+async def test_pipeline_errors(mocker):
+    database = RedisDatabase({})
+    database.client = mocker.Mock()
+    pipeline = database.client.pipeline.return_value
+    pipeline.execute.return_value = return_async_value(
+        [ResponseError("wrong type"), '"value"']
+    )
+
+    results = await asyncio.gather(
+        database.get("first"), database.get("second"), return_exceptions=True
+    )
+
+    assert isinstance(results[0], ResponseError)
+    assert results[1] == "value"
+
+
+@pytest.mark.anyio
+async def test_without_auto_pipeline(mocker):
+    database = RedisDatabase({"auto-pipeline": False})
+    database.client = mocker.Mock()
+    database.client.execute_command.side_effect = lambda *args: return_async_value(None)
+
+    await asyncio.gather(database.get("first"), database.get("second"))
+
+    assert database.client.execute_command.call_count == 2
+    assert not database.client.pipeline.called
+
+
+@pytest.mark.anyio
+async def test_put_ttl(mocker):
+    database = RedisDatabase({"ttl": 60})
+    database.client = mocker.Mock()
+    database.client.execute_command.side_effect = lambda *args: return_async_value(True)
+
+    await database.put("key", "value")
+    database.client.execute_command.assert_called_with(
+        "SET", "key", '"value"', "EX", 60
+    )
+
+    await database.put("key", "value", ttl=1.5)
+    database.client.execute_command.assert_called_with(
+        "SET", "key", '"value"', "PX", 1500
+    )
+
+
+@pytest.mark.anyio
+async def test_reconnect(mocker):
+    database = RedisDatabase({"reconnect": True})
+    mocker.patch("asyncio.sleep", return_value=return_async_value(None))
+    mocked_connection = mocker.patch(
+        "aioredis.Redis.ping",
+        side_effect=[ConnectionError, ConnectionError, return_async_value(True)],
+    )
+
+    await database.connect()
+    assert database.client is None
+    await database.reconnect_task
+
+    assert mocked_connection.call_count == 3
+    assert database.client is not None
+
+
+@pytest.mark.anyio
+async def test_iter_keys(mocker):
+    database = RedisDatabase({})
+    database.client = mocker.Mock()
+    database.client.execute_command.side_effect = [
+        return_async_value([b"7", [b"user.1", b"user.2"]]),
+        return_async_value([b"0", [b"user.3"]]),
+    ]
+
+    keys = [key async for key in database.iter_keys("user.[1]*", page_size=50)]
+
+    assert keys == ["user.1", "user.2", "user.3"]
+    assert database.client.execute_command.call_args_list == [
+        mocker.call("SCAN", 0, "MATCH", r"user.\[1\]\**", "COUNT", 50),
+        mocker.call("SCAN", b"7", "MATCH", r"user.\[1\]\**", "COUNT", 50),
+    ]
+
+
+@pytest.mark.anyio
+async def test_iter_keys_not_connected():
+    database = RedisDatabase({})
+    assert [key async for key in database.iter_keys()] == []
@@ -1,15 +1,53 @@
 """A module for sqlite database."""
+import asyncio
 import os
 import logging
-import json
+import sys
+import time
 import aiosqlite
+from voluptuous import Any
 
 from opsdroid.const import DEFAULT_ROOT_PATH
-from opsdroid.database import Database
-from opsdroid.helper import JSONEncoder, JSONDecoder
+from opsdroid.database import DEFAULT_PAGE_SIZE, Database
+from opsdroid.helper import CODECS, get_codec
 
 _LOGGER = logging.getLogger(__name__)
-CONFIG_SCHEMA = {"path": str, "file": str, "table": str}
+CONFIG_SCHEMA = {
+    "path": str,
+    "file": str,
+    "table": str,
+    "journal-mode": Any("wal", "delete", "truncate", "persist", "memory", "off"),
+    "synchronous": Any("off", "normal", "full", "extra"),
+    "commit-delay": Any(int, float),
+    "codec": Any(*CODECS),
+    "reap-interval": Any(int, float),
+    "reap-batch-size": int,
+}
+# The lowest limit on the number of parameters in one query of any SQLite build.
+MAX_VARIABLES = 999
+# Matches the rows whose key hasn't expired, given the current time.
+LIVE = "(expires IS NULL OR expires > ?)"
+
+
+def _prefix_end(prefix):
+    """Return the first string after every string starting with a prefix.
+
+    Returns:
+        string or None: The exclusive upper bound of keys starting with the
+            prefix, or None if there isn't one.
+
+    """
+    while prefix:
+        if ord(prefix[-1]) < sys.maxunicode:
+            return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        prefix = prefix[:-1]
+    return None
+
+
+def _expires(ttl):
+    """Return the time a key put now with a ttl expires at, if it has one."""
+    return None if ttl is None else time.time() + ttl
+
 
 # pylint: disable=too-few-public-methods
 # As the current module needs only one public method to register json types
@@ -20,8 +58,20 @@ class DatabaseSqlite(Database):
 
     SQLite Database class used to persist data in sqlite.
 
+    The database is opened in WAL mode by default, with one connection for
+    writes and a second one for reads so that reads are not held up by
+    writes. Writes can be grouped into a single transaction by setting
+    ``commit-delay`` to the number of milliseconds to wait for other writes
+    before committing.
+
+    Keys put with a ``ttl`` have their expiry time stored alongside them.
+    Expired keys are never read, and are deleted in batches of
+    ``reap-batch-size`` every ``reap-interval`` seconds.
+
     """
 
+    supports_ttl = True
+
     def __init__(self, config, opsdroid=None):
         """Initialise the sqlite database.
 
@@ -49,6 +99,16 @@ class DatabaseSqlite(Database):
                 "path", os.path.join(DEFAULT_ROOT_PATH, "sqlite.db")
             )
         self.table = self.config.get("table", "opsdroid")
+        self.journal_mode = self.config.get("journal-mode", "wal")
+        self.synchronous = self.config.get("synchronous", "normal")
+        self.commit_delay = self.config.get("commit-delay", 0) / 1000
+        self.codec = get_codec(self.config.get("codec", "json"))
+        self.reap_interval = self.config.get("reap-interval", self.reap_interval)
+        self.reap_batch_size = self.config.get("reap-batch-size", self.reap_batch_size)
+        self.reader = None
+        self.write_lock = None
+        self.pending = []
+        self.commit_task = None
         _LOGGER.debug(_("Loaded sqlite database connector"))
 
     async def connect(self):
@@ -63,38 +123,55 @@ class DatabaseSqlite(Database):
             opsdroid (OpsDroid): An instance of opsdroid core.
 
         """
+        self.write_lock = asyncio.Lock()
         self.client = await aiosqlite.connect(self.db_file, **self.conn_args)
-
-        cur = await self.client.cursor()
-        await cur.execute(
+        await self.client.execute("PRAGMA journal_mode={}".format(self.journal_mode))
+        await self.client.execute("PRAGMA synchronous={}".format(self.synchronous))
+        await self.client.execute(
             "CREATE TABLE IF NOT EXISTS {}"
-            "(key text PRIMARY KEY, data text)".format(self.table)
+            "(key text PRIMARY KEY, data text, expires real)".format(self.table)
         )
-        await self.client.commit()
+        async with self.client.execute(
+            "PRAGMA table_info({})".format(self.table)
+        ) as cur:
+            columns = [row[1] for row in await cur.fetchall()]
+        if "expires" not in columns:
+            # Tables made by older versions of opsdroid have no expiry column.
+            await self.client.execute(
+                "ALTER TABLE {} ADD COLUMN expires real".format(self.table)
+            )
+        await self.client.execute(
+            "CREATE INDEX IF NOT EXISTS {0}_expires ON {0}(expires) "
+            "WHERE expires IS NOT NULL".format(self.table)
+        )
+
+        if self.db_file == ":memory:":
+            # Every connection to :memory: gets its own empty database.
+            self.reader = self.client
+        else:
+            self.reader = await aiosqlite.connect(self.db_file, **self.conn_args)
+            await self.reader.execute("PRAGMA query_only=1")
 
+        self.start_reaper()
         _LOGGER.info(_("Connected to sqlite %s"), self.db_file)
 
-    async def put(self, key, data):
+    async def put(self, key, data, ttl=None):
         """Put data into the database.
 
         This method will insert or replace an object into the database for
-        a given key. The data object is serialised into JSON data using the
-        JSONEncoder class.
+        a given key. The data object is serialised with the configured
+        codec, JSON by default.
 
         Args:
             key (string): The key to store the data object under.
             data (object): The data object to store.
+            ttl (float, optional): How long to keep the key for in seconds,
+                by default it is kept forever.
 
         """
         _LOGGER.debug(_("Putting %s into sqlite"), key)
-        json_data = json.dumps(data, cls=JSONEncoder)
-
-        cur = await self.client.cursor()
-        await cur.execute("DELETE FROM {} WHERE key=?".format(self.table), (key,))
-        await cur.execute(
-            "INSERT INTO {} VALUES (?, ?)".format(self.table), (key, json_data)
-        )
-        await self.client.commit()
+        row = (key, self.codec.encode(data), _expires(ttl))
+        await self._write([(self._upsert_sql, [row])])
 
     async def get(self, key):
         """Get data from the database for a given key.
@@ -110,11 +187,13 @@ class DatabaseSqlite(Database):
         _LOGGER.debug(_("Getting %s from sqlite"), key)
         data = None
 
-        cur = await self.client.cursor()
-        await cur.execute("SELECT data FROM {} WHERE key=?".format(self.table), (key,))
-        row = await cur.fetchone()
+        async with self.reader.execute(
+            "SELECT data FROM {} WHERE key=? AND {}".format(self.table, LIVE),
+            (key, time.time()),
+        ) as cur:
+            row = await cur.fetchone()
         if row:
-            data = json.loads(row[0], object_hook=JSONDecoder())
+            data = self.codec.decode(row[0])
 
         return data
 
@@ -126,12 +205,222 @@ class DatabaseSqlite(Database):
 
         """
         _LOGGER.debug(_("Deleting %s from sqlite"), key)
+        await self._write([(self._delete_sql, [(key,)])])
+
+    async def get_many(self, keys):
+        """Get data from the database for several keys with one query.
+
+        Args:
+            keys (list): The keys to lookup in the database.
+
+        Returns:
+            dict: The data object stored for each key which was found.
+
+        """
+        _LOGGER.debug(_("Getting %s keys from sqlite"), len(keys))
+        results = {}
+        keys = list(keys)
+        now = time.time()
+        # One parameter is needed for the current time.
+        chunk_size = MAX_VARIABLES - 1
+
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start : start + chunk_size]
+            async with self.reader.execute(
+                "SELECT key, data FROM {} WHERE key IN ({}) AND {}".format(
+                    self.table, ", ".join("?" * len(chunk)), LIVE
+                ),
+                (*chunk, now),
+            ) as cur:
+                for key, data in await cur.fetchall():
+                    results[key] = self.codec.decode(data)
+
+        return results
+
+    async def put_many(self, items, ttl=None):
+        """Put several data objects into the database in one transaction.
+
+        Args:
+            items (dict): The data objects to store, by key.
+            ttl (float, optional): How long to keep the keys for in seconds,
+                by default they are kept forever.
+
+        """
+        _LOGGER.debug(_("Putting %s keys into sqlite"), len(items))
+        expires = _expires(ttl)
+        rows = [(key, self.codec.encode(data), expires) for key, data in items.items()]
+        await self._write([(self._upsert_sql, rows)])
 
-        cur = await self.client.cursor()
-        await cur.execute("DELETE FROM {} WHERE key=?".format(self.table), (key,))
-        await self.client.commit()
+    async def delete_many(self, keys):
+        """Delete data from the database for several keys in one transaction.
+
+        Args:
+            keys (list): The keys to delete in the database.
+
+        """
+        _LOGGER.debug(_("Deleting %s keys from sqlite"), len(keys))
+        await self._write([(self._delete_sql, [(key,) for key in keys])])
+
+    async def iter_keys(self, prefix="", page_size=DEFAULT_PAGE_SIZE):
+        """Iterate over the keys which start with a prefix in order.
+
+        Each page of keys is read with a range query on the primary key,
+        starting after the last key of the previous page, so no read
+        transaction is held open while the keys are used.
+
+        Args:
+            prefix (string): Only yield keys which start with this.
+            page_size (int): How many keys to read at once.
+
+        Yields:
+            string: Each matching key.
+
+        """
+        _LOGGER.debug(_("Iterating over keys starting with %r in sqlite"), prefix)
+        end = _prefix_end(prefix)
+        upper = "" if end is None else " AND key < ?"
+        bounds = () if end is None else (end,)
+        # The first page includes the prefix itself as a key.
+        lower, start = "key >= ?", prefix
+        while True:
+            async with self.reader.execute(
+                "SELECT key FROM {} WHERE {}{} AND {} ORDER BY key LIMIT ?".format(
+                    self.table, lower, upper, LIVE
+                ),
+                (start, *bounds, time.time(), page_size),
+            ) as cur:
+                rows = await cur.fetchall()
+            for (key,) in rows:
+                yield key
+            if len(rows) < page_size:
+                return
+            lower, start = "key > ?", rows[-1][0]
+
+    async def reap_expired(self, limit):
+        """Delete up to ``limit`` expired keys in one statement.
+
+        Args:
+            limit (int): The most keys to delete.
+
+        Returns:
+            int: The number of keys deleted.
+
+        """
+        async with self.write_lock:
+            cursor = await self.client.execute(
+                "DELETE FROM {0} WHERE key IN "
+                "(SELECT key FROM {0} WHERE expires <= ? LIMIT ?)".format(self.table),
+                (time.time(), limit),
+            )
+        if cursor.rowcount:
+            _LOGGER.debug(_("Deleted %s expired keys from sqlite"), cursor.rowcount)
+        return cursor.rowcount
 
     async def disconnect(self):
         """Disconnect from the database."""
+        await self.stop_reaper()
+        while self.commit_task is not None:
+            await self.commit_task
+        if self.reader and self.reader is not self.client:
+            await self.reader.close()
         if self.client:
             await self.client.close()
+
+    @property
+    def _upsert_sql(self):
+        return (
+            "INSERT INTO {} (key, data, expires) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET "
+            "data=excluded.data, expires=excluded.expires".format(self.table)
+        )
+
+    @property
+    def _delete_sql(self):
+        return "DELETE FROM {} WHERE key=?".format(self.table)
+
+    async def _write(self, statements):
+        """Run a write, waiting for it to be committed.
+
+        Without a ``commit-delay`` the write is committed straight away.
+        Otherwise it is queued and committed along with every other write
+        made within the delay.
+
+        Args:
+            statements (list): ``(sql, rows)`` pairs to run with executemany.
+
+        """
+        if not self.commit_delay:
+            async with self.write_lock:
+                await self._commit([statements])
+            return
+
+        future = asyncio.get_event_loop().create_future()
+        self.pending.append((statements, future))
+        if self.commit_task is None:
+            self.commit_task = asyncio.ensure_future(self._commit_pending())
+        await future
+
+    async def _commit_pending(self):
+        """Commit the writes queued within the commit delay.
+
+        Writes queued while a commit is running are committed by the same
+        task once it finishes, so ``commit_task`` covers every queued write
+        until there are none left.
+
+        """
+        try:
+            while self.pending:
+                await asyncio.sleep(self.commit_delay)
+                writes, self.pending = self.pending, []
+                await self._commit_batch(writes)
+        finally:
+            self.commit_task = None
+
+    async def _commit_batch(self, writes):
+        """Commit queued writes together, falling back to one at a time.
+
+        Args:
+            writes (list): ``(statements, future)`` pairs to commit.
+
+        """
+        async with self.write_lock:
+            try:
+                await self._commit([statements for statements, _future in writes])
+            except Exception:  # pylint: disable=broad-except
+                # Commit the writes one at a time so only the bad ones fail.
+                for statements, future in writes:
+                    try:
+                        await self._commit([statements])
+                    except Exception as error:  # pylint: disable=broad-except
+                        if not future.done():
+                            future.set_exception(error)
+                    else:
+                        if not future.done():
+                            future.set_result(None)
+            else:
+                for _statements, future in writes:
+                    if not future.done():
+                        future.set_result(None)
+
+    async def _commit(self, writes):
+        """Run writes in a single transaction.
+
+        Args:
+            writes (list): Lists of ``(sql, rows)`` pairs.
+
+        """
+        statements = [statement for write in writes for statement in write]
+        if len(statements) == 1 and len(statements[0][1]) == 1:
+            # A single row is committed on its own in autocommit mode.
+            sql, [row] = statements[0]
+            await self.client.execute(sql, row)
+            return
+
+        await self.client.execute("BEGIN")
+        try:
+            for sql, rows in statements:
+                await self.client.executemany(sql, rows)
+        except BaseException:
+            await self.client.execute("ROLLBACK")
+            raise
+        await self.client.execute("COMMIT")
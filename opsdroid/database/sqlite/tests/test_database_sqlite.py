@@ -3,8 +3,11 @@ import pytest
 import asynctest.mock as amock
 
 import asyncio
+import datetime
+import time
+import sqlite3
 
-from opsdroid.database.sqlite import DatabaseSqlite
+from opsdroid.database.sqlite import DatabaseSqlite, _prefix_end
 from opsdroid.cli.start import configure_lang
 
 configure_lang({})
@@ -103,3 +106,299 @@ async def test_deprecated_path(caplog):
     database = DatabaseSqlite({"file": "sqlite.db"})
     assert database.db_file == "sqlite.db"
     assert "The option 'file' is deprecated, please use 'path' instead." in caplog.text
+
+
+@pytest.mark.anyio
+async def test_get_put_and_delete_many(tmp_path, monkeypatch):
+    monkeypatch.setattr("opsdroid.database.sqlite.MAX_VARIABLES", 2)
+    database = DatabaseSqlite({"path": str(tmp_path / "sqlite.db")})
+    await database.connect()
+    try:
+        await database.put("a", "old")
+        await database.put_many({"a": 1, "b": {"c": 2}, "d": [3]})
+        assert await database.get("a") == 1
+        assert await database.get_many(["a", "b", "d", "missing"]) == {
+            "a": 1,
+            "b": {"c": 2},
+            "d": [3],
+        }
+
+        await database.delete_many(["a", "d"])
+        assert await database.get_many(["a", "b", "d"]) == {"b": {"c": 2}}
+    finally:
+        await database.disconnect()
+
+
+@pytest.mark.anyio
+async def test_iter_keys(tmp_path):
+    database = DatabaseSqlite({"path": str(tmp_path / "sqlite.db")})
+    await database.connect()
+    try:
+        keys = ["user.{:02}".format(i) for i in range(25)]
+        await database.put_many(
+            {
+                key: 1
+                for key in keys + ["user", "user/", "userz", "room.1", "\U0010ffff"]
+            }
+        )
+
+        assert [key async for key in database.iter_keys("user.", page_size=10)] == keys
+        assert [key async for key in database.iter_keys("user", page_size=10)] == [
+            "user",
+            *keys,
+            "user/",
+            "userz",
+        ]
+        assert len([key async for key in database.iter_keys(page_size=7)]) == 30
+        assert [key async for key in database.iter_keys("\U0010ffff")] == ["\U0010ffff"]
+        assert [key async for key in database.iter_keys("missing")] == []
+    finally:
+        await database.disconnect()
+
+
+@pytest.mark.anyio
+async def test_ttl(tmp_path, mocker):
+    now = mocker.patch("time.time", return_value=1000)
+    database = DatabaseSqlite({"path": str(tmp_path / "sqlite.db")})
+    await database.connect()
+    try:
+        await database.put("short", 1, ttl=10)
+        await database.put_many({"long": 2, "forever": 3}, ttl=60)
+        await database.put("forever", 3)
+
+        now.return_value = 1020
+        assert await database.get("short") is None
+        assert await database.get_many(["short", "long", "forever"]) == {
+            "long": 2,
+            "forever": 3,
+        }
+        assert [key async for key in database.iter_keys()] == ["forever", "long"]
+    finally:
+        await database.disconnect()
+
+
+@pytest.mark.anyio
+async def test_reap_expired(tmp_path, mocker):
+    now = mocker.patch("time.time", return_value=1000)
+    database = DatabaseSqlite(
+        {"path": str(tmp_path / "sqlite.db"), "reap-batch-size": 2}
+    )
+    await database.connect()
+    try:
+        await database.put_many({"a": 1, "b": 2, "c": 3}, ttl=10)
+        await database.put("d", 4)
+
+        now.return_value = 1020
+        assert await database.reap_expired(2) == 2
+        assert await database.reap_expired(2) == 1
+        assert await database.reap_expired(2) == 0
+        async with database.reader.execute("SELECT key FROM opsdroid") as cur:
+            assert await cur.fetchall() == [("d",)]
+    finally:
+        await database.disconnect()
+    assert database.reaper is None
+
+
+@pytest.mark.anyio
+async def test_adds_expiry_column(tmp_path):
+    path = str(tmp_path / "sqlite.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE opsdroid (key text PRIMARY KEY, data text)")
+        conn.execute("INSERT INTO opsdroid VALUES ('hello', '\"world\"')")
+    conn.close()
+
+    database = DatabaseSqlite({"path": path})
+    await database.connect()
+    try:
+        assert await database.get("hello") == "world"
+        await database.put("hello", "there", ttl=60)
+        assert await database.get("hello") == "there"
+    finally:
+        await database.disconnect()
+
+
+def test_prefix_end():
+    assert _prefix_end("user.") == "user/"
+    assert _prefix_end("a\U0010ffff") == "b"
+    assert _prefix_end("\U0010ffff") is None
+    assert _prefix_end("") is None
+
+
+@pytest.mark.anyio
+async def test_put_many_rolls_back(tmp_path):
+    database = DatabaseSqlite({"path": str(tmp_path / "sqlite.db")})
+    await database.connect()
+    try:
+        await database.put("a", 1)
+        # The second key can't be bound, so the first write is rolled back.
+        with pytest.raises(sqlite3.Error):
+            await database.put_many({"a": 2, ("b",): 3})
+        assert await database.get_many(["a", "b"]) == {"a": 1}
+    finally:
+        await database.disconnect()
+
+
+@pytest.mark.anyio
+async def test_wal_and_synchronous(tmp_path):
+    database = DatabaseSqlite(
+        {"path": str(tmp_path / "sqlite.db"), "synchronous": "full"}
+    )
+    await database.connect()
+    try:
+        async with database.client.execute("PRAGMA journal_mode") as cur:
+            assert (await cur.fetchone())[0] == "wal"
+        async with database.client.execute("PRAGMA synchronous") as cur:
+            assert (await cur.fetchone())[0] == 2
+        assert database.reader is not database.client
+    finally:
+        await database.disconnect()
+
+
+@pytest.mark.anyio
+async def test_upsert_replaces(tmp_path):
+    database = DatabaseSqlite({"path": str(tmp_path / "sqlite.db")})
+    await database.connect()
+    try:
+        await database.put("hello", {"a": 1})
+        await database.put("hello", {"a": 2})
+        async with database.reader.execute("SELECT COUNT(*) FROM opsdroid") as cur:
+            assert (await cur.fetchone())[0] == 1
+        assert await database.get("hello") == {"a": 2}
+    finally:
+        await database.disconnect()
+
+
+@pytest.mark.anyio
+async def test_memory_path():
+    database = DatabaseSqlite({"path": ":memory:"})
+    await database.connect()
+    try:
+        await database.put("hello", "world")
+        assert database.reader is database.client
+        assert await database.get("hello") == "world"
+    finally:
+        await database.disconnect()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("codec", ["orjson", "msgpack"])
+async def test_change_codec(tmp_path, codec):
+    pytest.importorskip(codec)
+    path = str(tmp_path / "sqlite.db")
+    data = {"when": datetime.date(2020, 1, 1), "values": [1, 2]}
+
+    database = DatabaseSqlite({"path": path})
+    await database.connect()
+    await database.put("old", data)
+    await database.disconnect()
+
+    database = DatabaseSqlite({"path": path, "codec": codec})
+    await database.connect()
+    try:
+        await database.put("new", data)
+        assert await database.get_many(["old", "new"]) == {"old": data, "new": data}
+    finally:
+        await database.disconnect()
+
+
+@pytest.mark.anyio
+async def test_group_commit(tmp_path, mocker):
+    database = DatabaseSqlite({"path": str(tmp_path / "sqlite.db"), "commit-delay": 20})
+    await database.connect()
+    commit = mocker.spy(database, "_commit")
+    try:
+        await asyncio.gather(
+            *[database.put("key{}".format(i), i) for i in range(10)],
+            database.delete("key0"),
+        )
+        assert commit.call_count == 1
+        assert await database.get_many(["key0", "key1", "key9"]) == {
+            "key1": 1,
+            "key9": 9,
+        }
+    finally:
+        await database.disconnect()
+
+
+@pytest.mark.anyio
+async def test_group_commit_failure_isolated(tmp_path):
+    database = DatabaseSqlite({"path": str(tmp_path / "sqlite.db"), "commit-delay": 20})
+    await database.connect()
+    try:
+        results = await asyncio.gather(
+            database.put("good", 1),
+            database.put_many({"bad": 2, ("bad",): 3}),
+            return_exceptions=True,
+        )
+        assert results[0] is None
+        assert isinstance(results[1], sqlite3.Error)
+        assert await database.get_many(["good", "bad"]) == {"good": 1}
+    finally:
+        await database.disconnect()
+
+
+@pytest.mark.anyio
+async def test_write_during_commit(tmp_path):
+    path = str(tmp_path / "sqlite.db")
+    database = DatabaseSqlite({"path": path, "commit-delay": 20})
+    await database.connect()
+    commit = database._commit
+    committing = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_commit(writes):
+        committing.set()
+        await release.wait()
+        await commit(writes)
+
+    database._commit = slow_commit
+    first = asyncio.ensure_future(database.put("first", 1))
+    await committing.wait()
+    commit_task = database.commit_task
+    second = asyncio.ensure_future(database.put("second", 2))
+    await asyncio.sleep(0)
+    assert database.commit_task is commit_task
+
+    # Disconnecting waits for both commits before closing the client.
+    disconnect = asyncio.ensure_future(database.disconnect())
+    release.set()
+    await asyncio.wait_for(asyncio.gather(first, second, disconnect), 1)
+    assert database.commit_task is None
+
+    database = DatabaseSqlite({"path": path})
+    await database.connect()
+    try:
+        assert await database.get_many(["first", "second"]) == {
+            "first": 1,
+            "second": 2,
+        }
+    finally:
+        await database.disconnect()
+
+
+@pytest.mark.anyio
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"journal-mode": "delete", "synchronous": "full"},
+        {},
+        {"commit-delay": 5},
+    ],
+    ids=["rollback-journal", "wal", "wal-group-commit"],
+)
+async def test_benchmark_puts(tmp_path, config, capsys):
+    """Report how many concurrent puts per second each configuration manages."""
+    database = DatabaseSqlite({"path": str(tmp_path / "sqlite.db"), **config})
+    await database.connect()
+    try:
+        count = 2000
+        start = time.perf_counter()
+        await asyncio.gather(
+            *[database.put("key{}".format(i % 100), {"value": i}) for i in range(count)]
+        )
+        rate = count / (time.perf_counter() - start)
+    finally:
+        await database.disconnect()
+    with capsys.disabled():
+        print("\nsqlite {}: {:.0f} puts/s".format(config, rate))
@@ -1,6 +1,8 @@
+import asyncio
+
 import pytest
 
-from opsdroid.database import Database
+from opsdroid.database import Database, InMemoryDatabase
 
 
 def test_init():
@@ -46,3 +48,128 @@ async def test_delete():
     database = Database({})
     with pytest.raises(NotImplementedError):
         await database.delete("test")
+
+
+class DictDatabase(Database):
+    def __init__(self):
+        super().__init__({})
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def put(self, key, data):
+        self.data[key] = data
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("database_class", [DictDatabase, InMemoryDatabase])
+async def test_many(database_class):
+    database = database_class()
+    await database.put_many({"a": 1, "b": 2, "c": 3})
+    assert await database.get_many(["a", "c", "missing"]) == {"a": 1, "c": 3}
+
+    await database.delete_many(["a", "missing"])
+    assert await database.get_many(["a", "b"]) == {"b": 2}
+
+
+@pytest.mark.anyio
+async def test_iter_keys_not_implemented():
+    with pytest.raises(NotImplementedError):
+        async for key in Database({}).iter_keys():
+            pass  # pragma: nocover
+
+
+@pytest.mark.anyio
+async def test_in_memory_iter_keys():
+    database = InMemoryDatabase()
+    await database.put_many({"user.1": 1, "user.2": 2, "room.1": 3})
+
+    assert [key async for key in database.iter_keys("user.")] == ["user.1", "user.2"]
+
+    # Keys can be deleted while iterating.
+    async for key in database.iter_keys():
+        await database.delete(key)
+    assert database.memory == {}
+
+
+@pytest.mark.anyio
+async def test_in_memory_ttl(mocker):
+    now = mocker.patch("time.monotonic", return_value=100)
+    database = InMemoryDatabase()
+    await database.put("short", 1, ttl=10)
+    await database.put_many({"long": 2, "forever": 3}, ttl=60)
+    await database.put("forever", 3)
+
+    now.return_value = 120
+    assert await database.get("short") is None
+    assert await database.get_many(["short", "long", "forever"]) == {
+        "long": 2,
+        "forever": 3,
+    }
+    assert [key async for key in database.iter_keys()] == ["long", "forever"]
+    await database.disconnect()
+    assert database.reaper is None
+
+
+@pytest.mark.anyio
+async def test_in_memory_reap_expired_in_batches(mocker):
+    now = mocker.patch("time.monotonic", return_value=100)
+    database = InMemoryDatabase()
+    await database.put_many({str(key): key for key in range(5)}, ttl=10)
+    await database.put("0", 0, ttl=60)
+    await database.stop_reaper()
+
+    now.return_value = 120
+    assert await database.reap_expired(3) == 3
+    assert await database.reap_expired(3) == 2
+    # The first deadline of "0" was out of date, so it is kept.
+    assert database.memory == {"0": 0}
+    assert await database.reap_expired(3) == 0
+
+
+@pytest.mark.anyio
+async def test_in_memory_deadlines_bounded(mocker):
+    now = mocker.patch("time.monotonic", return_value=100)
+    database = InMemoryDatabase()
+    await database.put("other", 0, ttl=60)
+    for second in range(100):
+        now.return_value = 100 + second
+        await database.put("key", second, ttl=10)
+    await database.stop_reaper()
+
+    assert len(database.deadlines) <= 2 * len(database.expiries)
+    now.return_value = 200
+    await database.reap_expired(10)
+    assert database.memory == {"key": 99}
+    now.return_value = 210
+    await database.reap_expired(10)
+    assert database.memory == {}
+    assert database.deadlines == []
+
+
+@pytest.mark.anyio
+async def test_reaper_runs_batches_until_done(mocker, caplog):
+    database = InMemoryDatabase()
+    database.reap_interval = 0
+    database.reap_batch_size = 2
+    batches = [2, 2, 1, RuntimeError(), 0]
+    reaped = asyncio.Event()
+
+    async def reap_expired(limit):
+        result = batches.pop(0)
+        if not batches:
+            reaped.set()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    database.reap_expired = reap_expired
+    database.start_reaper()
+    await asyncio.wait_for(reaped.wait(), 1)
+    await database.stop_reaper()
+
+    assert "Unable to remove expired keys from inmem." in caplog.text
@@ -0,0 +1,310 @@
+"""A bounded queue and worker pool for events waiting to be parsed."""
+
+import asyncio
+import collections
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 10
+DEFAULT_QUEUE_SIZE = 100
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP = "drop"
+
+
+class KeyedSerializer:
+    """Run coroutines one at a time for each key and concurrently across keys.
+
+    Calls made with the same key run in the order they were made, calls with
+    different keys run concurrently. Instead of waiting for a busy key a call
+    is queued behind it and is run by whoever is running that key, so callers
+    are never stuck waiting on a key they aren't running.
+
+    State is only kept for keys which currently have a call running, so the
+    memory used stays bounded no matter how many keys are seen over time.
+
+    A call which raises is logged and the calls queued behind it still run.
+    If the caller running a key is cancelled the calls still queued for that
+    key are dropped and logged.
+
+    Args:
+        limit (int, optional): The maximum number of calls which can be queued
+            behind busy keys. Once reached, callers queueing more calls wait
+            until one of them starts.
+
+    """
+
+    def __init__(self, limit=None):
+        """Create the serializer."""
+        self._pending = {}
+        self._limit = limit
+        self._queued = 0
+        self._waiters = collections.deque()
+
+    @property
+    def active_keys(self):
+        """The number of keys which currently have a call running."""
+        return len(self._pending)
+
+    @property
+    def waiting(self):
+        """The number of calls queued behind busy keys."""
+        return self._queued
+
+    async def run(self, key, func, *args):
+        """Run ``func(*args)`` after all earlier calls with the same key.
+
+        If the key is idle the call is run straight away, followed by any
+        calls which get queued behind it in the meantime. If the key is busy
+        the call is queued and this returns without waiting for it to run.
+
+        Exceptions raised by ``func`` are logged rather than raised, so they
+        don't stop the calls queued behind it.
+
+        Args:
+            key: A hashable key to serialize calls on.
+            func: A coroutine function to call.
+            *args: Arguments to call ``func`` with.
+
+        """
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending.append((func, args))
+            self._queued += 1
+            if self._limit and self._queued > self._limit:
+                await self._wait_for_room()
+            return
+
+        pending = self._pending[key] = collections.deque()
+        try:
+            await self._call(key, func, args)
+            while pending:
+                func, args = pending.popleft()
+                self._dequeued(1)
+                await self._call(key, func, args)
+        finally:
+            del self._pending[key]
+            if pending:
+                # Only left over when the caller running the key was cancelled.
+                _LOGGER.warning(_("Dropped %s calls queued for %s."), len(pending), key)
+                self._dequeued(len(pending))
+
+    @staticmethod
+    async def _call(key, func, args):
+        """Run one call, logging rather than raising its exception."""
+        # pylint: disable=broad-except
+        # One failing call must not drop the calls queued behind it.
+        try:
+            await func(*args)
+        except Exception:
+            _LOGGER.exception(_("Exception in call queued for %s."), key)
+
+    async def _wait_for_room(self):
+        """Wait until a call queued earlier has started or been dropped."""
+        waiter = asyncio.get_event_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # We were woken but can't use the room, pass it on.
+                self._wake(1)
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def _dequeued(self, count):
+        """Record calls leaving the queue and wake callers waiting for room."""
+        self._queued -= count
+        self._wake(count)
+
+    def _wake(self, count):
+        while count and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
+
+class Dispatcher:
+    """Queue events from connectors and parse them with a pool of workers.
+
+    Without a dispatcher every connector parses events inline, so one slow
+    skill stalls the receive loop of the connector, while connectors which
+    receive events over webhooks start an unbounded number of parses.
+
+    The dispatcher is configured with the ``dispatch`` section in the
+    top level of ``configuration.yaml``. When it is running
+    `opsdroid.core.OpsDroid.parse` puts events on a bounded queue and a
+    fixed number of worker tasks take them off and parse them. When the queue
+    is full the ``overflow`` option decides whether the connector waits for a
+    free slot (``block``) or the event is dropped (``drop``).
+
+    Events from the same conversation are parsed in the order they were
+    received while different conversations are parsed concurrently. A
+    conversation is identified by the name of the connector and the target of
+    the event, and also by the user if ``order-by-user`` is set. Setting
+    ``ordered`` to false parses all events concurrently.
+
+    Args:
+        opsdroid (OpsDroid): An instance of opsdroid.core.
+
+    Attributes:
+        stats (dict): Counters for events submitted, processed and dropped,
+            along with the total and maximum time events have spent waiting
+            in the queue in seconds.
+
+    """
+
+    def __init__(self, opsdroid):
+        """Create the dispatcher."""
+        self.opsdroid = opsdroid
+        self.queue = None
+        self.workers = []
+        self.serializer = None
+        self.overflow = OVERFLOW_BLOCK
+        self.stats = {}
+        self.reset_stats()
+
+    @property
+    def config(self):
+        """The ``dispatch`` section of the opsdroid config."""
+        return self.opsdroid.config.get("dispatch") or {}
+
+    @property
+    def running(self):
+        """Whether events are currently being queued."""
+        return self.queue is not None
+
+    @property
+    def depth(self):
+        """The number of events waiting in the queue."""
+        return self.queue.qsize() if self.queue is not None else 0
+
+    @property
+    def active_conversations(self):
+        """The number of conversations which currently have events being parsed."""
+        return self.serializer.active_keys if self.serializer is not None else 0
+
+    def get_key(self, event):
+        """Return the conversation key used to order an event.
+
+        Args:
+            event (opsdroid.events.Event): The event to get the key for.
+
+        Returns:
+            tuple: The connector name and target of the event, followed by the
+                user id if ``order-by-user`` is configured.
+
+        """
+        connector = getattr(event.connector, "name", event.connector)
+        key = (connector, event.target)
+        if self.config.get("order-by-user", False):
+            key += (event.user_id,)
+        return key
+
+    def reset_stats(self):
+        """Reset the dispatch counters."""
+        self.stats = {
+            "submitted": 0,
+            "processed": 0,
+            "dropped": 0,
+            "total_wait_time": 0,
+            "max_wait_time": 0,
+        }
+
+    def start(self):
+        """Create the queue and the worker tasks.
+
+        Does nothing unless the ``dispatch`` section has been configured.
+
+        """
+        if not self.config:
+            return
+
+        workers = self.config.get("workers", DEFAULT_WORKERS)
+        self.overflow = self.config.get("overflow", OVERFLOW_BLOCK)
+        self.queue = asyncio.Queue(
+            maxsize=self.config.get("queue-size", DEFAULT_QUEUE_SIZE)
+        )
+        if self.config.get("ordered", True):
+            self.serializer = KeyedSerializer(limit=self.queue.maxsize)
+        self.workers = [
+            self.opsdroid.eventloop.create_task(self._worker()) for _ in range(workers)
+        ]
+        self.opsdroid.tasks.extend(self.workers)
+        _LOGGER.info(
+            _("Started %s dispatch workers with a queue size of %s."),
+            workers,
+            self.queue.maxsize,
+        )
+
+    async def stop(self):
+        """Cancel the worker tasks and stop queueing events."""
+        workers = [
+            worker for worker in self.workers if worker is not asyncio.current_task()
+        ]
+        self.workers = []
+        self.queue = None
+        self.serializer = None
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def submit(self, event):
+        """Put an event on the queue to be parsed.
+
+        Args:
+            event (opsdroid.events.Event): The event to parse.
+
+        Returns:
+            bool: True if the event was queued, False if it was dropped
+                because the queue was full.
+
+        """
+        item = (event, time.monotonic())
+        if self.overflow == OVERFLOW_DROP:
+            try:
+                self.queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self.stats["dropped"] += 1
+                _LOGGER.warning(_("Dispatch queue is full, dropping event %s."), event)
+                return False
+        else:
+            await self.queue.put(item)
+        self.stats["submitted"] += 1
+        return True
+
+    async def _worker(self):
+        """Take events off the queue and parse them."""
+        queue = self.queue
+        serializer = self.serializer
+        while True:
+            event, queued_at = await queue.get()
+            if serializer is None:
+                await self._process(queue, event, queued_at)
+            else:
+                await serializer.run(
+                    self.get_key(event), self._process, queue, event, queued_at
+                )
+
+    async def _process(self, queue, event, queued_at):
+        """Parse an event taken off the queue."""
+        wait_time = time.monotonic() - queued_at
+        self.stats["total_wait_time"] += wait_time
+        self.stats["max_wait_time"] = max(self.stats["max_wait_time"], wait_time)
+        # pylint: disable=broad-except
+        # A failing event must not take the worker down with it.
+        span = getattr(event, "span", None)
+        if span is not None:
+            span.set_attribute("wait_time", wait_time)
+        try:
+            await self.opsdroid.parse_event(event)
+        except Exception:
+            _LOGGER.exception(_("Exception when parsing event %s."), event)
+        finally:
+            self.stats["processed"] += 1
+            queue.task_done()
+            if span is not None:
+                span.end()
@@ -9,11 +9,11 @@ from datetime import datetime
 from random import randrange
 from bitstring import BitArray
 
-import aiohttp
 import puremagic
 import os
 from get_image_size import get_image_size_from_bytesio
 from opsdroid.helper import get_opsdroid
+from opsdroid.sessions import client_session
 from videoprops import get_video_properties
 
 _LOGGER = logging.getLogger(__name__)
@@ -100,6 +100,7 @@ class Event(metaclass=EventMetaClass):
         raw_event:  The raw event received by the connector (may be None).
         raw_parses: The raw response provided by the parser service.
         responded_to: A boolean (True/False) flag indicating if this event has already had its respond method called.
+        span: The tracing span started when this event was parsed, None unless tracing is enabled.
         user: A string containing the username of the user who created the event.
 
     """
@@ -127,6 +128,7 @@ class Event(metaclass=EventMetaClass):
         self.raw_parses = raw_parses or {}
         self.responded_to = False
         self.entities = {}
+        self.span = None
 
     async def respond(self, event):
         """Respond to this event with another event.
@@ -144,7 +146,13 @@ class Event(metaclass=EventMetaClass):
         event.connector = event.connector or self.connector
         event.linked_event = event.linked_event or self
 
-        result = await opsdroid.send(event)
+        tracer = opsdroid.tracer
+        with tracer.span(
+            "respond",
+            parent=tracer.current_span() or self.span,
+            event_type=type(event).__name__,
+        ):
+            result = await opsdroid.send(event)
 
         if not self.responded_to:
             now = datetime.now()
@@ -364,7 +372,8 @@ class File(Event):
     async def get_file_bytes(self):
         """Return the bytes representation of this file."""
         if not self._file_bytes and self.url:
-            async with aiohttp.ClientSession(trust_env=True) as session:
+            opsdroid = getattr(self.connector, "opsdroid", None)
+            async with client_session(opsdroid) as session:
                 _LOGGER.debug(self._url_headers)
                 async with session.get(self.url, headers=self._url_headers) as resp:
                     self._file_bytes = await resp.read()
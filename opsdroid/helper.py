@@ -350,6 +350,183 @@ register_json_type(
 )
 
 
+# The first byte of values encoded by `MsgpackCodec`. It is never used by
+# msgpack and can't start UTF-8 text, so those values can't be confused with
+# JSON.
+MSGPACK_MARKER = b"\xc1"
+
+
+def serialize_json_type(obj):
+    """Convert an object of a registered JSON type to a dict.
+
+    This is the ``default`` hook for codecs which don't use `JSONEncoder`.
+
+    Args:
+        obj (object): The object to be marshalled.
+
+    Raises:
+        TypeError: If the type of the object is not registered.
+
+    """
+    serializer = JSONEncoder.serializers.get(type(obj))
+    if serializer is None:
+        raise TypeError(
+            "Object of type {} is not JSON serializable".format(type(obj).__name__)
+        )
+    return serializer(obj)
+
+
+def decode_json_types(value):
+    """Apply `JSONDecoder` to every dict within a decoded value.
+
+    Dicts are decoded from the innermost out, the same order in which the
+    ``object_hook`` of `json.loads` is called.
+
+    """
+    if isinstance(value, dict):
+        return JSONDecoder()(
+            {key: decode_json_types(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return [decode_json_types(item) for item in value]
+    return value
+
+
+def _may_contain_json_types(raw):
+    """Return whether encoded JSON could contain a registered type."""
+    if isinstance(raw, str):
+        return '"__class__"' in raw
+    return b'"__class__"' in raw
+
+
+class JSONCodec:
+    """Encode data as JSON with `JSONEncoder` and decode it with `JSONDecoder`.
+
+    Every codec accepts the types registered with `register_json_type` and
+    decodes values written by any of the JSON codecs, and by `MsgpackCodec`
+    when msgpack is installed.
+
+    """
+
+    name = "json"
+
+    def __init__(self):
+        """Create the encoder."""
+        self.encoder = JSONEncoder()
+
+    def encode(self, data):
+        """Encode a data object."""
+        return self.encoder.encode(data)
+
+    def decode(self, raw):
+        """Decode a data object.
+
+        The `JSONDecoder` object hook is only used when the data could
+        contain a registered type, as calling it for every dict is slow.
+
+        """
+        if isinstance(raw, bytes) and raw.startswith(MSGPACK_MARKER):
+            return MsgpackCodec().decode(raw)
+        if _may_contain_json_types(raw):
+            return json.loads(raw, object_hook=JSONDecoder())
+        return json.loads(raw)
+
+
+class OrjsonCodec(JSONCodec):
+    """Encode and decode JSON with orjson.
+
+    The JSON is compact but otherwise the same as that of `JSONCodec`, so
+    either codec can read what the other has written.
+
+    Raises:
+        ImportError: If orjson is not installed.
+
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        """Import orjson."""
+        # pylint: disable=import-outside-toplevel,super-init-not-called
+        import orjson
+
+        self.orjson = orjson
+        self.options = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_NON_STR_KEYS
+        )
+
+    def encode(self, data):
+        """Encode a data object."""
+        return self.orjson.dumps(data, default=serialize_json_type, option=self.options)
+
+    def decode(self, raw):
+        """Decode a data object."""
+        if isinstance(raw, bytes) and raw.startswith(MSGPACK_MARKER):
+            return MsgpackCodec().decode(raw)
+        data = self.orjson.loads(raw)
+        if _may_contain_json_types(raw):
+            return decode_json_types(data)
+        return data
+
+
+class MsgpackCodec(JSONCodec):
+    """Encode and decode data with msgpack.
+
+    Values are prefixed with `MSGPACK_MARKER` so that JSON written by the
+    other codecs can still be decoded.
+
+    Raises:
+        ImportError: If msgpack is not installed.
+
+    """
+
+    name = "msgpack"
+
+    def __init__(self):
+        """Import msgpack."""
+        # pylint: disable=import-outside-toplevel,super-init-not-called
+        import msgpack
+
+        self.msgpack = msgpack
+
+    def encode(self, data):
+        """Encode a data object."""
+        return MSGPACK_MARKER + self.msgpack.packb(data, default=serialize_json_type)
+
+    def decode(self, raw):
+        """Decode a data object."""
+        if not (isinstance(raw, bytes) and raw.startswith(MSGPACK_MARKER)):
+            return JSONCodec.decode(self, raw)
+        return self.msgpack.unpackb(
+            raw[1:], object_hook=JSONDecoder(), strict_map_key=False
+        )
+
+
+CODECS = {codec.name: codec for codec in (JSONCodec, OrjsonCodec, MsgpackCodec)}
+
+
+def get_codec(name="json"):
+    """Get a codec for storing data by name.
+
+    Args:
+        name (str): One of ``json``, ``orjson`` or ``msgpack``.
+
+    Returns:
+        JSONCodec: The codec, or the ``json`` codec if the package the named
+            codec needs is not installed.
+
+    """
+    try:
+        return CODECS[name]()
+    except ImportError:
+        _LOGGER.error(
+            _("Unable to use the %s codec as it is not installed, using json."), name
+        )
+        return JSONCodec()
+
+
 class TimeoutException(RuntimeError):
     """Raised when a loop times out."""
 
@@ -8,13 +8,15 @@ from opsdroid.helper import add_skill_attributes
 _LOGGER = logging.getLogger(__name__)
 
 
-def match_event(event_type, **kwargs):
+def match_event(event_type, include_subclasses=False, **kwargs):
     """Return event type matcher.
 
     Decorator that calls skill based on passed event_type.
 
     Args:
         event_type (str): opsdroidstarted, message, typing, reaction, file, image
+        include_subclasses (bool): Also match events which are subclasses of
+            event_type, defaults to False.
         **kwargs (dict): arbitrary kwargs to be added to the event matcher
     Returns:
         Decorated function
@@ -24,7 +26,10 @@ def match_event(event_type, **kwargs):
     def matcher(func):
         """Add decorated function to list for event matching."""
         func = add_skill_attributes(func)
-        func.matchers.append({"event_type": dict(type=event_type, **kwargs)})
+        event_opts = dict(type=event_type, **kwargs)
+        if include_subclasses:
+            event_opts["include_subclasses"] = True
+        func.matchers.append({"event_type": event_opts})
         return func
 
     return matcher
@@ -289,15 +294,17 @@ def match_witai(intent):
     return matcher
 
 
-def match_crontab(crontab, timezone=None):
+def match_crontab(crontab, timezone=None, catch_up=False):
     """Return crontab match decorator.
 
     Decorator that, after enabling crontab skill config, calls a function when cron timing interval
     passes.
 
     Args:
-        crontab (str): cron timing string
+        crontab (str): cron timing string, with an optional seconds field in front
         timezone (str): timezone string, defaults to root configuration
+        catch_up (bool): run the skill once if it missed any fires because
+            opsdroid was busy or suspended, defaults to False
 
     Returns:
         Decorated Function
@@ -307,7 +314,9 @@ def match_crontab(crontab, timezone=None):
     def matcher(func):
         """Add decorated function to skills list for crontab matching."""
         func = add_skill_attributes(func)
-        func.matchers.append({"crontab": crontab, "timezone": timezone})
+        func.matchers.append(
+            {"crontab": crontab, "timezone": timezone, "catch_up": catch_up}
+        )
         return func
 
     return matcher
@@ -1,43 +1,208 @@
 """Class for persisting information in opsdroid."""
 
+import asyncio
+import collections
+import copy
+import fnmatch
 import logging
+import time
 
+from opsdroid.database import DEFAULT_PAGE_SIZE
+from opsdroid.dispatcher import KeyedSerializer
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_CACHE_SIZE = 1000
+DEFAULT_CACHE_TTL = 60
+
+WRITE_ALL = "all"
+WRITE_PRIMARY = "primary"
+WRITE_FIRE_AND_FORGET = "fire-and-forget"
+
+
+class MemoryCache:
+    """A bounded least recently used cache of values read from the databases.
+
+    Values are copied on the way in and out of the cache so that a skill
+    changing an object it got from memory doesn't change the cached value.
+    Keys are invalidated whenever they are put or deleted through `Memory`,
+    writes made by other processes are only seen once the cached value
+    expires. Keys put with a ``ttl`` through `Memory` are never cached for
+    longer than their ttl.
+
+    Args:
+        size (int): The maximum number of keys to cache.
+        ttl (float, optional): How long a value is cached for in seconds, or
+            None to cache values until they are evicted or invalidated.
+        exclude (list, optional): Shell style patterns of keys which are
+            never cached, e.g. ``shared.*``.
+
+    Attributes:
+        stats (dict): Counters for cache hits, misses and evictions.
+
+    """
+
+    def __init__(self, size=DEFAULT_CACHE_SIZE, ttl=DEFAULT_CACHE_TTL, exclude=None):
+        """Create an empty cache."""
+        self.size = size
+        self.ttl = ttl
+        self.exclude = list(exclude or [])
+        self.entries = collections.OrderedDict()
+        self.deadlines = collections.OrderedDict()
+        self.invalidations = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self):
+        """Return the number of cached keys."""
+        return len(self.entries)
+
+    def cacheable(self, key):
+        """Return whether a key may be cached."""
+        return not any(fnmatch.fnmatchcase(key, pattern) for pattern in self.exclude)
+
+    def get(self, key):
+        """Return ``(True, value)`` for a cached key or ``(False, None)``."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            expires, value = entry
+            if expires is None or expires > time.monotonic():
+                self.entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return True, copy.deepcopy(value)
+            del self.entries[key]
+        self.stats["misses"] += 1
+        return False, None
+
+    def set(self, key, value):
+        """Cache a value, evicting the least recently used key if full."""
+        now = time.monotonic()
+        expires = now + self.ttl if self.ttl is not None else None
+        deadline = self.deadlines.get(key)
+        if deadline is not None:
+            if deadline <= now:
+                del self.deadlines[key]
+            elif expires is None or deadline < expires:
+                expires = deadline
+        self.entries[key] = (expires, copy.deepcopy(value))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def expire(self, key, ttl):
+        """Never cache the current value of a key for longer than its ttl."""
+        self.deadlines[key] = time.monotonic() + ttl
+        self.deadlines.move_to_end(key)
+        while len(self.deadlines) > self.size:
+            self.deadlines.popitem(last=False)
+
+    def invalidate(self, key):
+        """Forget the cached value of a key."""
+        self.invalidations += 1
+        self.entries.pop(key, None)
+        self.deadlines.pop(key, None)
+
+    def clear(self):
+        """Forget every cached value."""
+        self.invalidations += 1
+        self.entries.clear()
+        self.deadlines.clear()
+
 
 class Memory:
     """A Memory object.
 
     An object to obtain, store and persist data outside of opsdroid.
 
+    Values read from the databases can be cached in process by adding a
+    ``cache`` section to the top level ``memory`` section of
+    ``configuration.yaml``, see `MemoryCache`.
+
+    When there is more than one database the first one is the primary.
+    Reads go to the primary and only fall back to the other databases if the
+    key isn't found there. How writes reach the databases is set by the
+    ``write-policy`` option of the ``memory`` section:
+
+    * ``all`` writes to every database concurrently and waits for them all.
+    * ``primary`` waits for the primary and writes to the other databases in
+      the background. Writes to the same key reach each database in order,
+      and opsdroid waits for them to finish when it stops.
+    * ``fire-and-forget`` waits for the primary and writes to the other
+      databases in the background without ordering them. Writes which are
+      still running when opsdroid stops are cancelled.
+
+    Args:
+        config (dict, optional): The ``memory`` section of the opsdroid
+            config.
+
     Attributes:
         databases (:obj:`list` of :obj:`Database`): List of database objects.
-        memory (:obj:`dict`): In-memory dictionary to store data.
+        cache (:obj:`MemoryCache`): The cache of values read from the
+            databases, or None if caching is disabled.
+        write_policy (str): How writes are fanned out to the databases.
+        pending (set): Background writes to secondary databases which are
+            still running.
 
     """
 
-    def __init__(self):
+    def __init__(self, config=None):
         """Create object with minimum properties."""
         self.databases = []
+        self.cache = None
+        self.write_policy = WRITE_ALL
+        self.pending = set()
+        self.serializer = KeyedSerializer()
+        self.configure(config)
 
-    async def get(self, key, default=None):
+    def configure(self, config=None):
+        """Set up the cache and write policy from the ``memory`` config.
+
+        Args:
+            config (dict, optional): The ``memory`` section of the opsdroid
+                config.
+
+        """
+        self.write_policy = (config or {}).get("write-policy", WRITE_ALL)
+        cache = (config or {}).get("cache")
+        if not cache or not cache.get("enabled", True):
+            self.cache = None
+            return
+        self.cache = MemoryCache(
+            size=cache.get("size", DEFAULT_CACHE_SIZE),
+            ttl=cache.get("ttl", DEFAULT_CACHE_TTL),
+            exclude=cache.get("exclude"),
+        )
+
+    async def get(self, key, default=None, cache=True):
         """Get data object for a given key.
 
         Gets the key value found in-memory or from the database(s).
 
         Args:
             key (str): Key to retrieve data.
+            default (obj, optional): Value to return if the key is not found.
+            cache (bool): Whether the value may be read from and stored in
+                the cache. Set this to False for data which is changed by
+                other instances of opsdroid.
 
         Returns:
             A data object for the given key, otherwise `None`.
 
         """
         _LOGGER.debug(_("Getting %s from memory."), key)
-        result = await self._get_from_database(key)
+        if cache and self.cache is not None and self.cache.cacheable(key):
+            found, result = self.cache.get(key)
+            if not found:
+                invalidations = self.cache.invalidations
+                result = await self._get_from_database(key)
+                # Don't cache a value which was overwritten while reading it.
+                if invalidations == self.cache.invalidations:
+                    self.cache.set(key, result)
+        else:
+            result = await self._get_from_database(key)
         return result or default
 
-    async def put(self, key, data):
+    async def put(self, key, data, ttl=None):
         """Put a data object to a given key.
 
         Stores the key and value in memory and the database(s).
@@ -45,10 +210,24 @@ class Memory:
         Args:
             key (str): Key for the data to store.
             data (obj): Data object to store.
+            ttl (float, optional): How long to keep the key for in seconds.
+                The key is no longer returned once it expires. By default it
+                is kept until it is deleted.
+
+        Raises:
+            NotImplementedError: If a ttl is given and one of the databases
+                doesn't support it.
 
         """
         _LOGGER.debug(_("Putting %s to memory."), key)
-        await self._put_to_database(key, data)
+        self._check_ttl(ttl)
+        try:
+            await self._put_to_database(key, data, ttl)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(key)
+                if ttl is not None:
+                    self.cache.expire(key, ttl)
 
     async def delete(self, key):
         """Delete data object for a given key.
@@ -60,12 +239,174 @@ class Memory:
 
         """
         _LOGGER.debug(_("Deleting %s from memory."), key)
-        await self._delete_from_database(key)
+        try:
+            await self._delete_from_database(key)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(key)
+
+    async def get_many(self, keys, default=None, cache=True):
+        """Get data objects for several keys at once.
+
+        Keys which aren't cached are read from the databases together, using
+        a single query where the database supports it.
+
+        Args:
+            keys (list): Keys to retrieve data for.
+            default (obj, optional): Value to use for keys which are not found.
+            cache (bool): Whether values may be read from and stored in the
+                cache, see `Memory.get`.
+
+        Returns:
+            dict: The data object for each key, or ``default`` for keys which
+                were not found.
+
+        """
+        keys = list(keys)
+        _LOGGER.debug(_("Getting %s keys from memory."), len(keys))
+        results = await self._get_many(keys, cache)
+        return {key: results.get(key) or default for key in keys}
+
+    async def _get_many(self, keys, cache=True):
+        """Get data objects for several keys from the cache or databases.
+
+        Returns:
+            dict: The data object for each key which was found. Keys which
+                are cached as not found map to None.
+
+        """
+        use_cache = cache and self.cache is not None
+        results = {}
+        missing = []
+        for key in keys:
+            if use_cache and self.cache.cacheable(key):
+                found, result = self.cache.get(key)
+                if found:
+                    results[key] = result
+                    continue
+            missing.append(key)
+
+        if missing:
+            invalidations = self.cache.invalidations if use_cache else None
+            found = await self._get_many_from_database(missing)
+            results.update(found)
+            # Don't cache values which were overwritten while reading them.
+            if use_cache and invalidations == self.cache.invalidations:
+                for key in missing:
+                    if self.cache.cacheable(key):
+                        self.cache.set(key, found.get(key))
+
+        return results
+
+    async def put_many(self, items, ttl=None):
+        """Put several data objects at once.
+
+        Args:
+            items (dict): Data objects to store, by key.
+            ttl (float, optional): How long to keep the keys for in seconds,
+                see `Memory.put`.
+
+        """
+        _LOGGER.debug(_("Putting %s keys to memory."), len(items))
+        self._check_ttl(ttl)
+        try:
+            if ttl is None:
+                await self._write_to_databases("put_many", items)
+            else:
+                await self._write_to_databases("put_many", items, ttl)
+        finally:
+            if self.cache is not None:
+                for key in items:
+                    self.cache.invalidate(key)
+                    if ttl is not None:
+                        self.cache.expire(key, ttl)
+
+    async def delete_many(self, keys):
+        """Delete the data objects for several keys at once.
+
+        Args:
+            keys (list): Keys to delete data for.
+
+        """
+        keys = list(keys)
+        _LOGGER.debug(_("Deleting %s keys from memory."), len(keys))
+        try:
+            await self._write_to_databases("delete_many", keys)
+        finally:
+            if self.cache is not None:
+                for key in keys:
+                    self.cache.invalidate(key)
+
+    async def scan(self, prefix="", values=False, page_size=DEFAULT_PAGE_SIZE):
+        """Iterate over the keys which start with a prefix.
+
+        Only the keys in the primary database are scanned. Keys are fetched
+        from the database a page at a time, so scanning a large database
+        doesn't load all of it into memory.
+
+        Args:
+            prefix (str): Only yield keys which start with this.
+            values (bool): Whether to yield ``(key, value)`` pairs rather
+                than keys. The values are read a page at a time, as with
+                `Memory.get_many`, and keys deleted before their value is
+                read are skipped.
+            page_size (int): How many keys to fetch at once.
+
+        Yields:
+            Each matching key, or ``(key, value)`` pair.
+
+        Example:
+            Counting the reminders stored by a skill::
+
+                count = 0
+                async for key in opsdroid.memory.scan("reminders."):
+                    count += 1
+
+        """
+        _LOGGER.debug(_("Scanning memory for keys starting with %r."), prefix)
+        if not self.databases:
+            return
+        keys = self.databases[0].iter_keys(prefix, page_size=page_size)
+        if not values:
+            async for key in keys:
+                yield key
+            return
+
+        page = []
+        async for key in keys:
+            page.append(key)
+            if len(page) >= page_size:
+                for item in await self._get_page(page):
+                    yield item
+                page = []
+        for item in await self._get_page(page):
+            yield item
+
+    async def _get_page(self, keys):
+        """Return the ``(key, value)`` pairs of the keys which still exist."""
+        if not keys:
+            return []
+        found = await self._get_many(keys)
+        return [(key, found[key]) for key in keys if found.get(key) is not None]
+
+    async def flush(self):
+        """Finish the background writes to secondary databases.
+
+        With the ``primary`` write policy this waits for the writes to
+        finish, with ``fire-and-forget`` they are cancelled.
+
+        """
+        pending = list(self.pending)
+        if self.write_policy == WRITE_FIRE_AND_FORGET:
+            for task in pending:
+                task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
     async def _get_from_database(self, key):
         """Get updates from databases for a given key.
 
-        Gets the first key value found from the database(s).
+        Reads from the primary database first and only tries the others in
+        turn if the key isn't found.
 
         Args:
             key (str): Key to retrieve data from a database.
@@ -74,41 +415,142 @@ class Memory:
             The first key value (data object) found from the database(s).
             Or `None` when no database is defined or no value is found.
 
-        Todo:
-            * Handle multiple databases
-
         """
         if not self.databases:
             return None  # pragma: nocover
 
-        results = []
         for database in self.databases:
-            results.append(await database.get(key))
-        return results[0]
+            result = await database.get(key)
+            if result is not None:
+                return result
+        return None
+
+    async def _get_many_from_database(self, keys):
+        """Get updates from databases for several keys.
+
+        Reads the keys from the primary database first, then asks each of the
+        other databases in turn for the keys which are still missing.
+
+        Args:
+            keys (list): Keys to retrieve data from the databases.
+
+        Returns:
+            dict: The data object for each key which was found.
 
-    async def _put_to_database(self, key, data):
+        """
+        results = {}
+        missing = keys
+        for database in self.databases:
+            if not missing:
+                break
+            found = await database.get_many(missing)
+            results.update(
+                (key, data) for key, data in found.items() if data is not None
+            )
+            missing = [key for key in missing if key not in results]
+        return results
+
+    async def _put_to_database(self, key, data, ttl=None):
         """Put updates into databases for a given key.
 
-        Stores the key and value on each database defined.
+        Stores the key and value on each database defined, according to the
+        write policy.
 
         Args:
             key (str): Key for the data to store.
             data (obj): Data object to store.
+            ttl (float, optional): How long to keep the key for in seconds.
 
         """
-        if self.databases:
-            for database in self.databases:
-                await database.put(key, data)
+        if ttl is None:
+            await self._write_to_databases("put", key, data)
+        else:
+            await self._write_to_databases("put", key, data, ttl)
+
+    def _check_ttl(self, ttl):
+        """Make sure a ttl is valid and every database supports it."""
+        if ttl is None:
+            return
+        if ttl <= 0:
+            raise ValueError(_("The ttl must be a positive number of seconds."))
+        unsupported = [
+            database.name for database in self.databases if not database.supports_ttl
+        ]
+        if unsupported:
+            raise NotImplementedError(
+                _("Keys with a ttl are not supported by the %s database.")
+                % ", ".join(unsupported)
+            )
 
     async def _delete_from_database(self, key):
         """Delete data from databases for a given key.
 
-        Deletes the key and value on each database defined.
+        Deletes the key and value on each database defined, according to the
+        write policy.
 
         Args:
             key (str): Key for the data to delete.
 
         """
-        if self.databases:
-            for database in self.databases:
-                await database.delete(key)
+        await self._write_to_databases("delete", key)
+
+    async def _write_to_databases(self, method, *args):
+        """Call a write method of every database according to the write policy.
+
+        Args:
+            method (str): The name of the `opsdroid.database.Database` method.
+            *args: The arguments to the method.
+
+        """
+        if not self.databases:
+            return
+
+        if self.write_policy == WRITE_ALL:
+            await asyncio.gather(
+                *[getattr(database, method)(*args) for database in self.databases]
+            )
+            return
+
+        primary, *secondaries = self.databases
+        await getattr(primary, method)(*args)
+        for database in secondaries:
+            if self.write_policy == WRITE_PRIMARY:
+                # Replicate key by key so that batch writes stay in order with
+                # single key writes to the same keys.
+                for key, write in self._split_by_key(method, *args):
+                    self._run_in_background(
+                        self.serializer.run(
+                            (id(database), key), self._write_secondary, database, *write
+                        )
+                    )
+            else:
+                self._run_in_background(self._write_secondary(database, method, *args))
+
+    @staticmethod
+    def _split_by_key(method, *args):
+        """Split a write into ``(key, (method, *args))`` single key writes."""
+        if method == "put_many":
+            return [
+                (key, ("put", key, data, *args[1:])) for key, data in args[0].items()
+            ]
+        if method == "delete_many":
+            return [(key, ("delete", key)) for key in args[0]]
+        return [(args[0], (method, *args))]
+
+    def _run_in_background(self, write):
+        """Run a write to a secondary database as a pending task."""
+        task = asyncio.ensure_future(write)
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+
+    @staticmethod
+    async def _write_secondary(database, method, *args):
+        """Write to a secondary database, logging rather than raising errors."""
+        # pylint: disable=broad-except
+        # The write to the primary has already succeeded.
+        try:
+            await getattr(database, method)(*args)
+        except Exception:
+            _LOGGER.exception(
+                _("Unable to %s in secondary database %s."), method, database.name
+            )
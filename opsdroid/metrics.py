@@ -0,0 +1,319 @@
+"""Counters and histograms exposed in the Prometheus text format."""
+
+import bisect
+import math
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _format_value(value):
+    """Format a sample value the way Prometheus expects."""
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _format_labels(names, values):
+    """Format label pairs, escaping the values."""
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+        pairs.append('{}="{}"'.format(name, value))
+    return "{" + ",".join(pairs) + "}"
+
+
+class _CounterChild:
+    """The value of a counter for one set of labels."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        """Increase the counter."""
+        self.value += amount
+
+
+class _HistogramChild:
+    """The buckets of a histogram for one set of labels."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        # One more count than bounds for observations above the largest bound.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        """Record an observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metric:
+    """A metric with a value for each combination of label values.
+
+    Args:
+        name (str): The name of the metric.
+        documentation (str): A description of the metric.
+        labelnames (tuple): The names of the labels of the metric.
+
+    """
+
+    type = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+        """Create the metric."""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        """Return the value for a set of label values, creating it if needed.
+
+        Args:
+            *values: A value for each of the label names, in order.
+
+        """
+        try:
+            return self._children[values]
+        except KeyError:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    "{} takes the labels {}".format(self.name, self.labelnames)
+                )
+            child = self._children[values] = self._new_child()
+            return child
+
+    def clear(self):
+        """Remove all recorded values."""
+        self._children = {}
+
+    def samples(self):
+        """Yield ``(name, labelnames, labelvalues, value)`` for every sample."""
+        raise NotImplementedError
+
+    def render(self):
+        """Return the metric in the Prometheus text format."""
+        lines = [
+            "# HELP {} {}".format(self.name, self.documentation),
+            "# TYPE {} {}".format(self.name, self.type),
+        ]
+        for name, labelnames, labelvalues, value in self.samples():
+            lines.append(
+                "{}{} {}".format(
+                    name, _format_labels(labelnames, labelvalues), _format_value(value)
+                )
+            )
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """A value which only goes up, such as the number of events received."""
+
+    type = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, *values, amount=1):
+        """Increase the counter for a set of label values."""
+        self.labels(*values).inc(amount)
+
+    def get(self, *values):
+        """Return the value of the counter for a set of label values."""
+        child = self._children.get(values)
+        return child.value if child else 0
+
+    def samples(self):
+        """Yield the value for every set of labels."""
+        for values, child in self._children.items():
+            yield self.name, self.labelnames, values, child.value
+
+
+class Gauge(Metric):
+    """A value which goes up and down, such as the number of queued events."""
+
+    type = "gauge"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def set(self, value, *values):
+        """Set the gauge for a set of label values."""
+        self.labels(*values).value = value
+
+    def get(self, *values):
+        """Return the value of the gauge for a set of label values."""
+        child = self._children.get(values)
+        return child.value if child else 0
+
+    def samples(self):
+        """Yield the value for every set of labels."""
+        for values, child in self._children.items():
+            yield self.name, self.labelnames, values, child.value
+
+
+class Histogram(Metric):
+    """Observations counted in buckets, such as the duration of skill runs.
+
+    Args:
+        name (str): The name of the metric.
+        documentation (str): A description of the metric.
+        labelnames (tuple): The names of the labels of the metric.
+        buckets (tuple): The upper bounds of the buckets, in seconds for
+            durations.
+
+    """
+
+    type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """Create the histogram."""
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, amount, *values):
+        """Record an observation for a set of label values."""
+        self.labels(*values).observe(amount)
+
+    def get(self, *values):
+        """Return the child holding the buckets for a set of label values."""
+        return self._children.get(values)
+
+    def samples(self):
+        """Yield the cumulative buckets, sum and count for every set of labels."""
+        labelnames = self.labelnames + ("le",)
+        for values, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                yield self.name + "_bucket", labelnames, values + (
+                    _format_value(float(bound)),
+                ), cumulative
+            yield self.name + "_sum", self.labelnames, values, child.sum
+            yield self.name + "_count", self.labelnames, values, child.count
+
+
+class Registry:
+    """A collection of metrics which are rendered together."""
+
+    def __init__(self):
+        """Create an empty registry."""
+        self.metrics = []
+
+    def register(self, metric):
+        """Add a metric to the registry and return it."""
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        """Create and register a `Counter`."""
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        """Create and register a `Gauge`."""
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """Create and register a `Histogram`."""
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def clear(self):
+        """Remove the recorded values of every metric."""
+        for metric in self.metrics:
+            metric.clear()
+
+    def render(self):
+        """Return every metric in the Prometheus text format."""
+        return "\n".join(metric.render() for metric in self.metrics) + "\n"
+
+
+class Metrics(Registry):
+    """The metrics opsdroid records about itself.
+
+    An instance is created for each `opsdroid.core.OpsDroid` as
+    ``opsdroid.metrics`` and is served by the web server at ``/metrics``.
+
+    """
+
+    def __init__(self):
+        """Create the opsdroid metrics."""
+        super().__init__()
+        self.events_received = self.counter(
+            "opsdroid_events_received_total",
+            "Events received from connectors.",
+            ("connector", "event_type"),
+        )
+        self.parse_duration = self.histogram(
+            "opsdroid_parse_duration_seconds",
+            "Time spent in each stage of parsing an event.",
+            ("stage",),
+        )
+        self.skill_duration = self.histogram(
+            "opsdroid_skill_duration_seconds",
+            "Time spent running skills.",
+            ("skill",),
+        )
+        self.skill_errors = self.counter(
+            "opsdroid_skill_errors_total",
+            "Skill runs which raised an exception or timed out.",
+            ("skill",),
+        )
+        self.send_duration = self.histogram(
+            "opsdroid_send_duration_seconds",
+            "Time spent sending events with connectors.",
+            ("connector",),
+        )
+        self.webhook_calls = self.counter(
+            "opsdroid_webhook_calls_total",
+            "Skills called via webhooks.",
+            ("skill", "webhook"),
+        )
+        self.connector_queue_depth = self.gauge(
+            "opsdroid_connector_queue_depth",
+            "Events received by connectors which are waiting to be handled.",
+            ("connector",),
+        )
+        self.connector_queue_lag = self.histogram(
+            "opsdroid_connector_queue_lag_seconds",
+            "Time events received by connectors waited before being handled.",
+            ("connector",),
+        )
+        self.connector_duplicate_events = self.counter(
+            "opsdroid_connector_duplicate_events_total",
+            "Events dropped by connectors because they had already been received.",
+            ("connector",),
+        )
+        self.connector_send_queue_depth = self.gauge(
+            "opsdroid_connector_send_queue_depth",
+            "Calls from connectors to chat service APIs which haven't finished.",
+            ("connector",),
+        )
+        self.connector_throttle_duration = self.histogram(
+            "opsdroid_connector_throttle_duration_seconds",
+            "Time connectors waited to stay within chat service rate limits.",
+            ("connector", "method"),
+        )
+        self.connector_rate_limited = self.counter(
+            "opsdroid_connector_rate_limited_total",
+            "Calls from connectors which the chat service rate limited.",
+            ("connector", "method"),
+        )
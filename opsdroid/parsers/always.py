@@ -8,7 +8,5 @@ _LOGGER = logging.getLogger(__name__)
 
 async def parse_always(opsdroid, message):
     """Parse a message always."""
-    for skill in opsdroid.skills:
-        for matcher in skill.matchers:
-            if "always" in matcher:
-                await opsdroid.run_skill(skill, skill.config, message)
+    for matcher in opsdroid.matcher_index.matchers("always"):
+        await opsdroid.run_skill(matcher.skill, matcher.skill.config, message)
@@ -9,12 +9,7 @@ _LOGGER = logging.getLogger(__name__)
 
 async def parse_catchall(opsdroid, event):
     """Parse an event against catch-all skills, if found."""
-    for skill in opsdroid.skills:
-        for matcher in skill.matchers:
-            if "catchall" in matcher:
-                if (
-                    matcher["messages_only"]
-                    and isinstance(event, events.Message)
-                    or not matcher["messages_only"]
-                ):
-                    await opsdroid.run_skill(skill, skill.config, event)
+    is_message = isinstance(event, events.Message)
+    for matcher in opsdroid.matcher_index.matchers("catchall"):
+        if is_message or not matcher.matcher["messages_only"]:
+            await opsdroid.run_skill(matcher.skill, matcher.skill.config, event)
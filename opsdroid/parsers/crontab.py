@@ -1,26 +1,298 @@
 """A helper function for parsing and executing crontab skills."""
-import time
 import asyncio
+import calendar
+import heapq
+import itertools
 import logging
+import time
+from datetime import datetime, timedelta
 
 import arrow
-import pycron
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# The longest the scheduler sleeps before checking for new skills and jumps
+# in the wall clock, for example after the machine has been suspended.
+MAX_SLEEP = 60
+# How late a fire can be before it is treated as missed.
+MISFIRE_GRACE = 1
+# How far ahead to look for the next fire before giving up.
+MAX_DAYS = 8 * 366
+
+DAY_NAMES = [day.lower() for day in calendar.day_name[6:] + calendar.day_name[:6]]
+DAY_ABBRS = [day.lower() for day in calendar.day_abbr[6:] + calendar.day_abbr[:6]]
+
+
+def _to_int(value, names=False):
+    """Convert a crontab value to an int, allowing day names if ``names`` is set."""
+    if value.isnumeric():
+        return int(value)
+    if names and value.lower() in DAY_NAMES:
+        return DAY_NAMES.index(value.lower())
+    if names and value.lower() in DAY_ABBRS:
+        return DAY_ABBRS.index(value.lower())
+    raise ValueError("{value} is not a valid crontab value.".format(value=value))
+
+
+def _parse_field(field, low, high, names=False):
+    """Return the sorted values a crontab field matches.
+
+    Supports ``*``, single values, ranges, lists and steps, e.g.
+    ``*/15``, ``1-5``, ``mon-fri`` or ``0,30``.
+
+    """
+    values = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step = part.split("/")
+            step = _to_int(step)
+            if step < 1:
+                raise ValueError("Crontab steps must be at least 1.")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start, end = (_to_int(value, names) for value in part.split("-"))
+        else:
+            start = _to_int(part, names)
+            end = high if step > 1 else start
+
+        if names and start > end:
+            # Day ranges like fri-mon wrap around the end of the week.
+            values.update(range(start, 7, step))
+            values.update(range(0, end + 1, step))
+            continue
+        if start < low or end > high:
+            raise ValueError(
+                "{field} is outside the range {low}-{high}.".format(
+                    field=field, low=low, high=high
+                )
+            )
+        values.update(range(start, end + 1, step))
+
+    if names:
+        # Both 0 and 7 mean Sunday.
+        values = {value % 7 for value in values}
+    return sorted(values)
+
+
+class Crontab:
+    """A compiled crontab expression.
+
+    Expressions have the five fields minute, hour, day of month, month and day
+    of week. An optional sixth field in front of the others sets the seconds,
+    so ``*/10 * * * * *`` fires every ten seconds. When both day fields are
+    restricted a day matching either of them fires, as with ``pycron``.
+
+    Args:
+        expression (str): The crontab expression.
+
+    Raises:
+        ValueError: If the expression is not valid.
+
+    """
+
+    def __init__(self, expression):
+        """Compile the expression."""
+        self.expression = expression
+        fields = expression.split()
+        if len(fields) == 5:
+            fields = ["0"] + fields
+        if len(fields) != 6:
+            raise ValueError(
+                "{expression} is not a valid crontab expression.".format(
+                    expression=expression
+                )
+            )
+        second, minute, hour, day, month, weekday = fields
+        self.seconds = _parse_field(second, 0, 59)
+        self.minutes = _parse_field(minute, 0, 59)
+        self.hours = _parse_field(hour, 0, 23)
+        self.days = set(_parse_field(day, 1, 31))
+        self.months = set(_parse_field(month, 1, 12))
+        self.weekdays = set(_parse_field(weekday, 0, 7, names=True))
+        self.either_day = "*" not in day and "*" not in weekday
+
+    def matches_day(self, date):
+        """Return whether the crontab fires at some time on a date."""
+        if date.month not in self.months:
+            return False
+        day = date.day in self.days
+        # Python counts weekdays from Monday, crontab counts from Sunday.
+        weekday = (date.weekday() + 1) % 7 in self.weekdays
+        return day or weekday if self.either_day else day and weekday
+
+    def _first_time(self, after=None):
+        """Return the first (hour, minute, second) on a day at or after ``after``."""
+        for hour in self.hours:
+            if after and hour < after.hour:
+                continue
+            same_hour = after and hour == after.hour
+            for minute in self.minutes:
+                if same_hour and minute < after.minute:
+                    continue
+                same_minute = same_hour and minute == after.minute
+                for second in self.seconds:
+                    if same_minute and second < after.second:
+                        continue
+                    return hour, minute, second
+        return None
+
+    def next_after(self, moment):
+        """Return the first time the crontab fires after a naive datetime.
+
+        Args:
+            moment (datetime.datetime): A naive datetime in the timezone the
+                crontab is aligned with.
+
+        Returns:
+            datetime.datetime: The next naive datetime the crontab fires at.
+
+        Raises:
+            ValueError: If the crontab never fires, e.g. on the 30th of February.
+
+        """
+        start = moment.replace(microsecond=0) + timedelta(seconds=1)
+        date = start.date()
+        for _ in range(MAX_DAYS):
+            if self.matches_day(date):
+                first = self._first_time(start if date == start.date() else None)
+                if first is not None:
+                    return datetime(date.year, date.month, date.day, *first)
+            date += timedelta(days=1)
+        raise ValueError("{expression} never fires.".format(expression=self.expression))
+
+
+class CrontabScheduler:
+    """Run crontab skills when their crontab fires.
+
+    The next time each crontab matcher fires is kept in a heap, and the
+    scheduler sleeps until the earliest one rather than waking up every minute
+    to check every skill. Skills which are due are started concurrently so a
+    slow skill doesn't hold up the others.
+
+    If the event loop stalls or the machine is suspended past the time a skill
+    should have fired a warning is logged and the fire is skipped, unless the
+    matcher was created with ``catch_up`` in which case the skill is run once
+    to make up for the fires it missed.
+
+    Args:
+        opsdroid (OpsDroid): An instance of opsdroid.core.
+
+    """
+
+    def __init__(self, opsdroid):
+        """Create the scheduler."""
+        self.opsdroid = opsdroid
+        self.heap = []
+        self.tasks = set()
+        self._matchers = None
+        self._size = 0
+        self._counter = itertools.count()
+        self._timezones = {}
+
+    def _get_timezone(self, matcher):
+        timezone = matcher.matcher.get("timezone")
+        if timezone is None:
+            timezone = self.opsdroid.config.get("timezone", "UTC")
+        if timezone not in self._timezones:
+            self._timezones[timezone] = arrow.now(tz=timezone).tzinfo
+        return self._timezones[timezone]
+
+    def next_fire(self, crontab, tzinfo, after):
+        """Return the timestamp a crontab next fires at after another timestamp."""
+        moment = datetime.fromtimestamp(after, tzinfo).replace(tzinfo=None)
+        while True:
+            moment = crontab.next_after(moment)
+            when = moment.replace(tzinfo=tzinfo).timestamp()
+            # Wall clock times repeated when daylight saving ends can map to
+            # a timestamp which has already passed.
+            if when > after:
+                return when
+
+    def _push(self, when, entry):
+        heapq.heappush(self.heap, (when, next(self._counter), entry))
+
+    def schedule(self, now=None):
+        """Rebuild the heap from the crontab matchers in the matcher index."""
+        now = time.time() if now is None else now
+        self._matchers = self.opsdroid.matcher_index.matchers("crontab")
+        self._size = len(self._matchers)
+        self.heap = []
+        for matcher in self._matchers:
+            try:
+                crontab = Crontab(matcher.opts)
+                entry = (matcher, crontab, self._get_timezone(matcher))
+                self._push(self.next_fire(crontab, entry[2], now), entry)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    _("Unable to schedule crontab '%s' for skill '%s'."),
+                    matcher.opts,
+                    matcher.skill.config.get("name"),
+                )
+
+    def _refresh(self):
+        matchers = self.opsdroid.matcher_index.matchers("crontab")
+        if matchers is not self._matchers or len(matchers) != self._size:
+            self.schedule()
+
+    def fire_due(self, now):
+        """Start every skill which is due and schedule its next fire.
+
+        Args:
+            now (float): The current timestamp.
+
+        """
+        while self.heap and self.heap[0][0] <= now:
+            when, _order, entry = heapq.heappop(self.heap)
+            matcher, crontab, tzinfo = entry
+            late = now - when > MISFIRE_GRACE
+            on_time = not late or (
+                self.next_fire(crontab, tzinfo, now - MISFIRE_GRACE) <= now
+            )
+            if late:
+                _LOGGER.warning(
+                    _("Crontab skill '%s' missed fires since %s."),
+                    matcher.skill.config.get("name"),
+                    time.ctime(when),
+                )
+            if on_time or (late and matcher.matcher.get("catch_up", False)):
+                self._run(matcher.skill)
+            self._push(self.next_fire(crontab, tzinfo, now), entry)
+
+    def _run(self, skill):
+        _LOGGER.debug(
+            _("Running crontab skill '%s' at %s."),
+            skill.config.get("name"),
+            time.asctime(),
+        )
+        task = self.opsdroid.eventloop.create_task(
+            self.opsdroid.run_skill(skill, skill.config, None)
+        )
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def run(self):
+        """Sleep until the next crontab fires and run it, for as long as opsdroid runs."""
+        try:
+            while self.opsdroid.eventloop.is_running():
+                self._refresh()
+                now = time.time()
+                wake = now + MAX_SLEEP
+                if self.heap:
+                    wake = min(wake, self.heap[0][0])
+                await asyncio.sleep(max(wake - now, 0))
+                # Having slept until the wake time it has been reached, even if
+                # the wall clock is a fraction behind the event loop clock.
+                self.fire_due(max(time.time(), wake))
+        except asyncio.CancelledError:
+            for task in self.tasks:
+                task.cancel()
+            raise
+        await asyncio.gather(*self.tasks)
+
 
 async def parse_crontab(opsdroid):
-    """Parse all crontab skills against the current time."""
-    while opsdroid.eventloop.is_running():
-        await asyncio.sleep(60 - arrow.now().time().second)
-        _LOGGER.debug(_("Running crontab skills at %s."), time.asctime())
-        for skill in opsdroid.skills:
-            for matcher in skill.matchers:
-                if "crontab" in matcher:
-                    if matcher["timezone"] is not None:
-                        timezone = matcher["timezone"]
-                    else:
-                        timezone = opsdroid.config.get("timezone", "UTC")
-                    if pycron.is_now(matcher["crontab"], arrow.now(tz=timezone)):
-                        await opsdroid.run_skill(skill, skill.config, None)
+    """Run crontab skills when their crontab fires."""
+    await CrontabScheduler(opsdroid).run()
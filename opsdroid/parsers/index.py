@@ -0,0 +1,300 @@
+"""An index of skill matchers shared by the parsers."""
+
+import collections
+import logging
+
+import parse
+import regex
+
+from opsdroid.parsers.event_type import resolve_event_type
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_UNREGISTERED_INDEXES = 32
+
+
+class IndexedMatcher:
+    """A matcher which has been precompiled by the `MatcherIndex`.
+
+    Args:
+        skill: The skill the matcher belongs to.
+        matcher (dict): The matcher as added to ``skill.matchers``.
+        opts: The options stored under the matcher type key.
+        match (callable): A function which takes a string and returns a match
+            result or ``None``, for matcher types which can be compiled.
+
+    """
+
+    __slots__ = ("skill", "matcher", "opts", "match")
+
+    def __init__(self, skill, matcher, opts, match=None):
+        """Create the indexed matcher."""
+        self.skill = skill
+        self.matcher = matcher
+        self.opts = opts
+        self.match = match
+
+
+def compile_regex(opts):
+    """Compile the options of a regex matcher into a match function.
+
+    Args:
+        opts (dict): The options of a ``regex`` matcher.
+
+    Returns:
+        callable: The bound ``search``, ``match`` or ``fullmatch`` method of the
+            compiled pattern.
+
+    """
+    flags = 0 if opts["case_sensitive"] else regex.IGNORECASE
+    pattern = regex.compile(opts["expression"], flags)
+    condition = opts["matching_condition"].lower()
+    if condition == "search":
+        return pattern.search
+    if condition == "fullmatch":
+        return pattern.fullmatch
+    return pattern.match
+
+
+def compile_format(opts):
+    """Compile the options of a parse_format matcher into a match function.
+
+    Args:
+        opts (dict): The options of a ``parse_format`` matcher.
+
+    Returns:
+        callable: The bound ``parse`` or ``search`` method of the compiled
+            format.
+
+    """
+    parser = parse.compile(opts["expression"], case_sensitive=opts["case_sensitive"])
+    if opts["matching_condition"].lower() == "search":
+        return parser.search
+    return parser.parse
+
+
+def _bumps_generation(name):
+    """Wrap a list method so calling it bumps the generation of the list."""
+    method = getattr(list, name)
+
+    def mutate(self, *args, **kwargs):
+        self.generation += 1
+        return method(self, *args, **kwargs)
+
+    mutate.__name__ = name
+    mutate.__doc__ = method.__doc__
+    return mutate
+
+
+class SkillList(list):
+    """A list of skills which counts the changes made to it.
+
+    ``opsdroid.skills`` is a `SkillList` so the `MatcherIndex` can tell
+    exactly when it has changed, including skills being replaced in place,
+    without comparing the skills themselves.
+
+    Attributes:
+        generation (int): Incremented by every change to the list.
+
+    """
+
+    generation = 0
+
+    __setitem__ = _bumps_generation("__setitem__")
+    __delitem__ = _bumps_generation("__delitem__")
+    __iadd__ = _bumps_generation("__iadd__")
+    __imul__ = _bumps_generation("__imul__")
+    append = _bumps_generation("append")
+    extend = _bumps_generation("extend")
+    insert = _bumps_generation("insert")
+    pop = _bumps_generation("pop")
+    remove = _bumps_generation("remove")
+    clear = _bumps_generation("clear")
+    sort = _bumps_generation("sort")
+    reverse = _bumps_generation("reverse")
+
+
+class MatcherIndex:
+    """Skill matchers grouped by type with their patterns precompiled.
+
+    Rather than every parser walking each skill and each of its matchers for
+    every event the index is built once when skills are registered. Parsers
+    can then ask for the matchers of a single type and only touch the skills
+    which could possibly match.
+
+    The index is built from ``opsdroid.skills``, which is a `SkillList`. It
+    rebuilds itself whenever that list is replaced or its generation shows
+    it was changed without going through `MatcherIndex.add`, so skills added,
+    removed or swapped in ``opsdroid.skills`` directly are still picked up.
+
+    Matchers are asked for from lists of skills which weren't all registered
+    are indexed separately. Those indexes are kept, by the ids of the skills,
+    until the index is rebuilt so each list is only compiled once.
+
+    Event type matchers are looked up by the class of the event instead. The
+    first time an event class is seen the matchers which apply to it are
+    found by walking its MRO, and the result is kept until the index changes.
+
+    Args:
+        opsdroid (OpsDroid): The opsdroid instance whose skills are indexed.
+
+    """
+
+    compilers = {"regex": compile_regex, "parse_format": compile_format}
+
+    def __init__(self, opsdroid):
+        """Create an empty index."""
+        self.opsdroid = opsdroid
+        self._skills = None
+        self._generation = None
+        self._skill_ids = set()
+        self._matchers = {}
+        self._event_classes = {}
+        self._unregistered = collections.OrderedDict()
+
+    def build(self, skills=None):
+        """Rebuild the index.
+
+        Args:
+            skills (list, optional): The list of skills to index. Defaults to
+                ``opsdroid.skills``.
+
+        """
+        if skills is None:
+            skills = self.opsdroid.skills
+        self._skills = skills
+        self._generation = getattr(skills, "generation", None)
+        self._skill_ids = set()
+        self._matchers = {}
+        self._event_classes = {}
+        self._unregistered = collections.OrderedDict()
+        for skill in skills:
+            self._index_skill(skill)
+        _LOGGER.debug(
+            "Indexed %s matchers for %s skills.",
+            sum(len(matchers) for matchers in self._matchers.values()),
+            len(skills),
+        )
+
+    def add(self, skill):
+        """Add a skill which has just been appended to ``opsdroid.skills``.
+
+        Args:
+            skill: The newly registered skill.
+
+        """
+        skills = self.opsdroid.skills
+        if (
+            self._skills is not skills
+            or self._generation is None
+            or skills.generation != self._generation + 1
+        ):
+            self.build()
+            return
+        self._index_skill(skill)
+        self._generation = skills.generation
+        self._event_classes = {}
+
+    def _index_skill(self, skill):
+        self._skill_ids.add(id(skill))
+        matchers = getattr(skill, "matchers", None)
+        if not isinstance(matchers, list):
+            return
+        for matcher in matchers:
+            if not matcher:
+                continue
+            # The matcher type is always the first key, any others are options.
+            matcher_type = next(iter(matcher))
+            opts = matcher[matcher_type]
+            compiler = self.compilers.get(matcher_type)
+            match = compiler(opts) if compiler else None
+            self._matchers.setdefault(matcher_type, []).append(
+                IndexedMatcher(skill, matcher, opts, match)
+            )
+
+    def _refresh(self):
+        skills = self.opsdroid.skills
+        if (
+            self._skills is not skills
+            or self._generation is None
+            or skills.generation != self._generation
+        ):
+            self.build()
+
+    def matchers(self, matcher_type, skills=None):
+        """Return the indexed matchers of one type.
+
+        Args:
+            matcher_type (str): The matcher key, e.g. ``regex`` or ``parse_format``.
+            skills (list, optional): Only return matchers belonging to these
+                skills, for example the skills left after constraints have
+                been applied. Defaults to all indexed skills.
+
+        Returns:
+            list: `IndexedMatcher` objects in skill registration order.
+
+        """
+        self._refresh()
+
+        matchers = self._matchers.get(matcher_type, [])
+        if skills is None or skills is self._skills:
+            return matchers
+
+        allowed = {id(skill) for skill in skills}
+        if not allowed <= self._skill_ids:
+            # Some of these skills were never registered, index them separately.
+            index = self._unregistered_index(skills)
+            return index._matchers.get(matcher_type, [])
+        return [matcher for matcher in matchers if id(matcher.skill) in allowed]
+
+    def _unregistered_index(self, skills):
+        key = tuple(id(skill) for skill in skills)
+        index = self._unregistered.get(key)
+        if index is not None:
+            self._unregistered.move_to_end(key)
+            return index
+        index = MatcherIndex(self.opsdroid)
+        # Built from a tuple the index keeps, so the skills stay alive and
+        # their ids can't be reused by other skills while it is cached.
+        index.build(tuple(skills))
+        self._unregistered[key] = index
+        while len(self._unregistered) > MAX_UNREGISTERED_INDEXES:
+            self._unregistered.popitem(last=False)
+        return index
+
+    def event_matchers(self, event_class):
+        """Return the event type matchers which apply to a class of event.
+
+        Matchers apply to events whose class is exactly the matcher type, or
+        to any subclass of it if the matcher was created with
+        ``include_subclasses``. Entity options still need to be checked
+        against each event.
+
+        Args:
+            event_class (type): The class of the event being parsed.
+
+        Returns:
+            list: `IndexedMatcher` objects in skill registration order.
+
+        Raises:
+            ValueError: If a matcher refers to an event type by a name which
+                is not registered.
+
+        """
+        self._refresh()
+
+        matchers = self._event_classes.get(event_class)
+        if matchers is None:
+            mro = event_class.__mro__
+            matchers = []
+            for matcher in self._matchers.get("event_type", []):
+                event_type = matcher.opts.get("type", None)
+                if not event_type:
+                    continue
+                event_type = resolve_event_type(event_type)
+                if event_type is event_class or (
+                    matcher.opts.get("include_subclasses", False) and event_type in mro
+                ):
+                    matchers.append(matcher)
+            self._event_classes[event_class] = matchers
+        return matchers
@@ -9,6 +9,7 @@ import aiohttp
 from voluptuous import Required
 
 from opsdroid.const import LUISAI_DEFAULT_URL
+from opsdroid.sessions import client_session
 
 _LOGGER = logging.getLogger(__name__)
 CONFIG_SCHEMA = {
@@ -21,10 +22,10 @@ CONFIG_SCHEMA = {
 
 async def call_luisai(message, config):
     """Call the luis.ai api and return the response."""
-    async with aiohttp.ClientSession(trust_env=True) as session:
+    async with client_session() as session:
         headers = {"Content-Type": "application/json"}
         url = LUISAI_DEFAULT_URL
-        resp = await session.get(
+        async with session.get(
             url
             + config["appid"]
             + "?subscription-key="
@@ -35,8 +36,8 @@ async def call_luisai(message, config):
             + "&q="
             + message.text,
             headers=headers,
-        )
-        result = await resp.json()
+        ) as resp:
+            result = await resp.json()
         _LOGGER.debug(_("luis.ai response - %s."), json.dumps(result))
 
         return result
@@ -24,24 +24,22 @@ async def match_format(text, opts):
 async def parse_format(opsdroid, skills, message):
     """Parse a message against all parse_format skills."""
     matched_skills = []
-    for skill in skills:
-        for matcher in skill.matchers:
-            if "parse_format" in matcher:
-                opts = matcher["parse_format"]
-                result = await match_format(message.text, opts)
-                if result:
-                    message.parse_result = result
-                    _LOGGER.debug(result.__dict__)
-                    for group, value in result.named.items():
-                        message.update_entity(group, value, None)
-                    matched_skills.append(
-                        {
-                            "score": await calculate_score(
-                                opts["expression"], opts["score_factor"]
-                            ),
-                            "skill": skill,
-                            "config": skill.config,
-                            "message": message,
-                        }
-                    )
+    for matcher in opsdroid.matcher_index.matchers("parse_format", skills):
+        opts = matcher.opts
+        result = matcher.match(message.text)
+        if result:
+            message.parse_result = result
+            _LOGGER.debug(result.__dict__)
+            for group, value in result.named.items():
+                message.update_entity(group, value, None)
+            matched_skills.append(
+                {
+                    "score": await calculate_score(
+                        opts["expression"], opts["score_factor"]
+                    ),
+                    "skill": matcher.skill,
+                    "config": matcher.skill.config,
+                    "message": message,
+                }
+            )
     return matched_skills
@@ -14,6 +14,7 @@ from opsdroid.const import (
     RASANLU_DEFAULT_MODELS_PATH,
     RASANLU_DEFAULT_TRAIN_MODEL,
 )
+from opsdroid.sessions import client_session
 
 _LOGGER = logging.getLogger(__name__)
 CONFIG_SCHEMA = {
@@ -78,19 +79,19 @@ async def _init_model(config):
 
 async def _get_rasa_nlu_version(config):
     """Get Rasa NLU version data"""
-    async with aiohttp.ClientSession(trust_env=True) as session:
+    async with client_session() as session:
         url = config.get("url", RASANLU_DEFAULT_URL) + "/version"
         try:
-            resp = await session.get(url)
+            async with session.get(url) as resp:
+                if resp.status == 200:
+                    result = await resp.json()
+                    _LOGGER.debug(_("Rasa NLU response - %s."), json.dumps(result))
+                else:
+                    result = await resp.text()
+                    _LOGGER.error(_("Bad Rasa NLU response - %s."), result)
         except aiohttp.client_exceptions.ClientConnectorError:
             _LOGGER.error(_("Unable to connect to Rasa NLU."))
             return None
-        if resp.status == 200:
-            result = await resp.json()
-            _LOGGER.debug(_("Rasa NLU response - %s."), json.dumps(result))
-        else:
-            result = await resp.text()
-            _LOGGER.error(_("Bad Rasa NLU response - %s."), result)
         return result
 
 
@@ -119,7 +120,7 @@ async def rasa_usable(config):
 
 async def _load_model(config):
     """Load model from the filesystem of the Rasa NLU environment"""
-    async with aiohttp.ClientSession(trust_env=True) as session:
+    async with client_session() as session:
         headers = {}
         data = {
             "model_file": "{}/{}".format(
@@ -131,38 +132,34 @@ async def _load_model(config):
         if "token" in config:
             url += "?token={}".format(config["token"])
         try:
-            resp = await session.put(url, data=json.dumps(data), headers=headers)
+            async with session.put(url, data=json.dumps(data), headers=headers) as resp:
+                if resp.status == 204:
+                    try:
+                        result = await resp.json()
+                    except aiohttp.client_exceptions.ContentTypeError:
+                        return {}
+                else:
+                    result = await resp.text()
+                    _LOGGER.error(_("Bad Rasa NLU response - %s."), result)
         except aiohttp.client_exceptions.ClientConnectorError:
             _LOGGER.error(_("Unable to connect to Rasa NLU."))
             return None
-        if resp.status == 204:
-            try:
-                result = await resp.json()
-            except aiohttp.client_exceptions.ContentTypeError:
-                return {}
-        else:
-            result = await resp.text()
-            _LOGGER.error(_("Bad Rasa NLU response - %s."), result)
 
         return result
 
 
 async def _is_model_loaded(config):
     """Check whether the model is loaded in Rasa NLU"""
-    async with aiohttp.ClientSession(trust_env=True) as session:
-        url = config.get("url", RASANLU_DEFAULT_URL) + "/status"
-        if "token" in config:
-            url += "?token={}".format(config["token"])
+    async with client_session() as session:
         try:
-            resp = await session.get(await _build_status_url(config))
+            async with session.get(await _build_status_url(config)) as resp:
+                if resp.status != 200:
+                    return False
+                result = await resp.json()
         except aiohttp.client_exceptions.ClientConnectorError:
             _LOGGER.error(_("Unable to connect to Rasa NLU."))
             return None
-        if resp.status == 200:
-            result = await resp.json()
-            if config["model_filename"] in result["model_file"]:
-                return True
-        return False
+        return config["model_filename"] in result["model_file"]
 
 
 async def train_rasanlu(config, skills):
@@ -183,7 +180,7 @@ async def train_rasanlu(config, skills):
           so we can just load the model without training it again if it wasn't changed
     """
 
-    async with aiohttp.ClientSession(trust_env=True) as session:
+    async with client_session() as session:
         _LOGGER.info(_("Now training the model. This may take a while..."))
 
         url = await _build_training_url(config)
@@ -192,16 +189,17 @@ async def train_rasanlu(config, skills):
 
         try:
             training_start = arrow.now()
-            resp = await session.post(url, data=intents, headers=headers)
-        except aiohttp.client_exceptions.ClientConnectorError:
-            _LOGGER.error(_("Unable to connect to Rasa NLU, training failed."))
-            return False
+            async with session.post(url, data=intents, headers=headers) as resp:
+                trained = (
+                    resp.status == 200
+                    and resp.content_type == "application/x-tar"
+                    and resp.content_disposition.type == "attachment"
+                )
+                if not trained:
+                    _LOGGER.error(_("Bad Rasa NLU response - %s."), await resp.text())
+                    _LOGGER.error(_("Rasa NLU training failed."))
+                    return False
 
-        if resp.status == 200:
-            if (
-                resp.content_type == "application/x-tar"
-                and resp.content_disposition.type == "attachment"
-            ):
                 time_taken = (arrow.now() - training_start).total_seconds()
                 _LOGGER.info(
                     _("Rasa NLU training completed in %s seconds."), int(time_taken)
@@ -222,43 +220,44 @@ async def train_rasanlu(config, skills):
                 except:
                     _LOGGER.error("Cannot save rasa taining model file to {}", model_path)
                 """
+        except aiohttp.client_exceptions.ClientConnectorError:
+            _LOGGER.error(_("Unable to connect to Rasa NLU, training failed."))
+            return False
 
-                await _load_model(config)
-                # Check if the current trained model is loaded
-                if await _is_model_loaded(config):
-                    _LOGGER.info(_("Successfully loaded Rasa NLU model."))
-                else:
-                    _LOGGER.error(_("Failed getting Rasa NLU server status."))
-                    return False
-
-                # Check if we will get a valid response from Rasa
-                await call_rasanlu("", config)
-                return True
-
-        _LOGGER.error(_("Bad Rasa NLU response - %s."), await resp.text())
-        _LOGGER.error(_("Rasa NLU training failed."))
+    await _load_model(config)
+    # Check if the current trained model is loaded
+    if await _is_model_loaded(config):
+        _LOGGER.info(_("Successfully loaded Rasa NLU model."))
+    else:
+        _LOGGER.error(_("Failed getting Rasa NLU server status."))
         return False
 
+    # Check if we will get a valid response from Rasa
+    await call_rasanlu("", config)
+    return True
+
 
 async def call_rasanlu(text, config):
     """Call the Rasa NLU api and return the response."""
-    async with aiohttp.ClientSession(trust_env=True) as session:
+    async with client_session() as session:
         headers = {}
         data = {"text": text}
         url = config.get("url", RASANLU_DEFAULT_URL) + "/model/parse"
         if "token" in config:
             url += "?&token={}".format(config["token"])
         try:
-            resp = await session.post(url, data=json.dumps(data), headers=headers)
+            async with session.post(
+                url, data=json.dumps(data), headers=headers
+            ) as resp:
+                if resp.status == 200:
+                    result = await resp.json()
+                    _LOGGER.debug(_("Rasa NLU response - %s."), json.dumps(result))
+                else:
+                    result = await resp.text()
+                    _LOGGER.error(_("Bad Rasa NLU response - %s."), result)
         except aiohttp.client_exceptions.ClientConnectorError:
             _LOGGER.error(_("Unable to connect to Rasa NLU."))
             return None
-        if resp.status == 200:
-            result = await resp.json()
-            _LOGGER.debug(_("Rasa NLU response - %s."), json.dumps(result))
-        else:
-            result = await resp.text()
-            _LOGGER.error(_("Bad Rasa NLU response - %s."), result)
 
         return result
 
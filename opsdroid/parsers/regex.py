@@ -33,23 +33,21 @@ async def match_regex(text, opts):
 async def parse_regex(opsdroid, skills, message):
     """Parse a message against all regex skills."""
     matched_skills = []
-    for skill in skills:
-        for matcher in skill.matchers:
-            if "regex" in matcher:
-                opts = matcher["regex"]
-                matched_regex = await match_regex(message.text, opts)
-                if matched_regex:
-                    message.regex = matched_regex
-                    for regroup, value in matched_regex.groupdict().items():
-                        message.update_entity(regroup, value, None)
-                    matched_skills.append(
-                        {
-                            "score": await calculate_score(
-                                opts["expression"], opts["score_factor"]
-                            ),
-                            "skill": skill,
-                            "config": skill.config,
-                            "message": message,
-                        }
-                    )
+    for matcher in opsdroid.matcher_index.matchers("regex", skills):
+        opts = matcher.opts
+        matched_regex = matcher.match(message.text)
+        if matched_regex:
+            message.regex = matched_regex
+            for regroup, value in matched_regex.groupdict().items():
+                message.update_entity(regroup, value, None)
+            matched_skills.append(
+                {
+                    "score": await calculate_score(
+                        opts["expression"], opts["score_factor"]
+                    ),
+                    "skill": matcher.skill,
+                    "config": matcher.skill.config,
+                    "message": message,
+                }
+            )
     return matched_skills
@@ -7,6 +7,7 @@ from voluptuous import Required
 
 from opsdroid.const import DEFAULT_LANGUAGE
 from opsdroid.const import SAPCAI_API_ENDPOINT
+from opsdroid.sessions import client_session
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -15,16 +16,16 @@ CONFIG_SCHEMA = {Required("token"): str, "min-score": float}
 
 async def call_sapcai(message, config, lang=DEFAULT_LANGUAGE):
     """Call the SAP Conversational AI api and return the response."""
-    async with aiohttp.ClientSession(trust_env=True) as session:
+    async with client_session() as session:
         payload = {"language": lang, "text": message.text}
         headers = {
             "Authorization": "Token " + config["token"],
             "Content-Type": "application/json",
         }
-        resp = await session.post(
+        async with session.post(
             SAPCAI_API_ENDPOINT, data=json.dumps(payload), headers=headers
-        )
-        result = await resp.json()
+        ) as resp:
+            result = await resp.json()
         _LOGGER.info(_("SAP Conversational AI response - %s."), json.dumps(result))
 
         return result
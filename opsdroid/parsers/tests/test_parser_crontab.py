@@ -0,0 +1,155 @@
+"""Test the opsdroid crontab scheduler."""
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from opsdroid.matchers import match_crontab
+from opsdroid.parsers.crontab import Crontab, CrontabScheduler
+
+pytestmark = pytest.mark.anyio
+
+
+def get_mock_skill(name="crontab", calls=None, delay=0):
+    async def mockedskill(opsdroid, config, message):
+        if calls is not None:
+            calls.append(time.monotonic())
+        await asyncio.sleep(delay)
+
+    mockedskill.config = {"name": name}
+    return mockedskill
+
+
+def timestamp(*args):
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def test_crontab_fields():
+    crontab = Crontab("*/15 9-17 * * mon-fri")
+    assert crontab.seconds == [0]
+    assert crontab.minutes == [0, 15, 30, 45]
+    assert crontab.hours == list(range(9, 18))
+    assert crontab.weekdays == {1, 2, 3, 4, 5}
+
+    assert Crontab("*/10 * * * * *").seconds == [0, 10, 20, 30, 40, 50]
+    assert Crontab("0 0 * * fri-mon").weekdays == {5, 6, 0, 1}
+    assert Crontab("0 0 * * 7").weekdays == {0}
+    assert Crontab("0 0 */10 * *").days == {1, 11, 21, 31}
+
+
+@pytest.mark.parametrize(
+    "expression", ["* * * *", "61 * * * *", "* * * * funday", "*/0 * * * *"]
+)
+def test_crontab_invalid(expression):
+    with pytest.raises(ValueError):
+        Crontab(expression)
+
+
+def test_next_after():
+    crontab = Crontab("30 9 * * *")
+    assert crontab.next_after(datetime(2021, 1, 1, 8, 0)) == datetime(2021, 1, 1, 9, 30)
+    assert crontab.next_after(datetime(2021, 1, 1, 9, 30)) == datetime(
+        2021, 1, 2, 9, 30
+    )
+    assert Crontab("0 0 29 2 *").next_after(datetime(2021, 3, 1)) == datetime(
+        2024, 2, 29
+    )
+    assert Crontab("*/20 * * * * *").next_after(
+        datetime(2021, 1, 1, 23, 59, 45, 500)
+    ) == datetime(2021, 1, 2, 0, 0, 0)
+
+
+def test_next_after_either_day():
+    # The 1st of the month or any Monday, as with pycron.
+    crontab = Crontab("0 0 1 * mon")
+    assert crontab.next_after(datetime(2021, 2, 1)) == datetime(2021, 2, 8)
+    assert crontab.next_after(datetime(2021, 2, 22)) == datetime(2021, 3, 1)
+
+
+def test_next_after_never():
+    with pytest.raises(ValueError):
+        Crontab("0 0 30 2 *").next_after(datetime(2021, 1, 1))
+
+
+async def test_next_fire_timezone(opsdroid):
+    skill = match_crontab("0 9 * * *", timezone="Europe/London")(get_mock_skill())
+    opsdroid.register_skill(skill)
+    scheduler = CrontabScheduler(opsdroid)
+    scheduler.schedule(now=timestamp(2021, 7, 1))
+
+    # 9am in London is 8am UTC during the summer.
+    [(when, _, _)] = scheduler.heap
+    assert when == timestamp(2021, 7, 1, 8)
+
+
+async def test_fire_due_concurrently(opsdroid):
+    calls = []
+    for name in ("first", "second"):
+        opsdroid.register_skill(
+            match_crontab("0 9 * * *")(get_mock_skill(name, calls, delay=0.2))
+        )
+    scheduler = CrontabScheduler(opsdroid)
+    scheduler.schedule(now=timestamp(2021, 7, 1))
+
+    start = time.monotonic()
+    scheduler.fire_due(timestamp(2021, 7, 1, 9))
+    await asyncio.gather(*scheduler.tasks)
+
+    assert len(calls) == 2
+    assert time.monotonic() - start < 0.35
+    assert [when for when, _, _ in scheduler.heap] == [timestamp(2021, 7, 2, 9)] * 2
+
+
+async def test_missed_fire_skipped(opsdroid, caplog):
+    calls = []
+    opsdroid.register_skill(match_crontab("0 9 * * *")(get_mock_skill("daily", calls)))
+    scheduler = CrontabScheduler(opsdroid)
+    scheduler.schedule(now=timestamp(2021, 7, 1))
+
+    scheduler.fire_due(timestamp(2021, 7, 1, 11))
+    await asyncio.gather(*scheduler.tasks)
+
+    assert calls == []
+    assert "Crontab skill 'daily' missed fires" in caplog.text
+    [(when, _, _)] = scheduler.heap
+    assert when == timestamp(2021, 7, 2, 9)
+
+
+async def test_missed_fire_catch_up(opsdroid):
+    calls = []
+    opsdroid.register_skill(
+        match_crontab("0 9 * * *", catch_up=True)(get_mock_skill("daily", calls))
+    )
+    scheduler = CrontabScheduler(opsdroid)
+    scheduler.schedule(now=timestamp(2021, 7, 1))
+
+    scheduler.fire_due(timestamp(2021, 7, 3, 11))
+    await asyncio.gather(*scheduler.tasks)
+
+    # Two days of missed fires are caught up with a single run.
+    assert len(calls) == 1
+
+
+async def test_invalid_crontab_not_scheduled(opsdroid, caplog):
+    opsdroid.register_skill(match_crontab("not a crontab")(get_mock_skill("bad")))
+    opsdroid.register_skill(match_crontab("* * * * *")(get_mock_skill("good")))
+    scheduler = CrontabScheduler(opsdroid)
+    scheduler.schedule()
+
+    assert [entry[0].skill.config["name"] for _, _, entry in scheduler.heap] == ["good"]
+    assert "Unable to schedule crontab 'not a crontab'" in caplog.text
+
+
+async def test_run_every_second(opsdroid):
+    calls = []
+    opsdroid.register_skill(match_crontab("* * * * * *")(get_mock_skill(calls=calls)))
+    scheduler = CrontabScheduler(opsdroid)
+
+    task = asyncio.ensure_future(scheduler.run())
+    await asyncio.sleep(1.2)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert len(calls) >= 1
@@ -0,0 +1,188 @@
+"""Test the opsdroid matcher index."""
+import pytest
+import regex
+
+from opsdroid.constraints import constrain_users
+from opsdroid.events import Event, Image, Message, Reaction
+from opsdroid.matchers import match_always, match_event, match_parse, match_regex
+from opsdroid.parsers.event_type import parse_event_type
+from opsdroid.parsers.regex import parse_regex
+
+pytestmark = pytest.mark.anyio
+
+
+def get_mock_skill():
+    async def mockedskill(opsdroid, config, message):
+        pass
+
+    mockedskill.config = {}
+    return mockedskill
+
+
+async def test_matchers_grouped_by_type(opsdroid):
+    regex_skill = match_regex(r"hello", case_sensitive=False)(get_mock_skill())
+    format_skill = match_parse("hello {name}")(get_mock_skill())
+    always_skill = match_always(get_mock_skill())
+    for skill in (regex_skill, format_skill, always_skill):
+        opsdroid.register_skill(skill)
+
+    index = opsdroid.matcher_index
+    assert [m.skill for m in index.matchers("regex")] == [regex_skill]
+    assert [m.skill for m in index.matchers("parse_format")] == [format_skill]
+    assert [m.skill for m in index.matchers("always")] == [always_skill]
+    assert index.matchers("crontab") == []
+
+    [regex_matcher] = index.matchers("regex")
+    assert regex_matcher.match("HELLO world")
+    [format_matcher] = index.matchers("parse_format")
+    assert format_matcher.match("hello opsdroid").named == {"name": "opsdroid"}
+
+
+async def test_skill_replaced_in_place(opsdroid):
+    opsdroid.register_skill(match_regex(r"hello")(get_mock_skill()))
+    assert opsdroid.matcher_index.matchers("regex")[0].match("hello")
+
+    replacement = match_regex(r"goodbye")(get_mock_skill())
+    opsdroid.skills[0] = replacement
+    [matcher] = opsdroid.matcher_index.matchers("regex")
+    assert matcher.skill is replacement
+    assert matcher.match("goodbye")
+
+    opsdroid.skills = []
+    assert opsdroid.matcher_index.matchers("regex") == []
+
+
+async def test_matching_conditions(opsdroid):
+    for condition in ("match", "search", "fullmatch"):
+        opsdroid.register_skill(
+            match_regex(r"world", matching_condition=condition)(get_mock_skill())
+        )
+    match, search, fullmatch = opsdroid.matcher_index.matchers("regex")
+
+    assert match.match("hello world") is None
+    assert search.match("hello world")
+    assert fullmatch.match("world!") is None
+    assert fullmatch.match("world")
+
+
+async def test_matchers_subset_of_skills(opsdroid):
+    first = match_regex(r"hello")(get_mock_skill())
+    second = match_regex(r"hello")(get_mock_skill())
+    opsdroid.register_skill(first)
+    opsdroid.register_skill(second)
+
+    matchers = opsdroid.matcher_index.matchers("regex", [second])
+    assert [m.skill for m in matchers] == [second]
+
+
+async def test_skills_appended_directly(opsdroid):
+    skill = match_regex(r"hello")(get_mock_skill())
+    assert opsdroid.matcher_index.matchers("regex") == []
+
+    opsdroid.skills.append(skill)
+    assert [m.skill for m in opsdroid.matcher_index.matchers("regex")] == [skill]
+
+
+async def test_unregistered_skills(opsdroid):
+    skill = match_regex(r"hello")(get_mock_skill())
+    matchers = opsdroid.matcher_index.matchers("regex", [skill])
+    assert [m.skill for m in matchers] == [skill]
+
+
+async def test_unregistered_skills_indexed_once(opsdroid, mocker):
+    compile_spy = mocker.spy(regex, "compile")
+    registered = match_regex(r"hi")(get_mock_skill())
+    opsdroid.register_skill(registered)
+    skill = match_regex(r"hello")(get_mock_skill())
+
+    for _ in range(3):
+        matchers = opsdroid.matcher_index.matchers("regex", [registered, skill])
+        assert [m.skill for m in matchers] == [registered, skill]
+    assert compile_spy.call_count == 3
+
+    opsdroid.skills.append(skill)
+    assert [m.skill for m in opsdroid.matcher_index.matchers("regex")] == [
+        registered,
+        skill,
+    ]
+    assert not opsdroid.matcher_index._unregistered
+
+
+async def test_index_cleared_on_unload(opsdroid):
+    opsdroid.register_skill(match_regex(r"hello")(get_mock_skill()))
+    assert opsdroid.matcher_index.matchers("regex")
+
+    await opsdroid.unload()
+    assert opsdroid.matcher_index.matchers("regex") == []
+
+
+async def test_pattern_compiled_once(opsdroid, mocker):
+    compile_spy = mocker.spy(regex, "compile")
+    opsdroid.register_skill(match_regex(r"hello")(get_mock_skill()))
+
+    for _ in range(3):
+        message = Message("hello", "user", "default", None)
+        skills = await parse_regex(opsdroid, opsdroid.skills, message)
+        assert len(skills) == 1
+    assert compile_spy.call_count == 1
+
+
+async def test_event_matchers_by_class(opsdroid):
+    message_skill = match_event(Message)(get_mock_skill())
+    named_skill = match_event("Message")(get_mock_skill())
+    image_skill = match_event(Image)(get_mock_skill())
+    opsdroid.register_skill(message_skill)
+    opsdroid.register_skill(named_skill)
+    opsdroid.register_skill(image_skill)
+
+    index = opsdroid.matcher_index
+    assert [m.skill for m in index.event_matchers(Message)] == [
+        message_skill,
+        named_skill,
+    ]
+    assert [m.skill for m in index.event_matchers(Image)] == [image_skill]
+    assert index.event_matchers(Reaction) == []
+
+
+async def test_event_matchers_include_subclasses(opsdroid):
+    class CustomMessage(Message):
+        pass
+
+    exact_skill = match_event(Message)(get_mock_skill())
+    sub_skill = match_event(Message, include_subclasses=True)(get_mock_skill())
+    event_skill = match_event(Event, include_subclasses=True)(get_mock_skill())
+    for skill in (exact_skill, sub_skill, event_skill):
+        opsdroid.register_skill(skill)
+
+    index = opsdroid.matcher_index
+    assert [m.skill for m in index.event_matchers(CustomMessage)] == [
+        sub_skill,
+        event_skill,
+    ]
+    assert [m.skill for m in index.event_matchers(Message)] == [
+        exact_skill,
+        sub_skill,
+        event_skill,
+    ]
+    assert [m.skill for m in index.event_matchers(Image)] == [event_skill]
+
+
+async def test_event_matchers_refreshed_on_register(opsdroid):
+    first = match_event(Message)(get_mock_skill())
+    opsdroid.register_skill(first)
+    assert len(opsdroid.matcher_index.event_matchers(Message)) == 1
+
+    opsdroid.register_skill(match_event(Message)(get_mock_skill()))
+    assert len(opsdroid.matcher_index.event_matchers(Message)) == 2
+
+
+async def test_parse_event_type_constraint_skips_skill(opsdroid, mocker):
+    opsdroid.run_skill = mocker.AsyncMock()
+    constrained = constrain_users(["alice"])(match_event(Message)(get_mock_skill()))
+    unconstrained = match_event(Message)(get_mock_skill())
+    opsdroid.register_skill(constrained)
+    opsdroid.register_skill(unconstrained)
+
+    await parse_event_type(opsdroid, Message("Hello", user="bob"))
+    opsdroid.run_skill.assert_awaited_once()
+    assert opsdroid.run_skill.call_args[0][0] is unconstrained
@@ -9,6 +9,7 @@ from voluptuous import Required
 
 from opsdroid.const import WITAI_DEFAULT_VERSION
 from opsdroid.const import WITAI_API_ENDPOINT
+from opsdroid.sessions import client_session
 
 _LOGGER = logging.getLogger(__name__)
 CONFIG_SCHEMA = {Required("token"): str, "min-score": float}
@@ -16,14 +17,14 @@ CONFIG_SCHEMA = {Required("token"): str, "min-score": float}
 
 async def call_witai(message, config):
     """Call the wit.ai api and return the response."""
-    async with aiohttp.ClientSession(trust_env=True) as session:
+    async with client_session() as session:
         headers = {"Authorization": "Bearer " + config["token"]}
         payload = {"v": WITAI_DEFAULT_VERSION, "q": message.text}
-        resp = await session.get(
+        async with session.get(
             WITAI_API_ENDPOINT + "v={}&q={}".format(payload["v"], payload["q"]),
             headers=headers,
-        )
-        result = await resp.json()
+        ) as resp:
+            result = await resp.json()
         _LOGGER.info(_("wit.ai response - %s."), json.dumps(result))
         return result
 
@@ -0,0 +1,145 @@
+"""Share pooled HTTP client sessions between connectors, parsers and events.
+
+Opening a new `aiohttp.ClientSession` for each request means every request
+makes a new TCP connection, and a new TLS handshake for https. Instead
+`ClientSessions` keeps one session for each profile of session options for
+as long as opsdroid runs, so connections are kept alive and reused and DNS
+lookups are cached. The sessions are closed when opsdroid stops.
+
+The connection pools are configured with the ``http`` section in the top
+level of ``configuration.yaml``.
+
+"""
+
+import asyncio
+import contextlib
+import logging
+
+import aiohttp
+
+from opsdroid.helper import get_opsdroid
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 100
+DEFAULT_LIMIT_PER_HOST = 0
+DEFAULT_DNS_CACHE_TTL = 300
+DEFAULT_KEEPALIVE_TIMEOUT = 30
+
+
+class ClientSessions:
+    """A registry of shared aiohttp client sessions, one for each profile.
+
+    A profile is the set of options given to `ClientSessions.get`. Code which
+    makes requests through different proxies or with different SSL settings
+    gets different sessions, everything else shares a connection pool.
+
+    Args:
+        config (dict, optional): The ``http`` section of the opsdroid config.
+
+    Attributes:
+        sessions (dict): The event loop and session of each profile.
+
+    """
+
+    def __init__(self, config=None):
+        """Create an empty registry."""
+        self.sessions = {}
+        self.configure(config)
+
+    def configure(self, config=None):
+        """Set the connection pool options from the ``http`` config.
+
+        Sessions which are already open keep their options until they are
+        closed.
+
+        Args:
+            config (dict, optional): The ``http`` section of the opsdroid
+                config.
+
+        """
+        config = config or {}
+        self.limit = config.get("limit", DEFAULT_LIMIT)
+        self.limit_per_host = config.get("limit-per-host", DEFAULT_LIMIT_PER_HOST)
+        self.dns_cache_ttl = config.get("dns-cache-ttl", DEFAULT_DNS_CACHE_TTL)
+        self.keepalive_timeout = config.get(
+            "keepalive-timeout", DEFAULT_KEEPALIVE_TIMEOUT
+        )
+
+    def get(self, trust_env=True, ssl=True, limit=None, limit_per_host=None):
+        """Return the shared session for a profile, opening it if needed.
+
+        Args:
+            trust_env (bool): Whether to use the proxies set by the
+                ``HTTP_PROXY`` and ``HTTPS_PROXY`` environment variables.
+            ssl (ssl.SSLContext or bool): The SSL context to verify
+                connections with, or False to skip verification.
+            limit (int, optional): The most connections to keep open, defaults
+                to the ``limit`` option.
+            limit_per_host (int, optional): The most connections to keep open
+                to each host, defaults to the ``limit-per-host`` option.
+
+        Returns:
+            aiohttp.ClientSession: The session, which must not be closed by
+                the caller.
+
+        """
+        limit = self.limit if limit is None else limit
+        if limit_per_host is None:
+            limit_per_host = self.limit_per_host
+        profile = (trust_env, ssl, limit, limit_per_host)
+        loop = asyncio.get_running_loop()
+        session_loop, session = self.sessions.get(profile, (None, None))
+        # A session can only be used on the event loop it was opened on.
+        if session is None or session.closed or session_loop is not loop:
+            _LOGGER.debug(_("Opening a shared HTTP session for %s."), profile)
+            connector = aiohttp.TCPConnector(
+                limit=limit,
+                limit_per_host=limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+                ssl=ssl,
+            )
+            session = aiohttp.ClientSession(connector=connector, trust_env=trust_env)
+            self.sessions[profile] = (loop, session)
+        return session
+
+    async def close(self):
+        """Close every session opened on the running event loop."""
+        sessions, self.sessions = self.sessions, {}
+        loop = asyncio.get_running_loop()
+        for session_loop, session in sessions.values():
+            if session_loop is loop:
+                await session.close()
+
+
+@contextlib.asynccontextmanager
+async def client_session(opsdroid=None, **profile):
+    """Use a shared session, or a new one when opsdroid isn't running.
+
+    Args:
+        opsdroid (OpsDroid, optional): The opsdroid instance which owns the
+            shared sessions, defaults to the running instance.
+        **profile: The session options, see `ClientSessions.get`.
+
+    Yields:
+        aiohttp.ClientSession: The session to make requests with.
+
+    Example:
+        Calling an API from a connector::
+
+            async with client_session(self.opsdroid) as session:
+                async with session.get(url) as response:
+                    data = await response.json()
+
+    """
+    sessions = getattr(opsdroid or get_opsdroid(), "http", None)
+    if isinstance(sessions, ClientSessions):
+        yield sessions.get(**profile)
+        return
+
+    connector = aiohttp.TCPConnector(ssl=profile.get("ssl", True))
+    async with aiohttp.ClientSession(
+        connector=connector, trust_env=profile.get("trust_env", True)
+    ) as session:
+        yield session
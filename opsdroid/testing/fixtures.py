@@ -93,7 +93,10 @@ async def opsdroid() -> OpsDroid:
     """
     async with anyio.create_task_group():
         with OpsDroid(config={}) as opsdroid:
-            yield opsdroid
+            try:
+                yield opsdroid
+            finally:
+                await opsdroid.http.close()
 
 
 @pytest.fixture
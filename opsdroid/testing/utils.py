@@ -39,7 +39,7 @@ async def run_unit_test(
 
     This method should be used when testing on a loaded but stopped instance of opsdroid.
     The instance will be started concurrently with the test runner. The test runner
-    will block until opsdroid is ready and then the test will be called. Once the test has returned
+    will block until opsdroid and its web server are ready and then the test will be called. Once the test has returned
     opsdroid will be stopped and unloaded.
 
     Args:
@@ -81,9 +81,16 @@ async def run_unit_test(
 
     """
 
+    def is_ready():
+        # opsdroid counts as running before its web server is listening.
+        web_server = opsdroid.web_server
+        return opsdroid.is_running() and (
+            web_server is None or bool(web_server.runner.addresses)
+        )
+
     async def runner():
         start = time.time()
-        while not opsdroid.is_running() and start + start_timeout > time.time():
+        while not is_ready() and start + start_timeout > time.time():
             await asyncio.sleep(0.1)
         result = await test(*args, **kwargs)
         await opsdroid.stop()
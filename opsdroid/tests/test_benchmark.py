@@ -0,0 +1,107 @@
+import asyncio
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from opsdroid import benchmark
+from opsdroid.cli.bench import bench
+
+pytestmark = pytest.mark.anyio
+
+BASELINE = os.path.join(os.path.dirname(__file__), "benchmark_baseline.json")
+
+
+def get_result(**kwargs):
+    values = dict(
+        messages=100, skills=10, duration=1, throughput=100, p50=1, p95=2, p99=3
+    )
+    values.update(kwargs)
+    return benchmark.BenchmarkResult(**values)
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert benchmark.percentile(values, 50) == 50
+    assert benchmark.percentile(values, 99) == 99
+    assert benchmark.percentile([5], 95) == 5
+    assert benchmark.percentile([], 50) == 0
+
+
+def test_make_messages_match_one_skill():
+    assert benchmark.make_messages(4, 2) == [
+        "regex 0 hello",
+        "format 0 hello",
+        "regex 1 hello",
+        "format 1 hello",
+    ]
+    assert len(benchmark.make_skills(20)) == 62
+
+
+def test_compare_to_baseline():
+    baseline = get_result().as_dict()
+    assert benchmark.compare_to_baseline(get_result(p99=3.5), baseline) == []
+
+    regressions = benchmark.compare_to_baseline(
+        get_result(throughput=50, p95=10), baseline
+    )
+    assert len(regressions) == 2
+    assert "throughput" in regressions[0]
+    assert "p95" in regressions[1]
+
+
+def test_save_and_load_baseline(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    benchmark.save_baseline(get_result(), path)
+    assert benchmark.load_baseline(path) == get_result().as_dict()
+
+
+async def test_run_benchmark(opsdroid):
+    result = await benchmark.run_benchmark(opsdroid, messages=50, skills=5)
+
+    assert result.messages == 50
+    assert result.skills == 16
+    assert result.throughput > 0
+    assert 0 < result.p50 <= result.p95 <= result.p99
+
+
+async def test_run_benchmark_with_dispatcher(opsdroid):
+    opsdroid.config["dispatch"] = {"workers": 4}
+    result = await benchmark.run_benchmark(opsdroid, messages=50, rate=1000, skills=5)
+
+    assert result.messages == 50
+    assert not opsdroid.dispatcher.running
+
+
+def test_bench_command(tmp_path):
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    path = str(tmp_path / "baseline.json")
+    runner = CliRunner()
+    result = runner.invoke(
+        bench, ["--messages", "20", "--skills", "2", "--save-baseline", path]
+    )
+    assert result.exit_code == 0
+    assert "throughput" in result.output
+
+    benchmark.save_baseline(get_result(throughput=10**9), path)
+    result = runner.invoke(bench, ["-n", "20", "-s", "2", "--baseline", path])
+    assert result.exit_code == 1
+    assert "Regression: throughput" in result.output
+
+
+@pytest.mark.benchmark
+async def test_benchmark_baseline(opsdroid, request):
+    """Fail if parsing got slower than the stored baseline.
+
+    Regenerate the baseline on the machine which runs the benchmarks with
+    ``pytest --benchmark-save opsdroid/tests/test_benchmark.py``.
+
+    """
+    result = await benchmark.run_benchmark(
+        opsdroid, messages=2000, rate=500, skills=100
+    )
+    if request.config.getoption("--benchmark-save"):
+        benchmark.save_baseline(result, BASELINE)
+        return
+    baseline = benchmark.load_baseline(BASELINE)
+    assert benchmark.compare_to_baseline(result, baseline, tolerance=1) == []
@@ -1,11 +1,15 @@
+import asyncio
+import inspect
 import os
 import signal
 import threading
+import time
 
 import asynctest.mock as amock
 import pytest
 
 from opsdroid.core import OpsDroid
+from opsdroid.events import Message
 
 
 @pytest.mark.skipif(os.name == "nt", reason="SIGHUP unsupported on windows")
@@ -28,3 +32,138 @@ def test_signals(event_loop):
         with pytest.raises(SystemExit):
             opsdroid.run()
         assert opsdroid.reload.called
+
+
+def get_parsers_config(*names, **extra):
+    return {
+        "parsers": [
+            {"config": {"name": name, "enabled": True, **extra.get(name, {})}}
+            for name in names
+        ]
+    }
+
+
+def get_slow_parser(delay, score):
+    async def parser(opsdroid, skills, message, config):
+        await asyncio.sleep(delay)
+        return [{"score": score, "skill": None, "config": {}, "message": message}]
+
+    return parser
+
+
+@pytest.mark.anyio
+async def test_nlu_parsers_run_concurrently(opsdroid, mocker):
+    mocker.patch("opsdroid.core.parse_luisai", get_slow_parser(0.2, 0.5))
+    mocker.patch("opsdroid.core.parse_witai", get_slow_parser(0.2, 0.9))
+    opsdroid.modules = get_parsers_config("luisai", "witai")
+
+    start = time.monotonic()
+    ranked = await opsdroid.get_ranked_skills([], Message("Hello"))
+
+    assert time.monotonic() - start < 0.35
+    assert [skill["score"] for skill in ranked] == [0.9, 0.5]
+
+
+@pytest.mark.anyio
+async def test_nlu_parser_timeout(opsdroid, mocker, caplog):
+    mocker.patch("opsdroid.core.parse_luisai", get_slow_parser(0, 0.5))
+    mocker.patch("opsdroid.core.parse_witai", get_slow_parser(10, 0.9))
+    opsdroid.modules = get_parsers_config("luisai", "witai", witai={"timeout": 0.05})
+
+    ranked = await opsdroid.get_ranked_skills([], Message("Hello"))
+
+    assert [skill["score"] for skill in ranked] == [0.5]
+    assert "Parser witai timed out after 0.05 seconds" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_nlu_parser_exception(opsdroid, mocker, caplog):
+    mocker.patch("opsdroid.core.parse_luisai", get_slow_parser(0, 0.5))
+    mocker.patch(
+        "opsdroid.core.parse_witai", amock.CoroutineMock(side_effect=ValueError)
+    )
+    opsdroid.modules = get_parsers_config("luisai", "witai")
+
+    ranked = await opsdroid.get_ranked_skills([], Message("Hello"))
+
+    assert [skill["score"] for skill in ranked] == [0.5]
+    assert "Exception when running parser witai" in caplog.text
+
+
+def get_sleeping_skill(delay):
+    async def skill(opsdroid, config, message):
+        await asyncio.sleep(delay)
+        return "done"
+
+    return skill
+
+
+@pytest.mark.anyio
+async def test_run_skill_timeout(opsdroid, caplog):
+    message = Message("Hello")
+    message.respond = amock.CoroutineMock()
+    skill = get_sleeping_skill(10)
+
+    await opsdroid.run_skill(skill, {"name": "sleepy", "timeout": 0.05}, message)
+
+    assert opsdroid.stats["skills_timed_out"] == 1
+    assert "Skill 'sleepy' timed out after 0.05 seconds" in caplog.text
+    assert message.respond.call_args_list[0][0][0].text.startswith("Whoops")
+
+
+@pytest.mark.anyio
+async def test_run_skill_global_timeout(opsdroid):
+    opsdroid.config["skill-timeout"] = 0.05
+    message = Message("Hello")
+    message.respond = amock.CoroutineMock()
+
+    await opsdroid.run_skill(get_sleeping_skill(10), {"name": "sleepy"}, message)
+    assert opsdroid.stats["skills_timed_out"] == 1
+
+    # The skill config takes precedence over the global timeout.
+    result = await opsdroid.run_skill(
+        get_sleeping_skill(0.1), {"name": "sleepy", "timeout": 1}, message
+    )
+    assert result == "done"
+    assert opsdroid.stats["skills_timed_out"] == 1
+
+
+@pytest.mark.anyio
+async def test_run_skill_own_timeout_error(opsdroid, caplog):
+    async def skill(message):
+        raise asyncio.TimeoutError
+
+    message = Message("Hello")
+    message.respond = amock.CoroutineMock()
+    await opsdroid.run_skill(skill, {"name": "failing", "timeout": 10}, message)
+
+    assert opsdroid.stats["skills_timed_out"] == 0
+    assert "Exception when running skill 'failing'" in caplog.text
+    assert message.respond.called
+
+
+@pytest.mark.anyio
+async def test_run_skill_cancelled(opsdroid):
+    task = asyncio.ensure_future(
+        opsdroid.run_skill(get_sleeping_skill(10), {"name": "sleepy"}, None)
+    )
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert opsdroid.stats["skills_cancelled"] == 1
+
+
+@pytest.mark.anyio
+async def test_skill_signature_resolved_once(opsdroid, mocker):
+    signature = mocker.spy(inspect, "signature")
+
+    async def skill(message):
+        return message.text
+
+    opsdroid.register_skill(skill, {"name": "echo"})
+    assert opsdroid.skill_signatures[skill] is False
+    for _ in range(3):
+        assert await opsdroid.run_skill(skill, skill.config, Message("Hi")) == "Hi"
+    assert signature.call_count == 1
@@ -0,0 +1,226 @@
+import asyncio
+
+import asynctest.mock as amock
+import pytest
+
+from opsdroid.dispatcher import KeyedSerializer
+from opsdroid.events import Message
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def dispatch_opsdroid(opsdroid):
+    opsdroid.parse_event = amock.CoroutineMock()
+    return opsdroid
+
+
+async def test_parse_inline_without_config(dispatch_opsdroid):
+    opsdroid = dispatch_opsdroid
+    opsdroid.dispatcher.start()
+    assert not opsdroid.dispatcher.running
+
+    await opsdroid.parse(Message("Hello"))
+    assert opsdroid.parse_event.called
+
+
+async def test_parse_queued(dispatch_opsdroid):
+    opsdroid = dispatch_opsdroid
+    opsdroid.config["dispatch"] = {"workers": 2, "queue-size": 5}
+    opsdroid.dispatcher.start()
+    assert opsdroid.dispatcher.running
+    assert len(opsdroid.dispatcher.workers) == 2
+    assert opsdroid.dispatcher.queue.maxsize == 5
+
+    messages = [Message(f"Hello {i}") for i in range(3)]
+    for message in messages:
+        assert await opsdroid.parse(message) == []
+    assert opsdroid.dispatcher.depth == 3
+
+    await opsdroid.dispatcher.queue.join()
+    assert opsdroid.dispatcher.depth == 0
+    assert opsdroid.parse_event.await_count == 3
+    assert opsdroid.dispatcher.stats["submitted"] == 3
+    assert opsdroid.dispatcher.stats["processed"] == 3
+    assert opsdroid.dispatcher.stats["max_wait_time"] > 0
+
+    await opsdroid.dispatcher.stop()
+    assert not opsdroid.dispatcher.running
+    assert all(worker.done() for worker in opsdroid.tasks)
+
+
+async def test_overflow_drop(dispatch_opsdroid, caplog):
+    opsdroid = dispatch_opsdroid
+    opsdroid.config["dispatch"] = {"workers": 0, "queue-size": 1, "overflow": "drop"}
+    opsdroid.dispatcher.start()
+
+    assert await opsdroid.dispatcher.submit(Message("first"))
+    assert not await opsdroid.dispatcher.submit(Message("second"))
+    assert opsdroid.dispatcher.stats["dropped"] == 1
+    assert "Dispatch queue is full" in caplog.text
+    await opsdroid.dispatcher.stop()
+
+
+async def test_overflow_block(dispatch_opsdroid):
+    opsdroid = dispatch_opsdroid
+    opsdroid.config["dispatch"] = {"workers": 0, "queue-size": 1}
+    opsdroid.dispatcher.start()
+
+    await opsdroid.dispatcher.submit(Message("first"))
+    blocked = asyncio.ensure_future(opsdroid.dispatcher.submit(Message("second")))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+
+    opsdroid.dispatcher.queue.get_nowait()
+    assert await asyncio.wait_for(blocked, 1)
+    assert opsdroid.dispatcher.stats["dropped"] == 0
+    await opsdroid.dispatcher.stop()
+
+
+async def test_worker_survives_exception(dispatch_opsdroid, caplog):
+    opsdroid = dispatch_opsdroid
+    opsdroid.parse_event.side_effect = [ValueError, None]
+    opsdroid.config["dispatch"] = {"workers": 1}
+    opsdroid.dispatcher.start()
+
+    await opsdroid.parse(Message("first"))
+    await opsdroid.parse(Message("second"))
+    await opsdroid.dispatcher.queue.join()
+
+    assert opsdroid.parse_event.await_count == 2
+    assert "Exception when parsing event" in caplog.text
+    await opsdroid.dispatcher.stop()
+
+
+def get_recording_parse(log, delay=0.02):
+    async def parse_event(event):
+        log.append(("start", event.target, event.text))
+        await asyncio.sleep(delay)
+        log.append(("end", event.target, event.text))
+
+    return parse_event
+
+
+async def test_conversation_order(opsdroid):
+    log = []
+    opsdroid.parse_event = get_recording_parse(log)
+    opsdroid.config["dispatch"] = {"workers": 4}
+    opsdroid.dispatcher.start()
+
+    for i in range(3):
+        await opsdroid.parse(Message(str(i), target="room-a"))
+        await opsdroid.parse(Message(str(i), target="room-b"))
+    await opsdroid.dispatcher.queue.join()
+
+    for room in ("room-a", "room-b"):
+        room_log = [(step, text) for step, target, text in log if target == room]
+        assert room_log == [
+            ("start", "0"),
+            ("end", "0"),
+            ("start", "1"),
+            ("end", "1"),
+            ("start", "2"),
+            ("end", "2"),
+        ]
+    # Both rooms were parsed at the same time.
+    assert log[:2] == [("start", "room-a", "0"), ("start", "room-b", "0")]
+    assert opsdroid.dispatcher.active_conversations == 0
+    await opsdroid.dispatcher.stop()
+
+
+async def test_unordered(opsdroid):
+    log = []
+    opsdroid.parse_event = get_recording_parse(log)
+    opsdroid.config["dispatch"] = {"workers": 4, "ordered": False}
+    opsdroid.dispatcher.start()
+    assert opsdroid.dispatcher.serializer is None
+
+    for i in range(2):
+        await opsdroid.parse(Message(str(i), target="room-a"))
+    await opsdroid.dispatcher.queue.join()
+
+    assert [step for step, _, _ in log] == ["start", "start", "end", "end"]
+    await opsdroid.dispatcher.stop()
+
+
+async def test_get_key(opsdroid, get_connector):
+    connector = get_connector()
+    connector.name = "shell"
+    message = Message("Hello", user_id="alice", target="room", connector=connector)
+
+    assert opsdroid.dispatcher.get_key(message) == ("shell", "room")
+    opsdroid.config["dispatch"] = {"order-by-user": True}
+    assert opsdroid.dispatcher.get_key(message) == ("shell", "room", "alice")
+
+
+async def test_serializer_limit():
+    serializer = KeyedSerializer(limit=1)
+    release = asyncio.Event()
+    ran = []
+
+    async def call(name):
+        ran.append(name)
+        await release.wait()
+
+    running = asyncio.ensure_future(serializer.run("key", call, "first"))
+    await asyncio.sleep(0)
+    await serializer.run("key", call, "second")
+    assert serializer.waiting == 1
+
+    third = asyncio.ensure_future(serializer.run("key", call, "third"))
+    await asyncio.sleep(0.01)
+    assert not third.done()
+
+    release.set()
+    await asyncio.wait_for(asyncio.gather(running, third), 1)
+    assert ran == ["first", "second", "third"]
+    assert serializer.active_keys == 0
+
+
+async def test_serializer_error_keeps_draining(caplog):
+    serializer = KeyedSerializer()
+    release = asyncio.Event()
+    ran = []
+
+    async def call(name):
+        await release.wait()
+        ran.append(name)
+        if name == "first":
+            raise ValueError
+
+    running = asyncio.ensure_future(serializer.run("key", call, "first"))
+    await asyncio.sleep(0)
+    await serializer.run("key", call, "second")
+
+    release.set()
+    await asyncio.wait_for(running, 1)
+    assert ran == ["first", "second"]
+    assert "Exception in call queued for key." in caplog.text
+    assert serializer.active_keys == 0
+
+
+async def test_serializer_cancel_releases_capacity(caplog):
+    serializer = KeyedSerializer(limit=1)
+    release = asyncio.Event()
+    ran = []
+
+    async def call(name):
+        ran.append(name)
+        await release.wait()
+
+    running = asyncio.ensure_future(serializer.run("key", call, "first"))
+    await asyncio.sleep(0)
+    await serializer.run("key", call, "second")
+    blocked = asyncio.ensure_future(serializer.run("key", call, "third"))
+    await asyncio.sleep(0)
+
+    running.cancel()
+    await asyncio.wait_for(blocked, 1)
+    assert "Dropped 2 calls queued for key." in caplog.text
+    assert serializer.waiting == 0
+    assert serializer.active_keys == 0
+
+    # The capacity of the dropped calls is free again.
+    release.set()
+    await asyncio.wait_for(serializer.run("key", call, "fourth"), 1)
+    assert ran == ["first", "fourth"]
@@ -1,8 +1,15 @@
 import os
 import datetime
+import json
+import sys
 import tempfile
+import time
+
+import pytest
 
 from opsdroid.helper import (
+    CODECS,
+    MSGPACK_MARKER,
     del_rw,
     file_is_ipython_notebook,
     convert_ipynb_to_script,
@@ -13,6 +20,9 @@ from opsdroid.helper import (
     convert_dictionary,
     get_config_option,
     get_parser_config,
+    get_codec,
+    register_json_type,
+    serialize_json_type,
 )
 
 
@@ -206,3 +216,102 @@ class TestJSONDecoder:
         config = get_parser_config("dialogflow", parsers)
 
         assert not config
+
+
+NESTED_DATA = {
+    "text": "hello",
+    "number": 1.5,
+    "nothing": None,
+    "list": [1, {"when": datetime.datetime(2020, 1, 1, 12, 30, 5, 10)}],
+    "date": datetime.date(2020, 1, 1),
+    "time": datetime.time(12, 30),
+    "nested": {"deeper": {"date": datetime.date(2021, 2, 3)}},
+}
+
+
+class TestCodecs:
+    """Test the codecs used to store data in databases."""
+
+    @pytest.mark.parametrize("name", list(CODECS))
+    def test_round_trip(self, name):
+        if name != "json":
+            pytest.importorskip(name)
+        codec = get_codec(name)
+        assert codec.name == name
+        assert codec.decode(codec.encode(NESTED_DATA)) == NESTED_DATA
+        assert codec.decode(codec.encode({"plain": [1, 2]})) == {"plain": [1, 2]}
+
+    @pytest.mark.parametrize("name", list(CODECS))
+    def test_decodes_old_encoder(self, name):
+        """Data written with json.dumps and JSONEncoder still decodes."""
+        if name != "json":
+            pytest.importorskip(name)
+        codec = get_codec(name)
+        old = json.dumps(NESTED_DATA, cls=JSONEncoder)
+        assert codec.decode(old) == NESTED_DATA
+        assert codec.decode(old.encode()) == NESTED_DATA
+
+    def test_json_matches_old_encoder(self):
+        codec = get_codec("json")
+        assert codec.encode(NESTED_DATA) == json.dumps(NESTED_DATA, cls=JSONEncoder)
+
+    @pytest.mark.parametrize("name", ["orjson", "msgpack"])
+    def test_json_decodes_other_codecs(self, name):
+        pytest.importorskip(name)
+        encoded = get_codec(name).encode(NESTED_DATA)
+        assert get_codec("json").decode(encoded) == NESTED_DATA
+
+    def test_msgpack_marker(self):
+        msgpack = pytest.importorskip("msgpack")
+        encoded = get_codec("msgpack").encode({"key": "value"})
+        assert encoded.startswith(MSGPACK_MARKER)
+        assert msgpack.unpackb(encoded[1:]) == {"key": "value"}
+
+    def test_registered_type(self):
+        class Point:
+            def __init__(self, x, y):
+                self.x = x
+                self.y = y
+
+        register_json_type(Point, ["x", "y"], lambda dct: (dct["x"], dct["y"]))
+        try:
+            codec = get_codec("json")
+            assert codec.decode(codec.encode({"point": Point(1, 2)})) == {
+                "point": (1, 2)
+            }
+        finally:
+            del JSONEncoder.serializers[Point]
+            del JSONDecoder.decoders["Point"]
+
+    def test_unregistered_type(self):
+        with pytest.raises(TypeError):
+            serialize_json_type(object())
+
+    def test_not_installed(self, monkeypatch, caplog):
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        assert get_codec("orjson").name == "json"
+        assert "Unable to use the orjson codec" in caplog.text
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("name", list(CODECS) + ["old"])
+    def test_benchmark(self, name, capsys):
+        """Report how quickly each codec round trips a large nested dict."""
+        if name == "old":
+            encode = lambda data: json.dumps(data, cls=JSONEncoder)  # noqa: E731
+            decode = lambda raw: json.loads(raw, object_hook=JSONDecoder())  # noqa
+        else:
+            if name != "json":
+                pytest.importorskip(name)
+            codec = get_codec(name)
+            encode, decode = codec.encode, codec.decode
+        data = {
+            "user{}".format(i): {"name": "user", "scores": list(range(20)), "seen": {}}
+            for i in range(1000)
+        }
+        count = 50
+        start = time.perf_counter()
+        for _round in range(count):
+            decode(encode(data))
+        rate = count / (time.perf_counter() - start)
+        with capsys.disabled():
+            print("\n{} codec: {:.1f} round trips/s".format(name, rate))
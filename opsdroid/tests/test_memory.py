@@ -1,3 +1,6 @@
+import asyncio
+import time
+
 import pytest
 
 from opsdroid.memory import Memory
@@ -46,3 +49,312 @@ async def test_database_callouts(mocker, memory):
     memory.databases[0].reset_mock()
     await memory.delete("test")
     assert memory.databases[0].delete.called
+
+
+@pytest.fixture
+def cached_memory(mocker):
+    mem = Memory({"cache": {"size": 2, "ttl": 60, "exclude": ["shared.*"]}})
+    database = InMemoryDatabase()
+    mocker.spy(database, "get")
+    mem.databases = [database]
+    return mem
+
+
+def test_cache_disabled_by_default():
+    assert Memory().cache is None
+    assert Memory({"cache": {"enabled": False}}).cache is None
+
+
+@pytest.mark.anyio
+async def test_cache_hit(cached_memory):
+    database = cached_memory.databases[0]
+    await cached_memory.put("room", {"lang": "en"})
+
+    assert await cached_memory.get("room") == {"lang": "en"}
+    assert await cached_memory.get("room") == {"lang": "en"}
+    assert database.get.call_count == 1
+    assert cached_memory.cache.stats == {"hits": 1, "misses": 1, "evictions": 0}
+
+
+@pytest.mark.anyio
+async def test_cache_returns_copies(cached_memory):
+    await cached_memory.put("room", {"lang": "en"})
+    (await cached_memory.get("room"))["lang"] = "fr"
+    assert await cached_memory.get("room") == {"lang": "en"}
+
+
+@pytest.mark.anyio
+async def test_cache_invalidated_on_write(cached_memory):
+    database = cached_memory.databases[0]
+    await cached_memory.put("room", "en")
+    await cached_memory.get("room")
+
+    await cached_memory.put("room", "fr")
+    assert await cached_memory.get("room") == "fr"
+    await cached_memory.delete("room")
+    assert await cached_memory.get("room") is None
+    assert database.get.call_count == 3
+
+
+@pytest.mark.anyio
+async def test_cache_lru_eviction(cached_memory):
+    for key in ("a", "b"):
+        await cached_memory.put(key, key)
+        await cached_memory.get(key)
+    await cached_memory.get("a")
+    await cached_memory.get("c")
+
+    assert list(cached_memory.cache.entries) == ["a", "c"]
+    assert cached_memory.cache.stats["evictions"] == 1
+
+
+@pytest.mark.anyio
+async def test_cache_ttl(cached_memory, mocker):
+    database = cached_memory.databases[0]
+    await cached_memory.put("room", "en")
+    await cached_memory.get("room")
+
+    monotonic = mocker.patch("opsdroid.memory.time.monotonic")
+    monotonic.return_value = 10**9
+    await cached_memory.get("room")
+    assert database.get.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_cache_opt_out(cached_memory):
+    database = cached_memory.databases[0]
+    await cached_memory.put("shared.counter", 1)
+    await cached_memory.put("room", "en")
+    for _ in range(2):
+        await cached_memory.get("shared.counter")
+        await cached_memory.get("room", cache=False)
+
+    assert database.get.call_count == 4
+    assert len(cached_memory.cache) == 0
+
+
+@pytest.mark.anyio
+async def test_cache_skips_value_written_during_read(cached_memory):
+    database = cached_memory.databases[0]
+    await database.put("room", "en")
+
+    async def slow_get(key):
+        await cached_memory.put(key, "fr")
+        return "en"
+
+    database.get = slow_get
+    assert await cached_memory.get("room") == "en"
+    assert "room" not in cached_memory.cache.entries
+
+
+class SlowDatabase(InMemoryDatabase):
+    def __init__(self, delay=0.1, fail=False):
+        super().__init__()
+        self.delay = delay
+        self.fail = fail
+
+    async def put(self, key, value):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError
+        await super().put(key, value)
+
+
+@pytest.mark.anyio
+async def test_read_falls_back_on_miss():
+    memory = Memory()
+    primary, secondary = InMemoryDatabase(), InMemoryDatabase()
+    memory.databases = [primary, secondary]
+    await secondary.put("only-secondary", "value")
+    await primary.put("both", "primary")
+    await secondary.put("both", "secondary")
+
+    assert await memory.get("only-secondary") == "value"
+    assert await memory.get("both") == "primary"
+
+
+@pytest.mark.anyio
+async def test_write_all_concurrently():
+    memory = Memory()
+    memory.databases = [SlowDatabase(0.2), SlowDatabase(0.2)]
+
+    start = time.monotonic()
+    await memory.put("key", "value")
+
+    assert time.monotonic() - start < 0.35
+    assert all(database.memory == {"key": "value"} for database in memory.databases)
+
+
+@pytest.mark.anyio
+async def test_write_primary_replicates_in_order():
+    memory = Memory({"write-policy": "primary"})
+    replica = SlowDatabase(0.1)
+    memory.databases = [InMemoryDatabase(), replica]
+
+    await memory.put("key", "first")
+    await memory.put("key", "second")
+    assert memory.databases[0].memory == {"key": "second"}
+    assert replica.memory == {}
+
+    await memory.flush()
+    assert replica.memory == {"key": "second"}
+    assert not memory.pending
+
+
+@pytest.mark.anyio
+async def test_write_primary_replica_error_logged(caplog):
+    memory = Memory({"write-policy": "primary"})
+    memory.databases = [InMemoryDatabase(), SlowDatabase(0, fail=True)]
+
+    await memory.put("key", "value")
+    await memory.flush()
+    assert "Unable to put in secondary database" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_write_fire_and_forget_cancelled_on_flush():
+    memory = Memory({"write-policy": "fire-and-forget"})
+    secondary = SlowDatabase(10)
+    memory.databases = [InMemoryDatabase(), secondary]
+
+    await memory.put("key", "value")
+    await memory.flush()
+    assert memory.databases[0].memory == {"key": "value"}
+    assert secondary.memory == {}
+
+
+@pytest.mark.anyio
+async def test_many(memory):
+    await memory.put_many({"a": 1, "b": 2})
+    assert await memory.get_many(["a", "b", "c"], default=0) == {"a": 1, "b": 2, "c": 0}
+
+    await memory.delete_many(["a"])
+    assert await memory.get_many(["a", "b"]) == {"a": None, "b": 2}
+
+
+@pytest.mark.anyio
+async def test_many_falls_back_on_miss():
+    memory = Memory()
+    primary, secondary = InMemoryDatabase(), InMemoryDatabase()
+    memory.databases = [primary, secondary]
+    await primary.put("a", "primary")
+    await secondary.put_many({"a": "secondary", "b": "secondary"})
+
+    assert await memory.get_many(["a", "b"]) == {"a": "primary", "b": "secondary"}
+
+
+@pytest.mark.anyio
+async def test_many_cached(cached_memory, mocker):
+    database = cached_memory.databases[0]
+    mocker.spy(database, "get_many")
+    await cached_memory.put_many({"a": 1, "shared.b": 2})
+    await cached_memory.get("a")
+
+    assert await cached_memory.get_many(["a", "shared.b"]) == {"a": 1, "shared.b": 2}
+    database.get_many.assert_called_once_with(["shared.b"])
+
+    await cached_memory.put_many({"a": 3})
+    assert await cached_memory.get_many(["a"]) == {"a": 3}
+    await cached_memory.delete_many(["a"])
+    assert await cached_memory.get_many(["a"]) == {"a": None}
+
+
+@pytest.mark.anyio
+async def test_many_primary_replicates_by_key():
+    memory = Memory({"write-policy": "primary"})
+    replica = SlowDatabase(0.05)
+    memory.databases = [InMemoryDatabase(), replica]
+
+    await memory.put_many({"a": 1, "b": 2})
+    await memory.delete("a")
+    await memory.flush()
+    assert replica.memory == {"b": 2}
+
+
+@pytest.mark.anyio
+async def test_scan(memory):
+    await memory.put_many({"user.{}".format(i): i for i in range(25)})
+    await memory.put("room.1", "room")
+
+    keys = [key async for key in memory.scan("user.")]
+    assert sorted(keys) == sorted("user.{}".format(i) for i in range(25))
+    assert [key async for key in memory.scan()] == keys + ["room.1"]
+
+
+@pytest.mark.anyio
+async def test_scan_values_in_pages(memory, mocker):
+    await memory.put_many({"user.{}".format(i): i for i in range(25)})
+    get_many = mocker.spy(memory.databases[0], "get_many")
+
+    items = [item async for item in memory.scan("user.", values=True, page_size=10)]
+
+    assert dict(items) == {"user.{}".format(i): i for i in range(25)}
+    assert [len(call.args[0]) for call in get_many.call_args_list] == [10, 10, 5]
+
+
+@pytest.mark.anyio
+async def test_scan_values_skips_deleted(memory):
+    await memory.put_many({"a": 1, "b": 2})
+
+    items = []
+    async for key, value in memory.scan(values=True, page_size=1):
+        items.append((key, value))
+        await memory.delete("b")
+
+    assert items == [("a", 1)]
+
+
+@pytest.mark.anyio
+async def test_scan_without_databases():
+    assert [key async for key in Memory().scan()] == []
+
+
+@pytest.mark.anyio
+async def test_put_ttl(cached_memory, mocker):
+    now = mocker.patch("time.monotonic", return_value=100)
+    database = cached_memory.databases[0]
+    await cached_memory.put("lookup", "result", ttl=10)
+    await cached_memory.put_many({"a": 1, "b": 2}, ttl=30)
+    assert await cached_memory.get("lookup") == "result"
+    assert await cached_memory.get_many(["a", "b"]) == {"a": 1, "b": 2}
+
+    # The key isn't cached for the cache's ttl of 60 seconds.
+    now.return_value = 120
+    assert await cached_memory.get("lookup") is None
+    assert await cached_memory.get_many(["a", "b"]) == {"a": 1, "b": 2}
+    assert database.get.call_count == 2
+
+    # Putting a key again without a ttl keeps it.
+    await cached_memory.put("lookup", "result")
+    now.return_value = 1000
+    assert await cached_memory.get("lookup") == "result"
+    await database.disconnect()
+
+
+@pytest.mark.anyio
+async def test_put_ttl_replicated():
+    memory = Memory({"write-policy": "primary"})
+    replica = InMemoryDatabase()
+    memory.databases = [InMemoryDatabase(), replica]
+
+    await memory.put_many({"a": 1}, ttl=10)
+    await memory.flush()
+    assert "a" in replica.expiries
+    for database in memory.databases:
+        await database.disconnect()
+
+
+@pytest.mark.anyio
+async def test_put_ttl_not_supported(memory, mocker):
+    database = mocker.AsyncMock(supports_ttl=False)
+    database.name = "custom"
+    memory.databases.append(database)
+
+    with pytest.raises(NotImplementedError, match="custom"):
+        await memory.put("lookup", "result", ttl=10)
+    with pytest.raises(ValueError):
+        await memory.put_many({"lookup": "result"}, ttl=0)
+    assert not database.put.called
+
+    await memory.put("lookup", "result")
+    database.put.assert_called_once_with("lookup", "result")
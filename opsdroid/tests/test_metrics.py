@@ -0,0 +1,97 @@
+import pytest
+
+from opsdroid.events import Message
+from opsdroid.matchers import match_regex
+from opsdroid.metrics import Counter, Gauge, Histogram, Registry
+
+pytestmark = pytest.mark.anyio
+
+
+def test_counter_render():
+    counter = Counter("events_total", "Events.", ("connector",))
+    counter.inc("shell")
+    counter.inc("shell", amount=2)
+    counter.inc('say "hi"\n')
+
+    assert counter.get("shell") == 3
+    assert counter.get("slack") == 0
+    assert counter.render().splitlines() == [
+        "# HELP events_total Events.",
+        "# TYPE events_total counter",
+        'events_total{connector="shell"} 3',
+        'events_total{connector="say \\"hi\\"\\n"} 1',
+    ]
+
+
+def test_counter_wrong_labels():
+    counter = Counter("events_total", "Events.", ("connector", "event_type"))
+    with pytest.raises(ValueError):
+        counter.inc("shell")
+
+
+def test_histogram_render():
+    histogram = Histogram("duration_seconds", "Duration.", ("stage",), (0.1, 1))
+    for value in (0.05, 0.1, 0.5, 5):
+        histogram.observe(value, "regex")
+
+    assert histogram.get("regex").count == 4
+    assert histogram.render().splitlines()[2:] == [
+        'duration_seconds_bucket{stage="regex",le="0.1"} 2',
+        'duration_seconds_bucket{stage="regex",le="1"} 3',
+        'duration_seconds_bucket{stage="regex",le="+Inf"} 4',
+        'duration_seconds_sum{stage="regex"} 5.65',
+        'duration_seconds_count{stage="regex"} 4',
+    ]
+
+
+def test_registry_clear():
+    registry = Registry()
+    counter = registry.counter("calls_total", "Calls.")
+    counter.inc()
+    assert "calls_total 1" in registry.render()
+
+    registry.clear()
+    assert "calls_total 1" not in registry.render()
+
+
+async def test_parse_records_metrics(opsdroid, get_connector):
+    async def skill(opsdroid, config, message):
+        pass
+
+    skill.config = {"name": "greeter"}
+    opsdroid.register_skill(match_regex(r"hello")(skill))
+    connector = get_connector()
+    connector.name = "shell"
+
+    await opsdroid.parse(Message("hello", connector=connector))
+
+    metrics = opsdroid.metrics
+    assert metrics.events_received.get("shell", "Message") == 1
+    assert metrics.parse_duration.get("regex").count == 1
+    assert metrics.parse_duration.get("parse_format").count == 1
+    assert metrics.parse_duration.get("constraints").count == 1
+    assert metrics.skill_duration.get("greeter").count == 1
+    assert metrics.skill_errors.get("greeter") == 0
+
+
+async def test_skill_errors_recorded(opsdroid):
+    async def skill(opsdroid, config, message):
+        raise ValueError
+
+    await opsdroid.run_skill(skill, {"name": "broken"}, None)
+    assert opsdroid.metrics.skill_errors.get("broken") == 1
+    assert opsdroid.metrics.skill_duration.get("broken").count == 1
+
+
+def test_gauge_render():
+    gauge = Gauge("queue_depth", "Depth.", ("connector",))
+    gauge.set(3, "slack")
+    gauge.set(1, "slack")
+
+    assert gauge.get("slack") == 1
+    assert gauge.get("shell") == 0
+    assert gauge.render().splitlines() == [
+        "# HELP queue_depth Depth.",
+        "# TYPE queue_depth gauge",
+        'queue_depth{connector="slack"} 1',
+    ]
@@ -0,0 +1,149 @@
+import datetime
+import ipaddress
+import ssl
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from opsdroid.sessions import ClientSessions, client_session
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def server():
+    async def hello(request):
+        return web.Response(text="hello")
+
+    app = web.Application()
+    app.router.add_get("/", hello)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/"
+    await runner.cleanup()
+
+
+async def test_sessions_shared_by_profile():
+    sessions = ClientSessions({"limit": 10, "limit-per-host": 2})
+    session = sessions.get()
+    try:
+        assert sessions.get() is session
+        assert sessions.get(trust_env=False) is not session
+        assert sessions.get(limit_per_host=5) is not session
+        assert session.connector.limit == 10
+        assert session.connector.limit_per_host == 2
+        assert session.trust_env
+    finally:
+        await sessions.close()
+
+    assert session.closed
+    assert sessions.sessions == {}
+    reopened = sessions.get()
+    assert reopened is not session
+    await sessions.close()
+
+
+async def test_client_session_reuses_connections(opsdroid, server):
+    for _request in range(3):
+        async with client_session(opsdroid) as session:
+            async with session.get(server) as response:
+                assert await response.text() == "hello"
+
+    assert not session.closed
+    assert opsdroid.http.get() is session
+    # Every request went over the same kept alive connection.
+    assert len(session.connector._conns) == 1
+
+
+async def test_client_session_without_opsdroid(server):
+    async with client_session(trust_env=False) as session:
+        async with session.get(server) as response:
+            assert await response.text() == "hello"
+        assert not session.trust_env
+    assert session.closed
+
+
+def make_ssl_contexts(tmp_path):
+    """Return server and client SSL contexts for a self signed certificate."""
+    pytest.importorskip("cryptography")
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.utcnow()
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = tmp_path / "cert.pem", tmp_path / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption(),
+        )
+    )
+    server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_context.load_cert_chain(str(cert_path), str(key_path))
+    return server_context, ssl.create_default_context(cafile=str(cert_path))
+
+
+@pytest.mark.benchmark
+async def test_benchmark_requests(opsdroid, tmp_path, capsys):
+    """Report the latency of https requests with a new or a shared session."""
+    server_context, client_context = make_ssl_contexts(tmp_path)
+
+    async def hello(request):
+        return web.Response(text="hello")
+
+    app = web.Application()
+    app.router.add_get("/", hello)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0, ssl_context=server_context)
+    await site.start()
+    url = "https://127.0.0.1:{}/".format(site._server.sockets[0].getsockname()[1])
+
+    async def new_session():
+        connector = aiohttp.TCPConnector(ssl=client_context)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async with session.get(url) as response:
+                await response.read()
+
+    async def shared_session():
+        async with client_session(opsdroid, ssl=client_context) as session:
+            async with session.get(url) as response:
+                await response.read()
+
+    count = 200
+    try:
+        for name, request in (("new", new_session), ("shared", shared_session)):
+            start = time.perf_counter()
+            for _request in range(count):
+                await request()
+            latency = (time.perf_counter() - start) / count * 1000
+            with capsys.disabled():
+                print("\n{} session: {:.2f} ms per request".format(name, latency))
+    finally:
+        await runner.cleanup()
@@ -0,0 +1,184 @@
+import json
+import sys
+from unittest import mock
+
+import pytest
+
+from opsdroid.connector import Connector, register_event
+from opsdroid.events import Message
+from opsdroid.matchers import match_regex
+from opsdroid.tracing import NOOP_SPAN, Tracer
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingConnector(Connector):
+    def __init__(self, config, opsdroid=None):
+        super().__init__(config, opsdroid=opsdroid)
+        self.name = "recording"
+        self.sent = []
+
+    @register_event(Message)
+    async def send_message(self, message):
+        self.sent.append(message)
+
+
+def enable_tracing(opsdroid, **config):
+    opsdroid.tracer = Tracer({"enabled": True, **config})
+    return opsdroid.tracer
+
+
+def test_disabled_by_default():
+    tracer = Tracer()
+    assert not tracer.enabled
+    assert tracer.span("parse") is NOOP_SPAN
+    assert tracer.start_span("parse") is None
+    with tracer.span("parse") as span:
+        assert span is None
+    assert tracer.memory is None
+
+
+def test_nested_spans():
+    tracer = Tracer({"enabled": True})
+    with tracer.span("outer", connector="shell") as outer:
+        with tracer.span("inner") as inner:
+            assert tracer.current_span() is inner
+        assert tracer.current_span() is outer
+    assert tracer.current_span() is None
+
+    inner_dict, outer_dict = tracer.memory.get_spans()
+    assert inner_dict["parent_id"] == outer.span_id
+    assert inner_dict["trace_id"] == outer_dict["trace_id"]
+    assert outer_dict["parent_id"] is None
+    assert outer_dict["attributes"] == {"connector": "shell"}
+    assert outer_dict["duration"] >= inner_dict["duration"]
+
+
+def test_span_records_error():
+    tracer = Tracer({"enabled": True})
+    with pytest.raises(ValueError):
+        with tracer.span("broken"):
+            raise ValueError("oops")
+
+    [span] = tracer.memory.get_spans()
+    assert span["status"] == "error"
+    assert "oops" in span["error"]
+
+
+def test_ring_buffer_and_filter():
+    tracer = Tracer({"enabled": True, "buffer-size": 2})
+    first = tracer.start_span("first")
+    first.end()
+    first.end()
+    for name in ("second", "third"):
+        tracer.start_span(name).end()
+
+    assert [span["name"] for span in tracer.memory.get_spans()] == ["second", "third"]
+    assert tracer.memory.get_spans(trace_id=first.trace_id) == []
+
+
+def test_jsonl_exporter(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer({"enabled": True, "path": str(path)})
+    tracer.start_span("first").end()
+    tracer.start_span("second").end()
+    tracer.close()
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["first", "second"]
+
+
+def test_opentelemetry_missing(caplog, monkeypatch):
+    monkeypatch.setitem(sys.modules, "opentelemetry", None)
+    tracer = Tracer({"enabled": True, "opentelemetry": True})
+    assert tracer.enabled
+    assert "opentelemetry-api is not installed" in caplog.text
+
+
+def test_opentelemetry_bridge(monkeypatch):
+    otel = mock.MagicMock()
+    monkeypatch.setitem(sys.modules, "opentelemetry", otel)
+    tracer = Tracer({"enabled": True, "opentelemetry": True})
+    otel_tracer = otel.trace.get_tracer.return_value
+
+    with tracer.span("outer") as outer:
+        with pytest.raises(ValueError):
+            with tracer.span("inner", skill="hello"):
+                raise ValueError
+
+    assert [call.args[0] for call in otel_tracer.start_span.call_args_list] == [
+        "outer",
+        "inner",
+    ]
+    otel.trace.set_span_in_context.assert_called_once_with(outer.bridged)
+    inner = otel_tracer.start_span.return_value
+    inner.set_attribute.assert_called_with("skill", "hello")
+    inner.set_status.assert_called_once()
+    assert tracer.spans_by_id == {}
+
+
+async def test_parse_traces_event(opsdroid):
+    tracer = enable_tracing(opsdroid)
+
+    async def skill(opsdroid, config, message):
+        await message.respond("hi")
+
+    skill.config = {"name": "greeter"}
+    opsdroid.register_skill(match_regex(r"hello")(skill))
+    connector = RecordingConnector({}, opsdroid=opsdroid)
+    message = Message("hello", connector=connector)
+
+    await opsdroid.parse(message)
+
+    spans = {span["name"]: span for span in tracer.memory.get_spans()}
+    assert set(spans) >= {
+        "event",
+        "parse",
+        "constraints",
+        "regex",
+        "parse_format",
+        "skill",
+        "respond",
+        "send",
+    }
+    assert len({span["trace_id"] for span in spans.values()}) == 1
+    assert spans["event"]["attributes"] == {
+        "connector": "recording",
+        "event_type": "Message",
+    }
+    assert spans["parse"]["parent_id"] == spans["event"]["span_id"]
+    assert spans["skill"]["parent_id"] == spans["parse"]["span_id"]
+    assert spans["skill"]["attributes"] == {"skill": "greeter"}
+    assert spans["respond"]["parent_id"] == spans["skill"]["span_id"]
+    assert spans["send"]["parent_id"] == spans["respond"]["span_id"]
+    assert message.span.trace_id == spans["event"]["trace_id"]
+    assert len(connector.sent) == 1
+
+
+async def test_skill_error_traced(opsdroid):
+    tracer = enable_tracing(opsdroid)
+
+    async def skill(opsdroid, config, message):
+        raise ValueError
+
+    await opsdroid.run_skill(skill, {"name": "broken"}, None)
+
+    [span] = tracer.memory.get_spans()
+    assert span["name"] == "skill"
+    assert span["status"] == "error"
+
+
+async def test_dispatched_event_traced(opsdroid):
+    opsdroid.config["dispatch"] = {"workers": 1}
+    tracer = enable_tracing(opsdroid)
+    opsdroid.dispatcher.start()
+    try:
+        message = Message("hello", connector=RecordingConnector({}))
+        await opsdroid.parse(message)
+        await opsdroid.dispatcher.queue.join()
+    finally:
+        await opsdroid.dispatcher.stop()
+
+    spans = {span["name"]: span for span in tracer.memory.get_spans()}
+    assert spans["parse"]["parent_id"] == spans["event"]["span_id"]
+    assert "wait_time" in spans["event"]["attributes"]
@@ -7,9 +7,11 @@ from dataclasses import dataclass
 import aiohttp.web
 import asynctest.mock as amock
 import pytest
+from aiohttp.test_utils import make_mocked_request
 from opsdroid import web
 from opsdroid.cli.start import configure_lang
 from opsdroid.testing import MINIMAL_CONFIG, call_endpoint, run_unit_test
+from opsdroid.tracing import Tracer
 
 configure_lang({})
 
@@ -135,6 +137,40 @@ async def test_web_stats_handler(opsdroid):
     assert isinstance(await app.web_stats_handler(None), aiohttp.web.Response)
 
 
+@pytest.mark.anyio
+async def test_web_metrics_handler(opsdroid):
+    """Check the metrics handler."""
+    opsdroid.config["web"] = {}
+    app = web.Web(opsdroid)
+    opsdroid.metrics.webhook_calls.inc("hello", "ping")
+
+    response = await app.web_metrics_handler(None)
+    assert response.content_type == "text/plain"
+    assert b'opsdroid_webhook_calls_total{skill="hello",webhook="ping"} 1' in (
+        response.body
+    )
+
+
+@pytest.mark.anyio
+async def test_web_traces_handler(opsdroid):
+    """Check the traces handler."""
+    opsdroid.config["web"] = {}
+    app = web.Web(opsdroid)
+
+    response = await app.web_traces_handler(make_mocked_request("GET", "/traces"))
+    assert json.loads(response.text) == {"enabled": False, "spans": []}
+
+    opsdroid.tracer = Tracer({"enabled": True})
+    span = opsdroid.tracer.start_span("event")
+    span.end()
+    opsdroid.tracer.start_span("other").end()
+    response = await app.web_traces_handler(
+        make_mocked_request("GET", "/traces?trace_id=" + span.trace_id)
+    )
+    spans = json.loads(response.text)["spans"]
+    assert [span["name"] for span in spans] == ["event"]
+
+
 @pytest.mark.anyio
 async def test_web_start(opsdroid):
     """Check the stats handler."""
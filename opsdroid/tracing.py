@@ -0,0 +1,342 @@
+"""Trace events as they pass through opsdroid.
+
+Tracing is configured with the ``tracing`` section in the top level of
+``configuration.yaml`` and is off by default. When it is on a span is started
+for every event received by `opsdroid.core.OpsDroid.parse` and stored as
+``event.span``. Child spans are recorded for each stage of parsing, for every
+skill which runs and for every response sent, so the time taken to reply to
+an event can be broken down.
+
+Finished spans are kept in a ring buffer which is served by the web server at
+``/traces``, and can also be written to a JSON lines file or passed on to
+OpenTelemetry.
+
+"""
+
+import collections
+import contextvars
+import json
+import logging
+import random
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_SIZE = 1000
+
+_current_span = contextvars.ContextVar("opsdroid_current_span", default=None)
+
+
+class _NoopSpan:
+    """Returned in place of a span when tracing is disabled."""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """A timed operation within a trace.
+
+    Spans are used as context managers, which makes them the current span so
+    spans started inside them become their children, and ends them on exit.
+    They can also be ended explicitly with `Span.end`.
+
+    Args:
+        tracer (Tracer): The tracer which created the span.
+        name (str): The name of the operation.
+        parent (Span, optional): The parent span, a new trace is started if
+            this is None.
+        attributes (dict, optional): Attributes describing the operation.
+
+    """
+
+    __slots__ = (
+        "tracer",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "name",
+        "attributes",
+        "start_time",
+        "duration",
+        "status",
+        "error",
+        "bridged",
+        "_start",
+        "_token",
+    )
+
+    def __init__(self, tracer, name, parent=None, attributes=None):
+        """Start the span."""
+        self.tracer = tracer
+        self.trace_id = parent.trace_id if parent else "%032x" % random.getrandbits(128)
+        self.span_id = "%016x" % random.getrandbits(64)
+        self.parent_id = parent.span_id if parent else None
+        self.name = name
+        self.attributes = attributes or {}
+        self.start_time = time.time()
+        self.duration = None
+        self.status = "ok"
+        self.error = None
+        self.bridged = None
+        self._start = time.perf_counter()
+        self._token = None
+
+    def set_attribute(self, key, value):
+        """Add an attribute to the span."""
+        self.attributes[key] = value
+
+    def record_error(self, error):
+        """Mark the span as failed with an exception."""
+        self.status = "error"
+        self.error = repr(error)
+
+    def end(self):
+        """End the span and export it, ending it more than once does nothing."""
+        if self.duration is not None:
+            return
+        self.duration = time.perf_counter() - self._start
+        self.tracer.export(self)
+
+    def as_dict(self):
+        """Return the span as a dictionary which can be serialized to JSON."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+    def __enter__(self):
+        """Make this the current span."""
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        """End the span, recording the exception if one was raised."""
+        if exc is not None:
+            self.record_error(exc)
+        _current_span.reset(self._token)
+        self.end()
+        return False
+
+
+class MemoryExporter:
+    """Keep the most recent finished spans in a ring buffer.
+
+    Args:
+        size (int): The number of spans to keep.
+
+    """
+
+    def __init__(self, size=DEFAULT_BUFFER_SIZE):
+        """Create the buffer."""
+        self.spans = collections.deque(maxlen=size)
+
+    def on_start(self, span):
+        """Do nothing, spans are only kept once they end."""
+
+    def on_end(self, span):
+        """Add a finished span to the buffer."""
+        self.spans.append(span.as_dict())
+
+    def get_spans(self, trace_id=None):
+        """Return the buffered spans, optionally only those in one trace."""
+        if trace_id is None:
+            return list(self.spans)
+        return [span for span in self.spans if span["trace_id"] == trace_id]
+
+    def close(self):
+        """Clear the buffer."""
+        self.spans.clear()
+
+
+class JsonlExporter:
+    """Append finished spans to a file with one JSON object per line.
+
+    Args:
+        path (str): The file to write to.
+
+    """
+
+    def __init__(self, path):
+        """Open the file."""
+        self.path = path
+        self.file = open(path, "a", encoding="utf-8")  # noqa: SIM115
+
+    def on_start(self, span):
+        """Do nothing, spans are only written once they end."""
+
+    def on_end(self, span):
+        """Write a finished span to the file."""
+        self.file.write(json.dumps(span.as_dict(), default=str) + "\n")
+
+    def close(self):
+        """Flush and close the file."""
+        self.file.close()
+
+
+class OpenTelemetryExporter:
+    """Mirror spans into OpenTelemetry.
+
+    An OpenTelemetry span is started alongside each opsdroid span with the
+    same parent, and ended with its attributes and status when the opsdroid
+    span ends. The OpenTelemetry SDK and exporters are configured as usual,
+    for example with the ``OTEL_*`` environment variables.
+
+    Raises:
+        ImportError: If ``opentelemetry-api`` is not installed.
+
+    """
+
+    def __init__(self):
+        """Get an OpenTelemetry tracer."""
+        # pylint: disable=import-outside-toplevel
+        from opentelemetry import trace
+
+        self.trace = trace
+        self.tracer = trace.get_tracer("opsdroid")
+
+    def on_start(self, span):
+        """Start the matching OpenTelemetry span."""
+        parent = span.tracer.spans_by_id.get(span.parent_id)
+        context = None
+        if parent is not None and parent.bridged is not None:
+            context = self.trace.set_span_in_context(parent.bridged)
+        span.bridged = self.tracer.start_span(
+            span.name, context=context, start_time=int(span.start_time * 1e9)
+        )
+
+    def on_end(self, span):
+        """End the matching OpenTelemetry span."""
+        bridged = span.bridged
+        if bridged is None:
+            return
+        for key, value in span.attributes.items():
+            bridged.set_attribute(key, str(value))
+        if span.status == "error":
+            bridged.set_status(
+                self.trace.Status(self.trace.StatusCode.ERROR, span.error)
+            )
+        bridged.end(end_time=int((span.start_time + span.duration) * 1e9))
+
+    def close(self):
+        """Do nothing, the OpenTelemetry SDK flushes its own exporters."""
+
+
+class Tracer:
+    """Create spans and pass them to the configured exporters.
+
+    Args:
+        config (dict, optional): The ``tracing`` section of the opsdroid
+            config.
+
+    Attributes:
+        enabled (bool): Whether spans are being recorded. When this is False
+            `Tracer.span` returns a shared no-op context manager and
+            `Tracer.start_span` returns None, so tracing costs next to nothing.
+        memory (MemoryExporter): The ring buffer of finished spans, or None
+            when tracing is disabled.
+
+    """
+
+    def __init__(self, config=None):
+        """Create the tracer and its exporters."""
+        config = config or {}
+        self.enabled = bool(config.get("enabled", bool(config)))
+        self.exporters = []
+        self.memory = None
+        self.spans_by_id = {}
+        if not self.enabled:
+            return
+
+        self.memory = MemoryExporter(config.get("buffer-size", DEFAULT_BUFFER_SIZE))
+        self.exporters.append(self.memory)
+        if config.get("path"):
+            self.exporters.append(JsonlExporter(config["path"]))
+        if config.get("opentelemetry", False):
+            try:
+                self.exporters.append(OpenTelemetryExporter())
+            except ImportError:
+                _LOGGER.error(
+                    _(
+                        "Unable to send traces to OpenTelemetry, "
+                        "opentelemetry-api is not installed."
+                    )
+                )
+        self._track_open_spans = any(
+            isinstance(exporter, OpenTelemetryExporter) for exporter in self.exporters
+        )
+
+    @staticmethod
+    def current_span():
+        """Return the span which is currently active, if any."""
+        return _current_span.get()
+
+    def start_span(self, name, parent=None, **attributes):
+        """Start a span without making it the current span.
+
+        Args:
+            name (str): The name of the operation.
+            parent (Span, optional): The parent span, defaults to the current
+                span.
+            **attributes: Attributes describing the operation.
+
+        Returns:
+            Span: The started span, or None if tracing is disabled. It must be
+                ended with `Span.end`.
+
+        """
+        if not self.enabled:
+            return None
+        span = Span(self, name, parent or _current_span.get(), attributes)
+        if self._track_open_spans:
+            self.spans_by_id[span.span_id] = span
+        for exporter in self.exporters:
+            exporter.on_start(span)
+        return span
+
+    def span(self, name, parent=None, **attributes):
+        """Return a context manager which records a span around a block.
+
+        Args:
+            name (str): The name of the operation.
+            parent (Span, optional): The parent span, defaults to the current
+                span.
+            **attributes: Attributes describing the operation.
+
+        Returns:
+            Span: The span to use with ``with``. The target of the ``with`` is
+                None if tracing is disabled.
+
+        """
+        if not self.enabled:
+            return NOOP_SPAN
+        return self.start_span(name, parent, **attributes)
+
+    def export(self, span):
+        """Pass a finished span to the exporters."""
+        self.spans_by_id.pop(span.span_id, None)
+        for exporter in self.exporters:
+            # pylint: disable=broad-except
+            # A broken exporter must not break the event being traced.
+            try:
+                exporter.on_end(span)
+            except Exception:
+                _LOGGER.exception(_("Unable to export span %s."), span.name)
+
+    def close(self):
+        """Close the exporters."""
+        for exporter in self.exporters:
+            exporter.close()
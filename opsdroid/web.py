@@ -14,7 +14,7 @@ from aiohttp.web import HTTPForbidden
 from aiohttp.web_exceptions import HTTPBadRequest
 from aiohttp_middlewares.cors import cors_middleware, DEFAULT_ALLOW_HEADERS
 
-from opsdroid import __version__
+from opsdroid import __version__, metrics
 from opsdroid.const import EXCLUDED_CONFIG_KEYS
 from opsdroid.helper import Timeout
 
@@ -136,6 +136,8 @@ class Web:
             self.web_app.router.add_get("/config/", self.config_handler)
         self.web_app.router.add_get("/stats", self.web_stats_handler)
         self.web_app.router.add_get("/stats/", self.web_stats_handler)
+        self.web_app.router.add_get("/metrics", self.web_metrics_handler)
+        self.web_app.router.add_get("/traces", self.web_traces_handler)
 
     @property
     def get_port(self):
@@ -274,6 +276,7 @@ class Web:
 
             _LOGGER.info(_("Running skill %s via webhook."), webhook)
             opsdroid.stats["webhooks_called"] = opsdroid.stats["webhooks_called"] + 1
+            opsdroid.metrics.webhook_calls.inc(config["name"], webhook)
             resp = await opsdroid.run_skill(skill, config, req)
             if isinstance(resp, web.Response):
                 return resp
@@ -332,6 +335,16 @@ class Web:
             )
         except ZeroDivisionError:
             stats["average_response_time"] = 0
+        cache = self.opsdroid.memory.cache
+        cache_stats = {
+            "enabled": cache is not None,
+            "keys": 0,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+        if cache is not None:
+            cache_stats.update(cache.stats, keys=len(cache))
 
         return self.build_response(
             200,
@@ -344,6 +357,17 @@ class Web:
                     "total_responses": stats["total_responses"],
                     "average_response_time": stats["average_response_time"],
                 },
+                "skills": {
+                    "timed_out": stats["skills_timed_out"],
+                    "cancelled": stats["skills_cancelled"],
+                },
+                "dispatch": {
+                    "running": self.opsdroid.dispatcher.running,
+                    "queue_depth": self.opsdroid.dispatcher.depth,
+                    "active_conversations": self.opsdroid.dispatcher.active_conversations,
+                    **self.opsdroid.dispatcher.stats,
+                },
+                "memory": {"cache": cache_stats},
                 "modules": {
                     "skills": len(self.opsdroid.skills),
                     "connectors": len(self.opsdroid.connectors),
@@ -352,6 +376,39 @@ class Web:
             },
         )
 
+    async def web_metrics_handler(self, request):
+        """Handle metrics request.
+
+        Args:
+            request: web request to render opsdroid metrics
+
+        Returns:
+            aiohttp.web.Response: the metrics in the Prometheus text format
+
+        """
+        return web.Response(
+            body=self.opsdroid.metrics.render().encode("utf-8"),
+            headers={"Content-Type": metrics.CONTENT_TYPE},
+        )
+
+    async def web_traces_handler(self, request):
+        """Handle traces request.
+
+        Args:
+            request: web request to render the most recent tracing spans,
+                optionally filtered with a ``trace_id`` query parameter
+
+        Returns:
+            dict: returns successful status code and the finished spans, or an
+                empty list if tracing is disabled
+
+        """
+        tracer = self.opsdroid.tracer
+        spans = []
+        if tracer.memory is not None:
+            spans = tracer.memory.get_spans(request.query.get("trace_id"))
+        return self.build_response(200, {"enabled": tracer.enabled, "spans": spans})
+
     def get_scrubbed_module_config(self, module_list: Optional[list]) -> dict:
         """Get module config without sensitive keys.
 
@@ -14,6 +14,7 @@ from opsdroid.configuration import (
     load_config_file,
     validate_data_type,
 )
+from opsdroid.configuration.validation import BASE_SCHEMA, validate_configuration
 from opsdroid.helper import del_rw
 
 
@@ -135,3 +136,11 @@ class TestConfiguration(unittest.TestCase):
     def test_validate_data_type(self):
         with self.assertRaises(TypeError):
             validate_data_type("bad config type")
+
+    def test_validate_http_section(self):
+        config = {"http": {"limit": 50, "limit-per-host": 5, "dns-cache-ttl": 10}}
+        self.assertEqual(validate_configuration(config, BASE_SCHEMA), config)
+
+        with mock.patch("sys.exit") as mock_sysexit:
+            validate_configuration({"http": {"limit": "ten"}}, BASE_SCHEMA)
+            self.assertTrue(mock_sysexit.called)
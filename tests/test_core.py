@@ -245,6 +245,7 @@ class TestCoreAsync(asynctest.TestCase):
             opsdroid.web_server = Web(opsdroid)
             opsdroid.web_server.stop = amock.CoroutineMock()
             mock_web_server = opsdroid.web_server
+            session = opsdroid.http.get()
 
             async def task():
                 await asyncio.sleep(0.5)
@@ -258,6 +259,7 @@ class TestCoreAsync(asynctest.TestCase):
             self.assertTrue(mock_connector.disconnect.called)
             self.assertTrue(mock_database.disconnect.called)
             self.assertTrue(mock_web_server.stop.called)
+            self.assertTrue(session.closed)
             self.assertTrue(opsdroid.web_server is None)
             self.assertFalse(opsdroid.connectors)
             self.assertFalse(opsdroid.memory.databases)
@@ -1,3 +1,4 @@
+import json
 from json import JSONEncoder
 
 import nio
@@ -1306,3 +1307,196 @@ async def test_errors(patched_send, opsdroid_matrix, mocker, caplog, patched_uui
     assert ["Error decrypting event enceventid while getting twim: testing(None)"] == [
         rec.message for rec in caplog.records
     ]
+
+
+def sent_requests(patched_send):
+    """Return the method and JSON body of each request sent to the homeserver."""
+    return [
+        (c.args[1], json.loads(c.args[3]) if len(c.args) > 3 else None)
+        for c in patched_send.call_args_list
+    ]
+
+
+def join_room(opsdroid_matrix, mocker):
+    connector = opsdroid_matrix.get_connector("matrix")
+    connector.connection.rooms["!notaroomid"] = mocker.Mock()
+    return connector
+
+
+@pytest.mark.anyio
+async def test_get_cached(patched_send, opsdroid_matrix, mocker):
+    join_room(opsdroid_matrix, mocker)
+    patched_send.return_value = nio.RoomGetStateEventResponse(
+        {"twim": {"hello": "world"}}, "", "", ""
+    )
+
+    db = DatabaseMatrix({"should_encrypt": False}, opsdroid=opsdroid_matrix)
+    db.should_migrate = False
+
+    assert await db.get("twim") == {"hello": "world"}
+    result = await db.get("twim")
+    assert result == {"hello": "world"}
+    result["hello"] = "changed"
+    assert await db.get("twim") == {"hello": "world"}
+    assert patched_send.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_get_not_cached_outside_joined_rooms(patched_send, opsdroid_matrix):
+    patched_send.return_value = nio.RoomGetStateEventResponse(
+        {"twim": {"hello": "world"}}, "", "", ""
+    )
+
+    db = DatabaseMatrix({"should_encrypt": False}, opsdroid=opsdroid_matrix)
+    db.should_migrate = False
+
+    await db.get("twim")
+    await db.get("twim")
+    assert patched_send.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_put_updates_cache(patched_send, opsdroid_matrix, mocker):
+    join_room(opsdroid_matrix, mocker)
+
+    def side_effect(resp, *args, **kwargs):
+        if resp is nio.RoomGetStateEventResponse:
+            return nio.RoomGetStateEventResponse({"twim": 1}, "", "", "")
+        return nio.RoomPutStateResponse("eventid", "!notaroomid")
+
+    patched_send.side_effect = side_effect
+
+    db = DatabaseMatrix({"should_encrypt": False}, opsdroid=opsdroid_matrix)
+    db.should_migrate = False
+
+    await db.put("hello", "world")
+    await db.put("twim", 2)
+    assert await db.get("hello") == "world"
+
+    assert sent_requests(patched_send) == [
+        ("GET", None),
+        ("PUT", {"twim": 1, "hello": "world"}),
+        ("PUT", {"twim": 2, "hello": "world"}),
+    ]
+
+
+@pytest.mark.anyio
+async def test_update_state_from_sync(patched_send, opsdroid_matrix, mocker):
+    join_room(opsdroid_matrix, mocker)
+    db = DatabaseMatrix({"should_encrypt": False}, opsdroid=opsdroid_matrix)
+    db.should_migrate = False
+
+    event = {
+        "type": "dev.opsdroid.database",
+        "state_key": "",
+        "sender": "@someone:localhost",
+        "content": {"twim": "synced"},
+    }
+    db.update_state("!notaroomid", event)
+    db.update_state("!notaroomid", {"type": "m.room.topic", "state_key": ""})
+
+    assert await db.get("twim") == "synced"
+    assert not patched_send.called
+
+    # Opsdroid's own writes are already in the cache.
+    db.update_state(
+        "!notaroomid",
+        {**event, "sender": "@opsdroid:localhost", "content": {"twim": "old"}},
+    )
+    assert await db.get("twim") == "synced"
+
+
+@pytest.mark.anyio
+async def test_write_delay_coalesces(patched_send, opsdroid_matrix, mocker):
+    join_room(opsdroid_matrix, mocker)
+    patched_send.return_value = nio.RoomPutStateResponse("eventid", "!notaroomid")
+
+    db = DatabaseMatrix(
+        {"should_encrypt": False, "write_delay": 0.01}, opsdroid=opsdroid_matrix
+    )
+    db.should_migrate = False
+    db.update_state(
+        "!notaroomid",
+        {
+            "type": "dev.opsdroid.database",
+            "state_key": "",
+            "sender": "@someone:localhost",
+            "content": {"keep": 1, "gone": 2},
+        },
+    )
+
+    for i in range(5):
+        await db.put("key{}".format(i), i)
+    await db.delete("gone")
+    assert await db.get("key4") == 4
+    assert await db.get("gone") is None
+    assert not patched_send.called
+
+    # A change made by someone else while the writes are waiting is kept.
+    db.update_state(
+        "!notaroomid",
+        {
+            "type": "dev.opsdroid.database",
+            "state_key": "",
+            "sender": "@someone:localhost",
+            "content": {"keep": 1, "gone": 2, "other": 3},
+        },
+    )
+
+    await db._flush_task
+    assert sent_requests(patched_send) == [
+        (
+            "PUT",
+            {
+                "keep": 1,
+                "other": 3,
+                "key0": 0,
+                "key1": 1,
+                "key2": 2,
+                "key3": 3,
+                "key4": 4,
+            },
+        )
+    ]
+
+
+@pytest.mark.anyio
+async def test_disconnect_flushes(patched_send, opsdroid_matrix, mocker):
+    patched_send.return_value = nio.RoomGetStateEventResponse({}, "", "", "")
+    db = DatabaseMatrix(
+        {"should_encrypt": False, "write_delay": 60}, opsdroid=opsdroid_matrix
+    )
+    db.should_migrate = False
+    opsdroid_matrix.memory.databases.append(db)
+    connector = opsdroid_matrix.get_connector("matrix")
+    connector.opsdroid = opsdroid_matrix
+    connector.connection.close = AsyncMock()
+
+    await db.put("twim", "hello")
+    patched_send.reset_mock()
+    patched_send.return_value = nio.RoomPutStateResponse("eventid", "!notaroomid")
+    await connector.disconnect()
+
+    assert db._flush_task is None
+    assert sent_requests(patched_send) == [("PUT", {"twim": "hello"})]
+    assert connector.connection.close.called
+
+
+@pytest.mark.anyio
+async def test_flush_error(patched_send, opsdroid_matrix, mocker, caplog):
+    join_room(opsdroid_matrix, mocker)
+    db = DatabaseMatrix(
+        {"should_encrypt": False, "write_delay": 60}, opsdroid=opsdroid_matrix
+    )
+    db.should_migrate = False
+    db.update_state(
+        "!notaroomid",
+        {"type": "dev.opsdroid.database", "state_key": "", "content": {}},
+    )
+    patched_send.side_effect = MatrixException(nio.RoomPutStateError("testing"))
+
+    await db.put("twim", "hello")
+    await db.flush()
+
+    assert "Error writing state key" in caplog.text
+    assert ("!notaroomid", "") not in db._state_cache
@@ -1,4 +1,3 @@
-import asyncio
 import asynctest
 import asynctest.mock as amock
 
@@ -51,8 +50,7 @@ class TestParserLuisai(asynctest.TestCase):
             "entities": [],
         }
         with amock.patch("aiohttp.ClientSession.get") as patched_request:
-            patched_request.return_value = asyncio.Future()
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             await luisai.call_luisai(message, config)
             self.assertTrue(patched_request.called)
 
@@ -1,4 +1,3 @@
-import asyncio
 import asynctest
 import asynctest.mock as amock
 
@@ -65,8 +64,7 @@ class TestParserRasaNLU(asynctest.TestCase):
             "text": "how's the weather outside",
         }
         with amock.patch("aiohttp.ClientSession.post") as patched_request:
-            patched_request.return_value = asyncio.Future()
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             await rasanlu.call_rasanlu(message.text, config)
             self.assertTrue(patched_request.called)
 
@@ -85,8 +83,7 @@ class TestParserRasaNLU(asynctest.TestCase):
         result.text = amock.CoroutineMock()
         result.text.return_value = "unauthorized"
         with amock.patch("aiohttp.ClientSession.post") as patched_request:
-            patched_request.return_value = asyncio.Future()
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             response = await rasanlu.call_rasanlu(message.text, config)
             self.assertTrue(patched_request.called)
             self.assertEqual(response, result.text.return_value)
@@ -552,8 +549,7 @@ class TestParserRasaNLU(asynctest.TestCase):
                 "version": "1.0.0",
                 "minimum_compatible_version": "1.0.0",
             }
-            patched_request.return_value = asyncio.Future()
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             self.assertEqual(
                 await rasanlu._get_rasa_nlu_version({}), result.json.return_value
             )
@@ -561,8 +557,7 @@ class TestParserRasaNLU(asynctest.TestCase):
             patched_request.side_effect = None
             result.status = 500
             result.text.return_value = "Some error happened"
-            patched_request.return_value = asyncio.Future()
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             self.assertEqual(
                 await rasanlu._get_rasa_nlu_version({}), result.text.return_value
             )
@@ -598,8 +593,7 @@ class TestParserRasaNLU(asynctest.TestCase):
             result.json = amock.CoroutineMock()
             patched_request.side_effect = None
             result.json.return_value = {}
-            patched_request.return_value = asyncio.Future()
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             self.assertEqual(
                 await rasanlu._load_model({"model_filename": "model.tar.gz"}), {}
             )
@@ -635,8 +629,7 @@ class TestParserRasaNLU(asynctest.TestCase):
             result.json = amock.CoroutineMock(
                 side_effect=aiohttp.ContentTypeError(None, None)
             )
-            patched_request.return_value = asyncio.Future()
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             patched_request.side_effect = None
             self.assertEqual(
                 await rasanlu._load_model({"model_filename": "model.tar.gz"}), {}
@@ -661,8 +654,7 @@ class TestParserRasaNLU(asynctest.TestCase):
                 "num_active_training_jobs": 2,
             }
             patched_request.side_effect = None
-            patched_request.return_value = asyncio.Future()
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             self.assertEqual(
                 await rasanlu._is_model_loaded({"model_filename": "model.tar.gz"}), True
             )
@@ -719,14 +711,12 @@ class TestParserRasaNLU(asynctest.TestCase):
             self.assertTrue(mock_gai.called)
 
             patched_request.side_effect = None
-            patched_request.return_value = asyncio.Future()
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             self.assertEqual(await rasanlu.train_rasanlu({}, {}), False)
 
             result.json.return_value = {"info": "error"}
-            patched_request.return_value = asyncio.Future()
             patched_request.side_effect = None
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             self.assertEqual(await rasanlu.train_rasanlu({}, {}), False)
 
             # Test Rasa client connection error
@@ -799,14 +789,12 @@ class TestParserRasaNLU(asynctest.TestCase):
             result.json.return_value = "Tar file content..."
 
             patched_request.side_effect = None
-            patched_request.return_value = asyncio.Future()
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             self.assertEqual(await rasanlu.train_rasanlu({}, {}), True)
 
             result.status = 500
             patched_request.side_effect = None
-            patched_request.return_value = asyncio.Future()
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             self.assertEqual(await rasanlu.train_rasanlu({}, {}), False)
 
             config = {
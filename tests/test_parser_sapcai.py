@@ -1,4 +1,3 @@
-import asyncio
 import asynctest
 import asynctest.mock as amock
 
@@ -59,8 +58,7 @@ class TestParserRecastAi(asynctest.TestCase):
         }
 
         with amock.patch("aiohttp.ClientSession.post") as patched_request:
-            patched_request.return_value = asyncio.Future()
-            patched_request.return_value.set_result(result)
+            patched_request.return_value.__aenter__.return_value = result
             await sapcai.call_sapcai(message, config)
             self.assertTrue(patched_request.called)
 